@@ -17,6 +17,8 @@ import app.models.video
 import app.models.ebook
 import app.models.surah
 import app.models.registration
+import app.models.blob
+import app.models.import_job
 # ... add any other model imports here
 
 # this is the Alembic Config object, which provides
@@ -33,6 +35,19 @@ config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
 
 target_metadata = Base.metadata
 
+# DB-maintained objects that are intentionally not mapped on the models
+# (created by hand-written migrations); keep autogenerate from dropping them
+UNMAPPED_OBJECTS = {
+    "search_vector",
+    "ix_videos_search_vector",
+    "ix_videos_title_trgm",
+    "ix_videos_surah_name_trgm",
+    "ix_videos_surah_ayah_range",
+}
+
+def include_object(object, name, type_, reflected, compare_to):
+    return not (reflected and compare_to is None and name in UNMAPPED_OBJECTS)
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = config.get_main_option("sqlalchemy.url")
@@ -56,7 +71,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
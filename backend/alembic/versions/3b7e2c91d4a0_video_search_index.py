@@ -0,0 +1,52 @@
+"""Video full-text search index
+
+Revision ID: 3b7e2c91d4a0
+Revises: f8ceabd66212
+Create Date: 2026-10-18 09:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e2c91d4a0'
+down_revision: Union[str, None] = 'f8ceabd66212'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # Generated column: Postgres keeps it in sync on every INSERT/UPDATE
+    op.execute("""
+        ALTER TABLE videos ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(surah_name, '')), 'B') ||
+            setweight(to_tsvector('simple', coalesce(keywords, '')), 'C')
+        ) STORED
+    """)
+    op.create_index('ix_videos_search_vector', 'videos', ['search_vector'], unique=False, postgresql_using='gin')
+
+    # Trigram indexes for typo-tolerant fallback matching
+    op.create_index('ix_videos_title_trgm', 'videos', ['title'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('ix_videos_surah_name_trgm', 'videos', ['surah_name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'surah_name': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_videos_surah_name_trgm', table_name='videos')
+    op.drop_index('ix_videos_title_trgm', table_name='videos')
+    op.drop_index('ix_videos_search_vector', table_name='videos')
+    op.drop_column('videos', 'search_vector')
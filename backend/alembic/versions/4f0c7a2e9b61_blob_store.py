@@ -0,0 +1,35 @@
+"""Content-addressed blob store
+
+Revision ID: 4f0c7a2e9b61
+Revises: e2a6b4d08f17
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f0c7a2e9b61'
+down_revision: Union[str, None] = 'e2a6b4d08f17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('blobs',
+    sa.Column('path', sa.String(length=500), nullable=False),
+    sa.Column('sha256', sa.String(length=64), nullable=False),
+    sa.Column('size', sa.BigInteger(), nullable=False),
+    sa.Column('refcount', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('path')
+    )
+    op.create_index(op.f('ix_blobs_sha256'), 'blobs', ['sha256'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_blobs_sha256'), table_name='blobs')
+    op.drop_table('blobs')
@@ -0,0 +1,51 @@
+"""Video ayah range indexes
+
+Revision ID: 8d41f0a6c3e5
+Revises: 3b7e2c91d4a0
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41f0a6c3e5'
+down_revision: Union[str, None] = '3b7e2c91d4a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # int4range() rejects lower > upper, so the GiST index below cannot be built
+    # over inverted rows. Those are typos ("7-3" for "3-7"): swap the bounds, then
+    # keep new ones out (app.schemas.video checks the same order).
+    op.execute('UPDATE videos SET starting_ayah = ending_ayah, ending_ayah = starting_ayah '
+               'WHERE ending_ayah < starting_ayah')
+    with op.batch_alter_table('videos') as batch_op:
+        batch_op.create_check_constraint('ck_videos_ayah_order',
+                                         'ending_ayah IS NULL OR ending_ayah >= starting_ayah')
+
+    # B-tree composite: portable fallback for the verse filter
+    op.create_index('ix_videos_surah_ayah', 'videos', ['surah_no', 'starting_ayah', 'ending_ayah'], unique=False)
+
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # btree_gist lets surah_no (plain integer equality) share a GiST index with the range
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    # Expression must match app.utils.verses.ayah_range()
+    op.execute("""
+        CREATE INDEX ix_videos_surah_ayah_range ON videos
+        USING gist (surah_no, int4range(starting_ayah, ending_ayah, '[]'))
+    """)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_videos_surah_ayah_range', table_name='videos')
+    op.drop_index('ix_videos_surah_ayah', table_name='videos')
+    with op.batch_alter_table('videos') as batch_op:
+        batch_op.drop_constraint('ck_videos_ayah_order', type_='check')
@@ -0,0 +1,30 @@
+"""Keyset pagination indexes
+
+Revision ID: c5e93a17b2d8
+Revises: 8d41f0a6c3e5
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e93a17b2d8'
+down_revision: Union[str, None] = '8d41f0a6c3e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_videos_created_date_id', 'videos', ['created_date', 'id'], unique=False)
+    op.create_index('ix_videos_surah_created_date_id', 'videos', ['surah_no', 'created_date', 'id'], unique=False)
+    op.create_index('ix_ebooks_createddate_id', 'ebooks', ['createddate', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ebooks_createddate_id', table_name='ebooks')
+    op.drop_index('ix_videos_surah_created_date_id', table_name='videos')
+    op.drop_index('ix_videos_created_date_id', table_name='videos')
@@ -0,0 +1,36 @@
+"""Registration list indexes
+
+Revision ID: e2a6b4d08f17
+Revises: c5e93a17b2d8
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a6b4d08f17'
+down_revision: Union[str, None] = 'c5e93a17b2d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_class_registrations_registered_at_id', 'class_registrations',
+                    ['registered_at', 'id'], unique=False)
+    op.create_index('ix_class_registrations_status_registered_at_id', 'class_registrations',
+                    ['status', 'registered_at', 'id'], unique=False)
+    op.create_index('ix_class_registrations_language_registered_at_id', 'class_registrations',
+                    ['preferred_language', 'registered_at', 'id'], unique=False)
+    op.create_index('ix_class_registrations_status_language_registered_at_id', 'class_registrations',
+                    ['status', 'preferred_language', 'registered_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_class_registrations_status_language_registered_at_id', table_name='class_registrations')
+    op.drop_index('ix_class_registrations_language_registered_at_id', table_name='class_registrations')
+    op.drop_index('ix_class_registrations_status_registered_at_id', table_name='class_registrations')
+    op.drop_index('ix_class_registrations_registered_at_id', table_name='class_registrations')
@@ -1,30 +1,39 @@
 from fastapi import Depends, HTTPException, status, Cookie
 from fastapi.security import HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-from app.database import get_db
+from app.database import get_db, AsyncSessionLocal
 from app.core.security import decode_token
 from app.models.user import User
+from app.core.user_cache import token_cache, cached_user, remember_payload, remember_user
 
 security = HTTPBearer()
 
 async def get_current_user(
     token: Optional[str] = Cookie(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
-    """Dependency to get current authenticated user"""
+    """Dependency to get current authenticated user (token and user row cached briefly)"""
+    return await authenticate_token(token, db)
+
+async def authenticate_token(token: Optional[str], db: AsyncSession) -> User:
+    """The user behind a session token; raises 401 (also used outside routes, e.g. the profiler)"""
     if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated"
         )
     
-    payload = decode_token(token)
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token"
-        )
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = decode_token(token)
+        if not payload:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token"
+            )
+        remember_payload(token, payload)
     
     email: str = payload.get("sub")
     if email is None:
@@ -33,15 +42,28 @@ async def get_current_user(
             detail="Invalid token payload"
         )
     
-    user = db.query(User).filter(User.email == email).first()
+    user = cached_user(email)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
-        )
+        result = await db.execute(select(User).where(User.email == email))
+        user = result.scalar_one_or_none()
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+        remember_user(user)
     
     return user
 
+async def is_admin_token(token: Optional[str]) -> bool:
+    """Admin check outside the dependency system (middlewares)"""
+    try:
+        async with AsyncSessionLocal() as db:
+            user = await authenticate_token(token, db)
+    except HTTPException:
+        return False
+    return user.role == "admin"
+
 async def get_admin_user(current_user: User = Depends(get_current_user)) -> User:
     """Dependency for admin-only routes"""
     if current_user.role != "admin":
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Cookie, Depends, HTTPException, status, Response, Request
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.models.user import User
 from app.schemas.user import UserLogin, UserResponse, Token
-from app.core.security import verify_password, create_access_token
-from app.api.deps import get_current_user
+from app.core.security import verify_and_update_password, create_access_token, password_hasher
+from app.api.deps import get_current_user, get_admin_user
+from app.core.user_cache import token_cache, auth_cache_stats
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -13,16 +16,26 @@ async def login(
     user_data: UserLogin,
     response: Response,
     request: Request,  # <-- added to access headers/scheme
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Login endpoint"""
-    user = db.query(User).filter(User.email == user_data.email).first()
+    result = await db.execute(select(User).where(User.email == user_data.email))
+    user = result.scalar_one_or_none()
     
-    if not user or not verify_password(user_data.password, user.password_hash):
+    valid, new_hash = (False, None)
+    if user:
+        # bcrypt runs on the hasher's thread pool, not the event loop
+        valid, new_hash = await verify_and_update_password(user_data.password, user.password_hash)
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
         )
+
+    # Stored hash uses an old cost factor: replace it while we have the password
+    if new_hash:
+        user.password_hash = new_hash
+        await db.commit()
     
     access_token = create_access_token(
         data={"sub": user.email, "role": user.role}
@@ -57,8 +70,10 @@ async def login(
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.post("/logout")
-async def logout(response: Response):
+async def logout(response: Response, token: Optional[str] = Cookie(None)):
     """Logout endpoint"""
+    if token:
+        token_cache.pop(token)
     response.delete_cookie(key="token")
     return {"msg": "Logged out successfully"}
 
@@ -66,3 +81,13 @@ async def logout(response: Response):
 async def get_me(current_user: User = Depends(get_current_user)):
     """Get current user info"""
     return current_user
+
+@router.get("/cache-stats")
+async def get_auth_cache_stats(current_user: User = Depends(get_admin_user)):
+    """Hit / miss counters of the get_current_user caches (Admin only)"""
+    return {"code": 200, "msg": "Success", "result": auth_cache_stats()}
+
+@router.get("/hash-stats")
+async def get_password_hash_stats(current_user: User = Depends(get_admin_user)):
+    """Password hasher pool: running / queued work, rejections, timings (Admin only)"""
+    return {"code": 200, "msg": "Success", "result": password_hasher.stats()}
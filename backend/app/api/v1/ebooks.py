@@ -1,86 +1,126 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from app.database import get_db
 from app.models.ebook import EBook
+from app.models.blob import Blob
 from app.schemas.ebook import EBookCreate, EBookUpdate, EBookResponse
+from app.schemas.common import ResponseBase
 from app.api.deps import get_admin_user
 from app.utils.file_upload import save_upload_file
+from app.utils.images import create_cover_derivatives, cover_variant_urls
+from app.utils.blob_store import ebook_blob_paths, register_blob, add_refs, release_refs, remove_blob_files
+from app.utils.pagination import page_size, apply_keyset, keyset_cursor
+from app.utils.search import apply_like_search, search_terms
+from app.utils.conditional import EBOOKS, conditional_get
+from app.utils.responses import cached_json, encode_json, json_response, version_key
+from app.core.invalidation import publish
 import os
 from app.config import settings
 
 router = APIRouter(prefix="/ebooks", tags=["EBooks"])
 
 # 307 FIX: Remove "/" from route decorators
-@router.get("", response_model=List[EBookResponse])
+@router.get("", response_model=ResponseBase[List[EBookResponse]], dependencies=[Depends(conditional_get(EBOOKS))])
 async def get_ebooks(
+    request: Request,
+    response: Response,
     sort: str = "DESC",
     limit: Optional[int] = None,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    search: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get all ebooks"""
-    query = db.query(EBook)
+    """Get ebooks, one page at a time (pass next_cursor back as ?cursor=); search matches title / description"""
+    size = page_size(limit)
+    descending = sort.upper() == "DESC"
+    terms = tuple(search_terms(search or ""))
 
-    if sort.upper() == "DESC":
-        query = query.order_by(EBook.createddate.desc())
-    else:
-        query = query.order_by(EBook.createddate.asc())
+    async def build():
+        query = apply_like_search(select(EBook), terms, (EBook.title, EBook.description))
+        query = apply_keyset(query, EBook.createddate, EBook.id, cursor,
+                             descending, db.bind.dialect.name)
 
-    if limit:
-        query = query.limit(limit)
+        result = await db.execute(query.limit(size + 1))
+        ebooks = result.scalars().all()
 
-    return query.all()
+        next_cursor = None
+        if len(ebooks) > size:
+            ebooks = ebooks[:size]
+            next_cursor = keyset_cursor(ebooks[-1].createddate, ebooks[-1].id)
+
+        page = {"code": 200, "msg": "Success", "result": ebooks, "next_cursor": next_cursor}
+        return encode_json(ResponseBase[List[EBookResponse]], page)
+
+    # Encoded once per data version and page
+    encoded = await cached_json(version_key(EBOOKS, descending, size, cursor, terms), build)
+    return await json_response(request, encoded, response.headers)
 
 @router.post("", response_model=EBookResponse)
 async def create_ebook(
     ebook: EBookCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_admin_user)
 ):
     """Create new ebook (Admin only)"""
     db_ebook = EBook(**ebook.dict())
     db.add(db_ebook)
-    db.commit()
-    db.refresh(db_ebook)
+    await add_refs(db, ebook_blob_paths(db_ebook.filename, db_ebook.cover_image))
+    await db.commit()
+    publish(EBOOKS)
+    await db.refresh(db_ebook)
     return db_ebook
 
 @router.put("/{ebook_id}", response_model=EBookResponse)
 async def update_ebook(
     ebook_id: int,
     ebook_data: EBookUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_admin_user)
 ):
     """Update ebook (Admin only)"""
-    db_ebook = db.query(EBook).filter(EBook.id == ebook_id).first()
+    db_ebook = await db.get(EBook, ebook_id)
     if not db_ebook:
         raise HTTPException(status_code=404, detail="EBook not found")
 
+    old_paths = ebook_blob_paths(db_ebook.filename, db_ebook.cover_image)
     for key, value in ebook_data.dict(exclude_unset=True).items():
         setattr(db_ebook, key, value)
+    new_paths = ebook_blob_paths(db_ebook.filename, db_ebook.cover_image)
+
+    # Move blob references from replaced files to new ones
+    await add_refs(db, [p for p in new_paths if p not in old_paths])
+    orphaned = await release_refs(db, [p for p in old_paths if p not in new_paths])
 
-    db.commit()
-    db.refresh(db_ebook)
+    await db.commit()
+    publish(EBOOKS)
+    remove_blob_files(orphaned)
+    await db.refresh(db_ebook)
     return db_ebook
 
 @router.delete("/{ebook_id}")
 async def delete_ebook(
     ebook_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_admin_user)
 ):
     """Delete ebook (Admin only)"""
-    db_ebook = db.query(EBook).filter(EBook.id == ebook_id).first()
+    db_ebook = await db.get(EBook, ebook_id)
     if not db_ebook:
         raise HTTPException(status_code=404, detail="EBook not found")
 
-    db.delete(db_ebook)
-    db.commit()
+    orphaned = await release_refs(db, ebook_blob_paths(db_ebook.filename, db_ebook.cover_image))
+    await db.delete(db_ebook)
+    await db.commit()
+    publish(EBOOKS)
+    remove_blob_files(orphaned)  # Only once nothing references them any more
     return {"msg": "EBook deleted successfully"}
 
 @router.post("/upload-pdf")
 async def upload_pdf(
     file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_admin_user)
 ):
     """Upload PDF file (Admin only)"""
@@ -88,13 +128,15 @@ async def upload_pdf(
         raise HTTPException(status_code=400, detail="Only PDF files allowed")
 
     upload_dir = os.path.join(settings.UPLOAD_DIR, "pdfs")
-    filename = await save_upload_file(file, upload_dir)
+    saved = await save_upload_file(file, upload_dir, settings.MAX_PDF_UPLOAD_SIZE)
+    await register_blob(db, f"pdfs/{saved.filename}", saved.sha256, saved.size)
 
-    return {"filename": filename}
+    return {"filename": saved.filename}
 
 @router.post("/upload-cover")
 async def upload_cover(
     file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_admin_user)
 ):
     """Upload cover image (Admin only)"""
@@ -102,6 +144,17 @@ async def upload_cover(
         raise HTTPException(status_code=400, detail="Only image files allowed")
 
     upload_dir = os.path.join(settings.UPLOAD_DIR, "coverpages")
-    filename = await save_upload_file(file, upload_dir)
+    saved = await save_upload_file(file, upload_dir, settings.MAX_COVER_UPLOAD_SIZE)
+    path = f"coverpages/{saved.filename}"
+
+    # Responsive WebP derivatives, generated in the image process pool
+    try:
+        await create_cover_derivatives(os.path.join(settings.UPLOAD_DIR, path))
+    except Exception:
+        if await db.get(Blob, path) is None:
+            remove_blob_files([path])  # New, unusable upload
+        raise HTTPException(status_code=400, detail="Could not process image")
+
+    await register_blob(db, path, saved.sha256, saved.size)
 
-    return {"filename": f"/coverpages/{filename}"}
+    return {"filename": f"/{path}", "variants": cover_variant_urls(f"/{path}")}
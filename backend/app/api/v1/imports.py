@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.database import get_db
+from app.models.import_job import ImportJob, ImportRejection
+from app.schemas.import_job import ImportJobResponse, ImportRejectionResponse
+from app.schemas.common import ResponseBase
+from app.api.deps import get_admin_user
+from app.utils.file_upload import save_upload_file
+from app.utils.import_jobs import SHEET_EXTENSIONS, notify_import_workers
+from app.utils.pagination import page_size, encode_cursor, decode_cursor
+from app.config import settings
+
+router = APIRouter(prefix="/library/imports", tags=["Library"])
+
+@router.post("", response_model=ResponseBase[ImportJobResponse])
+async def create_import_job(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_admin_user)
+):
+    """
+    Queue a CSV/Excel video sheet for a background import.
+    Poll GET /library/imports/{id} for progress.
+    """
+    if not (file.filename or "").lower().endswith(SHEET_EXTENSIONS):
+        raise HTTPException(400, "Invalid file format. Please upload CSV or Excel.")
+
+    saved = await save_upload_file(file, settings.IMPORT_DIR, max_size=settings.MAX_IMPORT_UPLOAD_SIZE)
+    job = ImportJob(
+        kind="videos",
+        status="pending",
+        filename=file.filename,
+        source_path=saved.filename,
+        created_by=current_user.username,
+    )
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+    notify_import_workers()
+    return {"code": 200, "msg": "Import queued", "result": job}
+
+@router.get("", response_model=ResponseBase[List[ImportJobResponse]])
+async def get_import_jobs(
+    limit: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_admin_user)
+):
+    """Most recent import jobs first"""
+    result = await db.execute(select(ImportJob).order_by(ImportJob.id.desc()).limit(page_size(limit)))
+    return {"code": 200, "msg": "Success", "result": result.scalars().all()}
+
+@router.get("/{job_id}", response_model=ResponseBase[ImportJobResponse])
+async def get_import_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_admin_user)
+):
+    """Status and progress (percent of the file read, row counters)"""
+    job = await db.get(ImportJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return {"code": 200, "msg": "Success", "result": job}
+
+@router.get("/{job_id}/rejected", response_model=ResponseBase[List[ImportRejectionResponse]])
+async def get_import_rejections(
+    job_id: int,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_admin_user)
+):
+    """Rejected rows with their issues, in sheet order (pass next_cursor back as ?cursor=)"""
+    if await db.get(ImportJob, job_id) is None:
+        raise HTTPException(status_code=404, detail="Import job not found")
+
+    size = page_size(limit)
+    query = select(ImportRejection).where(ImportRejection.job_id == job_id)
+    if cursor:
+        after = decode_cursor(cursor).get("r")
+        if not isinstance(after, int):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.where(ImportRejection.row > after)
+
+    result = await db.execute(query.order_by(ImportRejection.row).limit(size + 1))
+    rows = result.scalars().all()
+
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        next_cursor = encode_cursor({"r": rows[-1].row})
+
+    return {"code": 200, "msg": "Success", "result": rows, "next_cursor": next_cursor}
@@ -0,0 +1,70 @@
+import hmac
+from fastapi import APIRouter, Cookie, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+from typing import Optional
+from app.config import settings
+from app.api.deps import is_admin_token
+from app.core.metrics import registry
+from app.core.compression import compression_metrics
+from app.core.invalidation import bus
+from app.core.security import password_hasher
+from app.core.user_cache import token_cache, user_cache
+from app.utils.responses import response_cache
+from app.api.v1.videos import library_flights
+
+router = APIRouter(tags=["Metrics"])
+
+PROMETHEUS_TEXT = "text/plain; version=0.0.4; charset=utf-8"
+
+def _cache_samples(caches: dict, field: str):
+    return [({"cache": name}, cache.stats()[field]) for name, cache in caches.items()]
+
+def collect_component_stats():
+    """Counters the caches, pools and middlewares keep anyway, read at scrape time"""
+    caches = {"auth_tokens": token_cache, "auth_users": user_cache, "responses": response_cache}
+    yield "app_cache_hits_total", "counter", "Cache hits", _cache_samples(caches, "hits")
+    yield "app_cache_misses_total", "counter", "Cache misses", _cache_samples(caches, "misses")
+    yield "app_cache_entries", "gauge", "Entries held", _cache_samples(caches, "size")
+
+    flights = library_flights.stats()
+    yield "library_requests_total", "counter", "/library requests through the coalescing layer", \
+        [({}, flights["requests"])]
+    yield "library_query_executions_total", "counter", "/library queries actually run", \
+        [({}, flights["executions"])]
+
+    compression = compression_metrics.stats()["encodings"]
+    yield "http_compressed_bytes_in_total", "counter", "Response bytes before compression", \
+        [({"encoding": e}, s["bytes_in"]) for e, s in compression.items()]
+    yield "http_compressed_bytes_out_total", "counter", "Response bytes after compression", \
+        [({"encoding": e}, s["bytes_out"]) for e, s in compression.items()]
+    yield "http_compression_seconds_total", "counter", "Time spent compressing responses", \
+        [({"encoding": e}, compression_metrics.seconds[e]) for e in compression]
+
+    hashing = password_hasher.stats()
+    yield "password_hash_running", "gauge", "bcrypt operations running", [({}, hashing["running"])]
+    yield "password_hash_waiting", "gauge", "bcrypt operations queued", [({}, hashing["waiting"])]
+    yield "password_hash_rejected_total", "counter", "Logins refused with 503 (pool full)", \
+        [({}, hashing["rejected"])]
+
+    invalidation = bus.stats()
+    yield "cache_invalidations_published_total", "counter", "Invalidations published by this process", \
+        [({}, invalidation["published"])]
+    yield "cache_invalidations_received_total", "counter", "Invalidations received from other processes", \
+        [({}, invalidation["received"])]
+
+registry.add_collector(collect_component_stats)
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(authorization: Optional[str] = Header(None), token: Optional[str] = Cookie(None)):
+    """
+    Prometheus scrape endpoint. Scrapers send "Bearer METRICS_TOKEN"; an admin
+    session also works (browser). METRICS_PUBLIC=true drops the check, for
+    deployments where only an internal network can reach the app.
+    """
+    if not settings.METRICS_PUBLIC:
+        expected = f"Bearer {settings.METRICS_TOKEN}"
+        valid_token = bool(settings.METRICS_TOKEN) and \
+            hmac.compare_digest((authorization or "").encode(), expected.encode())
+        if not valid_token and not await is_admin_token(token):
+            raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_TEXT)
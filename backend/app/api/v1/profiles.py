@@ -0,0 +1,27 @@
+import os
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+from app.api.deps import get_admin_user
+from app.core.profiler import ProfileStore
+from app.config import settings
+
+router = APIRouter(prefix="/profiles", tags=["Profiling"])
+
+profile_store = ProfileStore(settings.PROFILE_DIR, settings.PROFILE_MAX_FILES)
+
+@router.get("")
+async def get_profiles(current_user = Depends(get_admin_user)):
+    """
+    Captured request profiles, newest first (Admin only).
+    Capture one by repeating a request with "X-Profile: 1" (sampled stacks)
+    or "X-Profile: cprofile"; the response header X-Profile-Id names it.
+    """
+    return {"code": 200, "msg": "Success", "result": profile_store.list()}
+
+@router.get("/{profile_id}")
+async def download_profile(profile_id: str, current_user = Depends(get_admin_user)):
+    """.folded: flamegraph.pl / speedscope; .prof: snakeviz / pstats (Admin only)"""
+    path = profile_store.path(profile_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="application/octet-stream", filename=os.path.basename(path))
@@ -1,18 +1,27 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from app.database import get_db
 from app.models.registration import ClassRegistration
 from app.schemas.registration import RegistrationCreate, RegistrationResponse, RegistrationUpdate
 from app.schemas.common import ResponseBase
 from app.api.deps import get_admin_user
+from app.config import settings
+from app.utils.pagination import page_size, apply_keyset, keyset_cursor, estimate_count, CountCache
 
 router = APIRouter(prefix="/class-registration", tags=["Registrations"])
 
+REGISTRATIONS_TOPIC = "registrations"
+
+# Exact totals per (status, language) filter; dropped in every process whenever a registration changes
+registration_counts = CountCache(REGISTRATIONS_TOPIC, ttl=settings.REGISTRATION_COUNT_TTL,
+                                 maxsize=settings.REGISTRATION_COUNT_CACHE_SIZE)
+
 @router.post("", response_model=ResponseBase[RegistrationResponse])  # Remove slash for 307 fix
 async def create_registration(
     reg_data: RegistrationCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     # 1. Combine extra info into notes for DB storage
     combined_notes = (
@@ -35,8 +44,9 @@ async def create_registration(
     )
 
     db.add(new_reg)
-    db.commit()
-    db.refresh(new_reg)
+    await db.commit()
+    await db.refresh(new_reg)
+    registration_counts.invalidate()
 
     # 3. Construct Response (Map DB/Input -> Frontend Schema)
     # This fixes the ResponseValidationError
@@ -67,23 +77,37 @@ async def create_registration(
 async def get_registrations(
     status: Optional[str] = None,
     language: Optional[str] = None,
-    page: int = 1,
+    cursor: Optional[str] = None,
     perPage: int = 20,
-    db: Session = Depends(get_db),
+    withTotal: Optional[str] = None,  # "exact" (cached COUNT) or "estimate" (planner)
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_admin_user)
 ):
-    query = db.query(ClassRegistration)
+    query = select(ClassRegistration)
 
     if status and status != 'all':
-        query = query.filter(ClassRegistration.status == status)
+        query = query.where(ClassRegistration.status == status)
     if language and language != 'all':
-        query = query.filter(ClassRegistration.preferred_language == language)
-        
-    total = query.count()
-    registrations_db = query.order_by(ClassRegistration.registered_at.desc())\
-                            .offset((page - 1) * perPage)\
-                            .limit(perPage)\
-                            .all()
+        query = query.where(ClassRegistration.preferred_language == language)
+
+    # Totals are opt-in; they are the only part that grows with the table
+    total = None
+    if withTotal == "estimate" and db.bind.dialect.name == "postgresql":
+        total = await estimate_count(db, query)
+    elif withTotal:
+        total = await registration_counts.get(db, (status, language), query)
+
+    # Keyset on (registered_at, id): deep pages cost the same as page 1
+    size = page_size(perPage)
+    query = apply_keyset(query, ClassRegistration.registered_at, ClassRegistration.id,
+                         cursor, True, db.bind.dialect.name)
+    result = await db.execute(query.limit(size + 1))
+    registrations_db = result.scalars().all()
+
+    next_cursor = None
+    if len(registrations_db) > size:
+        registrations_db = registrations_db[:size]
+        next_cursor = keyset_cursor(registrations_db[-1].registered_at, registrations_db[-1].id)
 
     # Manual Mapping: DB Object -> Response Schema
     mapped_registrations = []
@@ -106,22 +130,29 @@ async def get_registrations(
             "registered_at": reg.registered_at
         })
 
-    return {"code": 200, "msg": "Success", "result": mapped_registrations}
+    return {
+        "code": 200,
+        "msg": "Success",
+        "result": mapped_registrations,
+        "next_cursor": next_cursor,
+        "total": total
+    }
 
 @router.put("/{reg_id}", response_model=ResponseBase[RegistrationResponse])
 async def update_status(
     reg_id: int,
     update_data: RegistrationUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_admin_user)
 ):
-    reg = db.query(ClassRegistration).filter(ClassRegistration.id == reg_id).first()
+    reg = await db.get(ClassRegistration, reg_id)
     if not reg:
         raise HTTPException(status_code=404, detail="Registration not found")
     
     reg.status = update_data.status
-    db.commit()
-    db.refresh(reg)
+    await db.commit()
+    await db.refresh(reg)
+    registration_counts.invalidate()
 
     # Manual Mapping: DB Object -> Response Schema
     response_data = {
@@ -1,44 +1,58 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from app.database import get_db
 from app.models.surah import Surah
 from app.schemas.surah import SurahResponse, SurahCreate
 from app.schemas.common import ResponseBase
 from app.api.deps import get_admin_user  # Import admin security
+from app.utils.conditional import SURAH, LIBRARY, conditional_get
+from app.utils.responses import cached_json, encode_json, json_response, version_key
+from app.core.invalidation import publish
+from app.core.surah_catalog import SurahEntry, get_surah_catalog, swap_surah_catalog
 
 router = APIRouter(prefix="/surah", tags=["Surah"])
 
-@router.get("", response_model=ResponseBase[List[SurahResponse]])
-async def get_all_surahs(db: Session = Depends(get_db)):
-    surahs = db.query(Surah).order_by(Surah.id.asc()).all()
-    return {"code": 200, "msg": "Success", "result": surahs}
+@router.get("", response_model=ResponseBase[List[SurahResponse]], dependencies=[Depends(conditional_get(SURAH))])
+async def get_all_surahs(request: Request, response: Response, db: AsyncSession = Depends(get_db)):
+    # Served from the in-memory snapshot (ordered by id), not the table,
+    # and encoded once per catalog version
+    async def build():
+        catalog = await get_surah_catalog(db)
+        return encode_json(ResponseBase[List[SurahResponse]], {"code": 200, "msg": "Success", "result": catalog.entries})
+
+    return await json_response(request, await cached_json(version_key(SURAH), build), response.headers)
 
 # NEW: Create Surah Endpoint
 @router.post("", response_model=ResponseBase[SurahResponse])
 async def create_surah(
     surah: SurahCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_admin_user)
 ):
-    if db.query(Surah).filter(Surah.id == surah.id).first():
+    if await db.get(Surah, surah.id):
         raise HTTPException(status_code=400, detail=f"Surah with ID {surah.id} already exists")
     db_surah = Surah(**surah.dict())
     db.add(db_surah)
-    db.commit()
-    db.refresh(db_surah)
+    await db.commit()
+    await db.refresh(db_surah)
+    swap_surah_catalog((await get_surah_catalog(db)).with_surah(SurahEntry.from_model(db_surah)))
+    publish(SURAH)
     return {"code": 200, "msg": "Surah added successfully", "result": db_surah}
 
 # NEW: Delete Surah Endpoint
 @router.delete("/{surah_id}")
 async def delete_surah(
     surah_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_admin_user)
 ):
-    surah = db.query(Surah).filter(Surah.id == surah_id).first()
+    surah = await db.get(Surah, surah_id)
     if not surah:
         raise HTTPException(status_code=404, detail="Surah not found")
-    db.delete(surah)
-    db.commit()
+    await db.delete(surah)
+    await db.commit()
+    swap_surah_catalog((await get_surah_catalog(db)).without_surah(surah_id))
+    publish(SURAH)
+    publish(LIBRARY)  # Videos reference the surah
     return {"code": 200, "msg": "Surah deleted"}
\ No newline at end of file
@@ -1,138 +1,196 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, and_
-from typing import Optional, List
-from app.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, List, Mapping
+from app.database import get_db, AsyncSessionLocal
 from app.models.video import Video
-from app.models.surah import Surah
 from app.schemas.video import VideoResponse, VideoCreate, VideoUpdate
 from app.schemas.common import ResponseBase
 from app.api.deps import get_admin_user
+from app.core.surah_catalog import get_surah_catalog
+from app.utils.search import apply_video_search
+from app.utils.verses import apply_verse_filter
+from app.utils.lazy_import import load_module
+from app.utils.bulk_insert import bulk_insert
+from app.utils.pagination import page_size, apply_keyset, apply_offset, encode_cursor, keyset_cursor
+from app.utils.conditional import LIBRARY, conditional_get
+from app.utils.responses import EncodedJSON, cached_json, encode_json, json_response, version_key
+from app.utils.singleflight import SingleFlight
+from app.core.invalidation import publish
+from app.config import settings
 
-import pandas as pd
 import io
-import re
 
 router = APIRouter(prefix="/library", tags=["Library"])
 
-def extract_youtube_id(url: str) -> str | None:
-    if not isinstance(url, str):
-        return None
-    match = re.search(r'(?:v=|\/)([0-9A-Za-z_-]{11}).*', url)
-    if match:
-        return match.group(1)
-    match = re.search(r'(?:embed\/|v\/|youtu.be\/)([0-9A-Za-z_-]{11})', url)
-    return match.group(1) if match else None
+LibraryPage = ResponseBase[List[VideoResponse]]
+
+# Identical concurrent /library queries share one DB query and one encoded body
+library_flights = SingleFlight(ttl=settings.LIBRARY_COALESCE_TTL)
 
 @router.post("", response_model=ResponseBase[List[VideoResponse]])  # <-- No trailing slash
 async def get_library_videos(
+    request: Request,
     payload: dict, # Using dict to accept the flexible search filters from frontend
-    db: Session = Depends(get_db)
 ):
     """
     Filters videos by surah, verse (ayah), search term, sort, etc.
     Replicates the logic from Next.js api/library/route.ts
+    Paged: pass the returned next_cursor back as "cursor" for the next page.
+    """
+    return await library_response(request, payload)
+
+@router.get("", response_model=ResponseBase[List[VideoResponse]], dependencies=[Depends(conditional_get(LIBRARY))])
+async def get_library_videos_cached(
+    request: Request,
+    response: Response,
+    surah: Optional[int] = None,
+    versus: Optional[str] = None,
+    search: Optional[str] = None,
+    sort: str = "DESC",
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+):
+    """Same filters as POST /library as query parameters; supports ETag / 304"""
+    filters = {"surah": surah, "versus": versus, "search": search, "sort": sort, "limit": limit, "cursor": cursor}
+    # Returning a Response skips the headers set by conditional_get: pass them on
+    return await library_response(request, filters, headers=response.headers)
+
+@router.get("/coalesce-stats")
+async def get_library_coalesce_stats(current_user = Depends(get_admin_user)):
+    """How many /library requests shared another request's query (Admin only)"""
+    return {"code": 200, "msg": "Success", "result": library_flights.stats()}
+
+def library_filters_key(payload: dict) -> tuple:
+    """The filters exactly as library_page interprets them (other payload keys are ignored)"""
+    surah = payload.get("surah") or None
+    try:
+        surah = int(surah) if surah is not None else None
+    except (TypeError, ValueError):
+        surah = repr(surah)
+    versus = payload.get("versus")
+    search = payload.get("search")
+    descending = str(payload.get("sort") or "DESC").upper() != "ASC"
+    return (
+        surah,
+        str(versus) if versus else None,
+        str(search) if search else None,
+        descending,
+        page_size(payload.get("limit")),
+        payload.get("cursor") or None,
+    )
+
+async def library_response(request: Request, payload: dict,
+                           headers: Optional[Mapping[str, str]] = None) -> Response:
+    """
+    Serves the encoded page for these filters from the response cache, or
+    runs (joins) the query. Keys include the library version, so a write
+    never serves or joins readers onto a result from before it.
     """
+    key = version_key(LIBRARY, *library_filters_key(payload))
+
+    async def run() -> EncodedJSON:
+        # Own session: the shared task may outlive the request that started it
+        async with AsyncSessionLocal() as db:
+            page = await library_page(payload, db)
+        return encode_json(LibraryPage, page)
+
+    build = (lambda: library_flights.do(key, run)) if settings.LIBRARY_COALESCE else run
+    return await json_response(request, await cached_json(key, build), headers)
+
+async def library_page(payload: dict, db: AsyncSession) -> dict:
+    """One page of /library results for the given filters (shared by GET and POST)"""
     surah = payload.get("surah")
     versus = payload.get("versus")
     search = payload.get("search")
-    sort = payload.get("sort", "DESC")
+    sort = payload.get("sort") or "DESC"
     limit = payload.get("limit")
+    cursor = payload.get("cursor")
 
-    query = db.query(Video)
+    query = select(Video)
 
     # 1. Surah Filter
     if surah:
-        query = query.filter(Video.surah_no == int(surah))
+        query = query.where(Video.surah_no == int(surah))
 
-    # 2. Verse Filter (Complex Logic)
-    # Logic: Match videos where the requested verse falls within starting_ayah and ending_ayah
+    # 2. Verse Filter
+    # Logic: Match videos where the requested verse falls within starting_ayah and ending_ayah,
+    # or (for "1-5") videos that lie entirely inside the requested range
     if versus:
-        try:
-            if isinstance(versus, str) and '-' in versus:
-                # Range filter if passed as string "1-5"
-                start, end = map(int, versus.split('-'))
-                query = query.filter(
-                    and_(
-                        Video.starting_ayah >= start,
-                        Video.ending_ayah <= end
-                    )
-                )
-            else:
-                # Single verse point check
-                ayah_num = int(versus)
-                # Video starts before or at this ayah AND ends after or at this ayah
-                query = query.filter(
-                    and_(
-                        Video.starting_ayah <= ayah_num,
-                        or_(Video.ending_ayah >= ayah_num, Video.ending_ayah.is_(None))
-                    )
-                )
-        except ValueError:
-            pass # Ignore invalid versus inputs
-
-    # 3. Search Filter
+        query = apply_verse_filter(query, versus, db.bind.dialect.name)
+
+    # 3. Search Filter (ranked full-text on Postgres, LIKE fallback elsewhere)
+    rank = None
     if search:
-        search_pattern = f"%{search}%"
-        query = query.filter(
-            or_(
-                Video.title.ilike(search_pattern),
-                Video.surah_name.ilike(search_pattern),
-                Video.keywords.ilike(search_pattern)
-            )
-        )
-
-    # 4. Sorting
-    if sort.upper() == "ASC":
-        query = query.order_by(Video.created_date.asc())
+        query, rank = apply_video_search(query, str(search), db.bind.dialect.name)
+
+    # 4. Sorting + paging (best matches first when searching)
+    # Ranked results page by offset; everything else seeks on (created_date, id)
+    size = page_size(limit)
+    descending = str(sort).upper() != "ASC"
+    if rank is not None:
+        query = query.order_by(rank.desc(), Video.created_date.desc(), Video.id.desc())
+        query, offset = apply_offset(query, cursor)
     else:
-        query = query.order_by(Video.created_date.desc())
+        query = apply_keyset(query, Video.created_date, Video.id, cursor, descending, db.bind.dialect.name)
+
+    # 5. Limiting (one extra row tells us whether there is a next page)
+    result = await db.execute(query.limit(size + 1))
+    videos = result.scalars().all()
 
-    # 5. Limiting
-    if limit:
-        query = query.limit(int(limit))
+    next_cursor = None
+    if len(videos) > size:
+        videos = videos[:size]
+        last = videos[-1]
+        next_cursor = encode_cursor({"o": offset + size}) if rank is not None \
+            else keyset_cursor(last.created_date, last.id)
 
-    videos = query.all()
-    return {"code": 200, "msg": "Success", "result": videos}
+    return {"code": 200, "msg": "Success", "result": videos, "next_cursor": next_cursor}
 
 # --- Admin Routes for Videos ---
 
 @router.post("/create", response_model=ResponseBase[VideoResponse])
 async def create_video(
     video: VideoCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_admin_user)
 ):
     db_video = Video(**video.dict())
     db.add(db_video)
-    db.commit()
-    db.refresh(db_video)
+    await db.commit()
+    publish(LIBRARY)
+    await db.refresh(db_video)
     return {"code": 200, "msg": "Success", "result": db_video}
 
 @router.delete("/{video_id}")
 async def delete_video(
     video_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_admin_user)
 ):
-    video = db.query(Video).filter(Video.id == video_id).first()
+    video = await db.get(Video, video_id)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
     
-    db.delete(video)
-    db.commit()
+    await db.delete(video)
+    await db.commit()
+    publish(LIBRARY)
     return {"code": 200, "msg": "Success", "result": None}
 
 @router.post("/bulk-preview")
 async def bulk_video_preview(
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     1. Reads CSV/Excel
     2. Validates data types and logic
     3. Returns list of valid objects and list of errors
     """
+    # pandas (numpy, openpyxl) is loaded on the first upload, not at startup
+    pd = await load_module("pandas")
+    bulk_import = await load_module("app.utils.bulk_import")
+
     # 1. Read File
     contents = await file.read()
     try:
@@ -146,68 +204,15 @@ async def bulk_video_preview(
         raise HTTPException(400, f"Could not parse file: {str(e)}")
 
     # 2. Clean keys (trim spaces from headers)
-    df.columns = [c.strip().lower().replace(' ', '_') for c in df.columns]
-    
-    # Expected headers mapping
     # We allow flexible headers, mapping them to our schema
     # title, url, surah, start, end
+    df = bulk_import.normalize_columns(df)
     
-    valid_rows = []
-    errors = []
-    
-    # Pre-fetch Surahs for validation
-    existing_surahs = {s.id: s.name for s in db.query(Surah).all()}
-
-    for index, row in df.iterrows():
-        row_errors = []
-        
-        # Extract & Validate Data
-        title = row.get('title', '')
-        url = row.get('youtube_link', '') or row.get('video_url', '')
-        surah_no = row.get('surah_no', 0)
-        start = row.get('starting_ayah', 0)
-        end = row.get('ending_ayah', None)
-        keywords = row.get('keywords', '')
-
-        # Validation Logic
-        if not title or pd.isna(title):
-            row_errors.append("Missing Title")
-        if not url or pd.isna(url):
-            row_errors.append("Missing URL")
-        elif not extract_youtube_id(str(url)):
-            row_errors.append("Invalid YouTube URL")
-        
-        try:
-            s_no = int(surah_no)
-            if s_no not in existing_surahs:
-                row_errors.append(f"Surah {s_no} does not exist in DB")
-        except:
-            row_errors.append("Invalid Surah Number")
-            s_no = None
-
-        try:
-            st_ayah = int(start)
-        except:
-            row_errors.append("Invalid Starting Ayah")
-            st_ayah = None
-
-        # Prepare Object
-        if not row_errors:
-            valid_rows.append({
-                "title": str(title),
-                "video_url": str(url),
-                "surah_no": s_no,
-                "surah_name": existing_surahs.get(s_no),
-                "starting_ayah": st_ayah,
-                "ending_ayah": int(end) if pd.notna(end) else None,
-                "keywords": str(keywords) if pd.notna(keywords) else None
-            })
-        else:
-            errors.append({
-                "row": index + 2, # +2 because index 0 is row 2 in Excel (row 1 header)
-                "data": {k: str(v) for k,v in row.items()},
-                "issues": row_errors
-            })
+    # Surahs for validation come from the in-memory catalog
+    catalog = await get_surah_catalog(db)
+
+    # 3. Validate whole columns at once
+    valid_rows, errors = bulk_import.validate_video_frame(df, catalog)
 
     return {
         "code": 200,
@@ -222,21 +227,21 @@ async def bulk_video_preview(
 @router.post("/bulk-create")
 async def bulk_create_videos(
     videos: List[VideoCreate],
-    db: Session = Depends(get_db),
+    batch_size: Optional[int] = Query(None, ge=1, le=50_000),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_admin_user)
 ):
     """
-    Receives the clean list from frontend and inserts them
+    Receives the clean list from frontend and inserts them in batches
+    (COPY on Postgres). Each batch commits on its own; failed batches are
+    reported in result.batches instead of aborting the whole import.
     """
-    count = 0
-    for v in videos:
-        db_video = Video(**v.dict())
-        db.add(db_video)
-        count += 1
-    
-    try:
-        db.commit()
-        return {"code": 200, "msg": f"Successfully imported {count} videos", "result": count}
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(500, f"Database error: {str(e)}")
\ No newline at end of file
+    rows = [v.dict() for v in videos]
+    report = await bulk_insert(db, Video.__table__, rows, batch_size=batch_size)
+    if report["inserted"]:
+        publish(LIBRARY)
+
+    msg = f"Successfully imported {report['inserted']} videos"
+    if report["failed"]:
+        msg = f"Imported {report['inserted']} of {len(rows)} videos, {report['failed']} failed"
+    return {"code": 200, "msg": msg, "result": report}
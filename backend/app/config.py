@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 import json
 
 class Settings(BaseSettings):
@@ -7,12 +7,66 @@ class Settings(BaseSettings):
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_MINUTES: int = 10080  # 7 days
+    BCRYPT_ROUNDS: int = 12  # Cost factor; existing hashes are upgraded on next login
+    PASSWORD_HASH_WORKERS: int = 2  # Threads hashing / verifying passwords concurrently
+    PASSWORD_HASH_MAX_PENDING: int = 32  # Logins allowed to queue before 503
     CORS_ORIGINS: str = '["http://localhost:3000"]'
     UPLOAD_DIR: str = "./static"
+    STATIC_MAX_AGE: int = 3600  # seconds, for non content-addressed static files
+    MAX_UPLOAD_SIZE: int = 250 * 1024 * 1024  # bytes, default cap for save_upload_file
+    MAX_PDF_UPLOAD_SIZE: int = 250 * 1024 * 1024
+    MAX_COVER_UPLOAD_SIZE: int = 10 * 1024 * 1024
+    DEFAULT_PAGE_SIZE: int = 50
+    MAX_PAGE_SIZE: int = 200
+    REGISTRATION_COUNT_TTL: int = 60  # seconds
+    REGISTRATION_COUNT_CACHE_SIZE: int = 256  # Filter combinations whose totals are kept
+    # Cache-Control for the conditional-GET catalog routes (surah, ebooks, library)
+    CACHE_CONTROL_DEFAULT: str = "no-cache"  # Always revalidate; cheap thanks to ETag / 304
+    CACHE_CONTROL_POLICIES: str = '{"surah": "public, max-age=300"}'
+    AUTH_CACHE_TTL: int = 60  # seconds a verified token / user row is reused by get_current_user
+    AUTH_CACHE_SIZE: int = 1024  # entries per cache (0 disables)
+    LIBRARY_COALESCE: bool = True  # Identical concurrent /library queries share one DB query
+    LIBRARY_COALESCE_TTL: float = 0.0  # seconds a finished /library page is reused (0: in-flight only)
+    RESPONSE_CACHE_SIZE: int = 512  # Encoded list pages (/surah, /ebooks, /library) kept per process (0 disables)
+    RESPONSE_CACHE_TTL: int = 3600  # seconds; writes invalidate through the data version, this only ages entries out
+    COMPRESSION: bool = True  # br / gzip for JSON and text responses (cached pages keep their compressed bytes)
+    COMPRESSION_MIN_SIZE: int = 1024  # bytes; smaller bodies are sent as is
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5  # 0-11; higher is much slower for dynamic responses
+    METRICS_ENABLED: bool = True  # Per-route latency / DB time middleware and the Prometheus /metrics endpoint
+    METRICS_TOKEN: str = ""  # /metrics accepts "Authorization: Bearer <token>" (or an admin session)
+    METRICS_PUBLIC: bool = False  # Serve /metrics without auth (only behind a private network)
+    SLOW_QUERY_MS: int = 500  # Log statements at least this slow (app.sql logger, params redacted); 0 disables
+    SQL_N_PLUS_ONE_DETECTION: bool = False  # Dev / test: warn when one request repeats a statement shape
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5  # Repeats per request that count as a suspected N+1
+    PROFILE_DIR: str = "./profiles"  # Admin request profiles (X-Profile header / ?profile=)
+    PROFILE_MAX_FILES: int = 50  # Oldest profiles are deleted beyond this
+    PROFILE_SAMPLE_INTERVAL: float = 0.001  # seconds between stack samples
+    CACHE_BUS_BACKEND: str = "auto"  # Cross-process cache invalidation: auto, postgres (LISTEN/NOTIFY), local
+    CACHE_BUS_CHANNEL: str = "wqtc_cache_invalidation"
+    COVER_WIDTHS: str = '[320, 640, 1024]'  # WebP derivative widths (px)
+    COVER_WEBP_QUALITY: int = 80
+    IMAGE_WORKERS: int = 2  # Processes for cover derivative generation
+    BULK_INSERT_BATCH_SIZE: int = 5000  # Rows per transaction on /library/bulk-create
+    BULK_INSERT_USE_COPY: bool = True  # COPY instead of INSERT on Postgres (asyncpg)
+    IMPORT_DIR: str = "./imports"  # Queued spreadsheets (private, not under UPLOAD_DIR)
+    MAX_IMPORT_UPLOAD_SIZE: int = 100 * 1024 * 1024
+    IMPORT_WORKERS: int = 2  # Import jobs processed concurrently per app process
+    IMPORT_CHUNK_SIZE: int = 10000  # Rows parsed / validated / inserted per step
+    IMPORT_POLL_INTERVAL: float = 5.0  # seconds between queue checks when idle
+    IMPORT_STALE_AFTER: int = 600  # seconds without progress before a running job is failed
     
     @property
     def cors_origins_list(self) -> List[str]:
         return json.loads(self.CORS_ORIGINS)
+
+    @property
+    def cache_control_policies(self) -> Dict[str, str]:
+        return json.loads(self.CACHE_CONTROL_POLICIES)
+
+    @property
+    def cover_widths_list(self) -> List[int]:
+        return sorted(int(w) for w in json.loads(self.COVER_WIDTHS))
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,53 @@
+from typing import Mapping, Optional
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Multipart framing (boundaries, part headers, small form fields) on top of the file itself
+MULTIPART_OVERHEAD = 64 * 1024
+
+class BodySizeLimitMiddleware:
+    """
+    Caps request bodies before the app reads them. Starlette spools a whole
+    multipart body to temporary files while parsing the form, before any
+    route code runs, so save_upload_file's own cap comes too late to save
+    the disk and the upload time. Per-path limits (exact path) fall back to
+    `default`. A declared Content-Length over the limit gets 413 straight
+    away; chunked or understated bodies get 413 once they cross it.
+    """
+
+    def __init__(self, app: ASGIApp, default: int, limits: Optional[Mapping[str, int]] = None):
+        self.app = app
+        self.default = default
+        self.limits = dict(limits or {})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        limit = self.limits.get(scope["path"].rstrip("/") or "/", self.default)
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            response = JSONResponse({"detail": f"Request body exceeds {limit} bytes"}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Raised inside the route's body parsing; FastAPI passes HTTPException through
+                    raise HTTPException(status_code=413, detail=f"Request body exceeds {limit} bytes")
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+def upload_limit(max_file_size: int) -> int:
+    """Body limit for a route taking one file of up to max_file_size bytes"""
+    return max_file_size + MULTIPART_OVERHEAD
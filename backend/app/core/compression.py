@@ -0,0 +1,199 @@
+import gzip
+import time
+from collections import Counter
+from typing import Optional
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.config import settings
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+# Server preference when the client accepts several equally
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# Media that is already compressed (images, PDFs, archives, video) is left alone
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/x-ndjson",
+    "image/svg+xml",
+)
+
+# Below this size handing the work to a thread costs more than compressing inline
+THREAD_MIN_SIZE = 64 * 1024
+
+class CompressionMetrics:
+    """Counters for bytes saved and time spent compressing, per encoding"""
+
+    def __init__(self):
+        self.responses = Counter()
+        self.reused = Counter()
+        self.bytes_in = Counter()
+        self.bytes_out = Counter()
+        self.seconds = Counter()
+        self.max_seconds = 0.0
+        self.skipped = Counter()
+
+    def compressed(self, encoding: str, seconds: float):
+        self.seconds[encoding] += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def sent(self, encoding: str, raw: int, sent: int, reused: bool = False):
+        self.responses[encoding] += 1
+        self.bytes_in[encoding] += raw
+        self.bytes_out[encoding] += sent
+        if reused:
+            self.reused[encoding] += 1
+
+    def stats(self) -> dict:
+        encodings = {}
+        for encoding in self.responses:
+            compressed = self.responses[encoding] - self.reused[encoding]
+            encodings[encoding] = {
+                "responses": self.responses[encoding],
+                "reused_cached": self.reused[encoding],
+                "bytes_in": self.bytes_in[encoding],
+                "bytes_out": self.bytes_out[encoding],
+                "bytes_saved": self.bytes_in[encoding] - self.bytes_out[encoding],
+                "ratio": round(self.bytes_out[encoding] / self.bytes_in[encoding], 4) if self.bytes_in[encoding] else None,
+                "avg_compress_ms": round(self.seconds[encoding] / compressed * 1000, 3) if compressed else None,
+            }
+        return {
+            "encodings": encodings,
+            "max_compress_ms": round(self.max_seconds * 1000, 3),
+            "skipped": dict(self.skipped),
+        }
+
+compression_metrics = CompressionMetrics()
+
+def accepted_encodings(accept_encoding: Optional[str], supported: tuple[str, ...] = ENCODINGS) -> list[str]:
+    """
+    Encodings from `supported` the client accepts (q > 0, explicitly or via *),
+    best first: higher q-value, then the order of `supported`.
+    """
+    if not accept_encoding:
+        return []
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip().lower()] = q
+
+    ranked = [(weights.get(encoding, weights.get("*", 0.0)), -i, encoding) for i, encoding in enumerate(supported)]
+    return [encoding for q, _, encoding in sorted(ranked, reverse=True) if q > 0]
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Best supported encoding from an Accept-Encoding header (q-values honoured)"""
+    encodings = accepted_encodings(accept_encoding)
+    return encodings[0] if encodings else None
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.lower().startswith(COMPRESSIBLE_TYPES)
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    # mtime=0: identical bytes for identical bodies (stable across workers)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+async def compress_async(body: bytes, encoding: str) -> bytes:
+    """Compresses large bodies in a worker thread so the event loop keeps serving"""
+    start = time.perf_counter()
+    if len(body) >= THREAD_MIN_SIZE:
+        result = await anyio.to_thread.run_sync(compress, body, encoding)
+    else:
+        result = compress(body, encoding)
+    compression_metrics.compressed(encoding, time.perf_counter() - start)
+    return result
+
+def weak_etag(etag: str) -> str:
+    """The compressed entity differs byte-wise from the identity one"""
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+class CompressionMiddleware:
+    """
+    Compresses single-message responses (JSON, text) with brotli or gzip as
+    negotiated. Streamed bodies (file downloads), small bodies, media types
+    that are already compressed and responses that carry a Content-Encoding
+    (precompressed static files, cached API pages) pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message):
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                # e.g. zero-copy sendfile from the static server: nothing to compress
+                if start_message is not None:
+                    passthrough = True
+                    await send(start_message)
+                    start_message = None
+                await send(message)
+                return
+
+            start, start_message = start_message, None
+            headers = MutableHeaders(raw=start["headers"])
+            reason = self.skip_reason(start["status"], headers, message)
+            if reason is None:
+                if "accept-encoding" not in headers.get("vary", "").lower():
+                    headers.add_vary_header("Accept-Encoding")
+                if encoding is None:
+                    reason = "not_accepted"
+            if reason is not None:
+                compression_metrics.skipped[reason] += 1
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            body = message["body"]
+            compressed = await compress_async(body, encoding)
+            compression_metrics.sent(encoding, len(body), len(compressed))
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            if "etag" in headers:
+                headers["ETag"] = weak_etag(headers["etag"])
+            await send(start)
+            await send({**message, "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def skip_reason(self, status: int, headers: MutableHeaders, message: Message) -> Optional[str]:
+        if "content-encoding" in headers:
+            return "already_encoded"
+        if message.get("more_body"):
+            return "streamed"
+        if status < 200 or status in (204, 206, 304):
+            return "no_body"
+        if not is_compressible(headers.get("content-type")):
+            return "content_type"
+        if "no-transform" in headers.get("cache-control", ""):
+            return "no_transform"
+        if len(message.get("body", b"")) < self.minimum_size:
+            return "small"
+        return None
@@ -0,0 +1,208 @@
+import json
+import time
+import uuid
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Callable, Optional
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from app.config import settings
+from app.database import async_engine
+
+logger = logging.getLogger(__name__)
+
+# Handler(message, remote): remote is False for the publishing process itself
+Handler = Callable[[dict, bool], None]
+
+class InvalidationBus:
+    """
+    Fan-out of cache invalidations to every app process. publish() applies the
+    message locally right away (so the writer reads its own writes), then hands
+    it to the backend, which delivers it to all other processes.
+    """
+
+    def __init__(self):
+        self.origin = uuid.uuid4().hex
+        self.backend = None
+        self.published = 0
+        self.received = 0
+        self.send_failures = 0
+        self._handlers: dict[str, list[Handler]] = defaultdict(list)
+        self._pending: set[asyncio.Task] = set()
+
+    def subscribe(self, topic: str, handler: Handler):
+        self._handlers[topic].append(handler)
+
+    def publish(self, topic: str, key: Optional[str] = None):
+        """Call after the write has committed"""
+        message = {
+            "topic": topic,
+            "key": key,
+            "version": uuid.uuid4().hex[:12],
+            "ts": time.time(),
+            "origin": self.origin,
+        }
+        self.published += 1
+        self._dispatch(message, remote=False)
+        if self.backend is None:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self._send(message))
+        except RuntimeError:
+            return  # No event loop (sync scripts): nothing else to notify in-process
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def deliver(self, message: dict):
+        """Entry point for backends: a message from another process"""
+        if message.get("origin") == self.origin:
+            return
+        self.received += 1
+        self._dispatch(message, remote=True)
+
+    def invalidate_all(self):
+        """Treat every topic as changed (after missing messages, e.g. a reconnect)"""
+        for topic in list(self._handlers):
+            self._dispatch({"topic": topic, "key": None, "version": uuid.uuid4().hex[:12],
+                            "ts": time.time(), "origin": None}, remote=True)
+
+    async def _send(self, message: dict):
+        try:
+            await self.backend.send(message)
+        except Exception:
+            self.send_failures += 1
+            logger.exception("Could not publish cache invalidation %s", message["topic"])
+
+    def _dispatch(self, message: dict, remote: bool):
+        for handler in self._handlers.get(message.get("topic"), ()):
+            try:
+                handler(message, remote)
+            except Exception:
+                logger.exception("Cache invalidation handler failed for %s", message.get("topic"))
+
+    async def start(self, backend):
+        self.backend = backend
+        await backend.start(self)
+
+    async def stop(self):
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        if self.backend is not None:
+            await self.backend.stop(self)
+            self.backend = None
+
+    def stats(self) -> dict:
+        return {
+            "backend": type(self.backend).__name__ if self.backend else None,
+            "published": self.published,
+            "received": self.received,
+            "send_failures": self.send_failures,
+        }
+
+class LocalBackend:
+    """
+    In-process stand-in for tests and single-process setups: buses attached
+    to the same hub receive each other's messages, like separate workers would.
+    """
+
+    def __init__(self, hub: Optional[list] = None):
+        self.hub = hub if hub is not None else []
+
+    async def start(self, bus: InvalidationBus):
+        self.hub.append(bus)
+
+    async def send(self, message: dict):
+        for bus in list(self.hub):
+            bus.deliver(dict(message))
+
+    async def stop(self, bus: InvalidationBus):
+        if bus in self.hub:
+            self.hub.remove(bus)
+
+class PostgresBackend:
+    """
+    LISTEN/NOTIFY on the application database. One dedicated asyncpg
+    connection listens, reconnecting with backoff; whenever it (re)connects
+    all caches are invalidated, since messages may have been missed while
+    it was not listening. NOTIFY goes through the regular async engine pool.
+    """
+
+    PING_INTERVAL = 30  # seconds; detects dead listener connections
+
+    def __init__(self, url: str, channel: str):
+        self.dsn = make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.channel = channel
+        self._bus: Optional[InvalidationBus] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, bus: InvalidationBus):
+        self._bus = bus
+        self._task = asyncio.create_task(self._listen(), name="cache-invalidation-listener")
+
+    async def send(self, message: dict):
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT pg_notify(:channel, :payload)"),
+                               {"channel": self.channel, "payload": json.dumps(message)})
+            await conn.commit()
+
+    async def stop(self, bus: InvalidationBus):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def _on_notify(self, connection, pid, channel, payload):
+        try:
+            self._bus.deliver(json.loads(payload))
+        except ValueError:
+            logger.warning("Ignoring malformed cache invalidation: %r", payload)
+
+    async def _listen(self):
+        delay = 1
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(self.dsn)
+                closed = asyncio.Event()
+                conn.add_termination_listener(lambda _: closed.set())
+                await conn.add_listener(self.channel, self._on_notify)
+                self._bus.invalidate_all()
+                delay = 1
+                while not conn.is_closed():
+                    try:
+                        await asyncio.wait_for(closed.wait(), timeout=self.PING_INTERVAL)
+                    except asyncio.TimeoutError:
+                        await conn.execute("SELECT 1")
+            except asyncio.CancelledError:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+                raise
+            except Exception:
+                logger.exception("Cache invalidation listener lost; reconnecting in %ds", delay)
+            if conn is not None and not conn.is_closed():
+                conn.terminate()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30)
+
+def make_backend(url: str):
+    choice = settings.CACHE_BUS_BACKEND
+    if choice == "auto":
+        choice = "postgres" if make_url(url).get_backend_name() == "postgresql" else "local"
+    if choice == "postgres":
+        return PostgresBackend(url, settings.CACHE_BUS_CHANNEL)
+    if choice == "local":
+        return LocalBackend()
+    raise ValueError(f"Unknown CACHE_BUS_BACKEND: {settings.CACHE_BUS_BACKEND}")
+
+bus = InvalidationBus()
+
+def publish(topic: str, key: Optional[str] = None):
+    bus.publish(topic, key)
+
+async def start_invalidation_bus():
+    await bus.start(make_backend(settings.DATABASE_URL))
+
+async def stop_invalidation_bus():
+    await bus.stop()
@@ -0,0 +1,209 @@
+import time
+import bisect
+from contextvars import ContextVar
+from typing import Callable, Iterable, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Prometheus text exposition (format 0.0.4), written by hand: a handful of
+# dict updates per request, no client library. Each worker process keeps its
+# own numbers; scrape every worker (or sum behind the load balancer).
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(names: tuple, values: tuple, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        self.name, self.help, self.label_names = name, help, labels
+        self.values: dict[tuple, float] = {}
+
+    def inc(self, *labels, amount: float = 1.0):
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in self.values.items():
+            yield f"{self.name}{_labels(self.label_names, labels)} {_number(value)}"
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, *labels, value: float):
+        self.values[labels] = value
+
+    def dec(self, *labels, amount: float = 1.0):
+        self.inc(*labels, amount=-amount)
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name, self.help, self.label_names = name, help, labels
+        self.buckets = buckets
+        # labels -> [per-bucket counts (+Inf last), sum]
+        self.values: dict[tuple, list] = {}
+
+    def observe(self, *labels, value: float):
+        entry = self.values.get(labels)
+        if entry is None:
+            entry = self.values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        entry[0][bisect.bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+
+    def samples(self) -> Iterable[str]:
+        for labels, (counts, total) in self.values.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                le = f'le="{bound if bound == "+Inf" else _number(bound)}"'
+                yield f"{self.name}_bucket{_labels(self.label_names, labels, le)} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.label_names, labels)} {_number(total)}"
+            yield f"{self.name}_count{_labels(self.label_names, labels)} {cumulative}"
+
+class Registry:
+    def __init__(self):
+        self.metrics: list = []
+        # Callables returning (name, kind, help, [(labels dict, value)]) for
+        # numbers other modules already keep (caches, compression, ...)
+        self.collectors: list[Callable[[], Iterable[tuple]]] = []
+
+    def add(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[tuple]]):
+        self.collectors.append(collector)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        for collector in self.collectors:
+            for name, kind, help, samples in collector():
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    if value is not None:
+                        lines.append(f"{name}{_labels(tuple(labels), tuple(labels.values()))} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+registry = Registry()
+
+REQUEST_DURATION = registry.add(Histogram(
+    "http_request_duration_seconds", "Request latency until the response is fully sent", ("method", "route")))
+REQUESTS = registry.add(Counter(
+    "http_requests_total", "Requests by route and status code", ("method", "route", "status")))
+IN_FLIGHT = registry.add(Gauge(
+    "http_requests_in_flight", "Requests currently being handled", ("method",)))
+DB_QUERIES = registry.add(Histogram(
+    "http_request_db_queries", "SQL statements executed per request", ("route",), buckets=QUERY_COUNT_BUCKETS))
+DB_DURATION = registry.add(Histogram(
+    "http_request_db_seconds", "Time spent in SQL statements per request", ("route",)))
+DB_STATEMENTS = registry.add(Counter(
+    "db_statements_total", "SQL statements executed (including outside requests)", ("engine",)))
+DB_STATEMENT_SECONDS = registry.add(Counter(
+    "db_statement_seconds_total", "Time spent in SQL statements", ("engine",)))
+
+class RequestDBStats:
+    __slots__ = ("scope", "queries", "seconds", "shapes")
+
+    def __init__(self, scope: Scope):
+        self.scope = scope
+        self.queries = 0
+        self.seconds = 0.0
+        self.shapes: Optional[dict] = None  # Statement shape counts (query_log, N+1 detection)
+
+# Set by MetricsMiddleware for the duration of a request. SQLAlchemy's async
+# layer runs the sync engine events in a greenlet that shares this context.
+current_request_db: ContextVar[Optional[RequestDBStats]] = ContextVar("current_request_db", default=None)
+
+# observer(statement, parameters, executemany, seconds, request stats or None)
+StatementObserver = Callable[[str, object, bool, float, Optional[RequestDBStats]], None]
+
+def instrument_engine(engine: Engine, name: str, observer: Optional[StatementObserver] = None):
+    """
+    Counts statements and their time, globally and for the current request;
+    `observer` additionally sees every statement (slow-query log).
+    """
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["metrics_query_start"].pop()
+        DB_STATEMENTS.inc(name)
+        DB_STATEMENT_SECONDS.inc(name, amount=elapsed)
+        stats = current_request_db.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.seconds += elapsed
+        if observer is not None:
+            observer(statement, parameters, executemany, elapsed, stats)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("metrics_query_start"):
+            conn.info["metrics_query_start"].pop()
+
+def route_label(scope: Scope) -> str:
+    """Route template, never the raw path (bounded label cardinality)"""
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    if scope.get("endpoint") is not None:  # Mounted app, e.g. /static
+        return scope.get("root_path", "") + "/{path}"
+    return "unmatched"
+
+class MetricsMiddleware:
+    """Latency, status and DB time per route; in-flight requests per method"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        db_stats = RequestDBStats(scope)
+        token = current_request_db.set(db_stats)
+        IN_FLIGHT.inc(method)
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            current_request_db.reset(token)
+            IN_FLIGHT.dec(method)
+            route = route_label(scope)
+            REQUEST_DURATION.observe(method, route, value=elapsed)
+            REQUESTS.inc(method, route, str(status))
+            DB_QUERIES.observe(route, value=db_stats.queries)
+            DB_DURATION.observe(route, value=db_stats.seconds)
@@ -0,0 +1,194 @@
+import os
+import re
+import sys
+import json
+import time
+import uuid
+import cProfile
+import threading
+from collections import Counter
+from typing import Awaitable, Callable, Optional
+from urllib.parse import parse_qs
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Profile files: <id>.folded (sampled stacks, "frame;frame;frame count" per
+# line: flamegraph.pl / speedscope / inferno) or <id>.prof (cProfile pstats:
+# snakeviz, flameprof), each with a <id>.json metadata sidecar.
+PROFILE_ID_RE = re.compile(r"^\d{17}-[0-9a-f]{8}$")
+EXTENSIONS = {"sample": ".folded", "cprofile": ".prof"}
+
+class StackSampler:
+    """
+    Samples one thread's Python stack every `interval` seconds from a helper
+    thread. Pointed at the event loop thread it sees the profiled request,
+    but also anything else the loop runs meanwhile (other requests, idle
+    waits in the selector).
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[self.fold(frame)] += 1
+
+    @staticmethod
+    def fold(frame) -> str:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_qualname}:{frame.f_lineno}")
+            frame = frame.f_back
+        return ";".join(reversed(stack))
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+class ProfileStore:
+    """Ring buffer of profiles on disk: keeps the newest `max_files`"""
+
+    def __init__(self, directory: str, max_files: int):
+        self.directory = directory
+        self.max_files = max_files
+
+    def new_id(self) -> str:
+        now = time.time()
+        # Sortable: UTC timestamp with milliseconds
+        return f"{time.strftime('%Y%m%d%H%M%S', time.gmtime(now))}{int(now * 1000) % 1000:03d}-{uuid.uuid4().hex[:8]}"
+
+    def save(self, profile_id: str, mode: str, write: Callable[[str], None], meta: dict):
+        os.makedirs(self.directory, exist_ok=True)
+        write(os.path.join(self.directory, profile_id + EXTENSIONS[mode]))
+        with open(os.path.join(self.directory, profile_id + ".json"), "w") as f:
+            json.dump({"id": profile_id, "mode": mode, **meta}, f)
+        self.trim()
+
+    def list(self) -> list[dict]:
+        """Newest first"""
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for name in sorted(os.listdir(self.directory), reverse=True):
+            if name.endswith(".json") and PROFILE_ID_RE.match(name[:-5]):
+                try:
+                    with open(os.path.join(self.directory, name)) as f:
+                        profiles.append(json.load(f))
+                except (OSError, ValueError):
+                    continue
+        return profiles
+
+    def path(self, profile_id: str) -> Optional[str]:
+        if not PROFILE_ID_RE.match(profile_id):
+            return None
+        for extension in EXTENSIONS.values():
+            path = os.path.join(self.directory, profile_id + extension)
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def trim(self):
+        for meta in self.list()[self.max_files:]:
+            for extension in (*EXTENSIONS.values(), ".json"):
+                try:
+                    os.remove(os.path.join(self.directory, meta["id"] + extension))
+                except FileNotFoundError:
+                    pass
+
+def requested_mode(scope: Scope) -> Optional[str]:
+    """X-Profile header or ?profile= flag: 1 / true / sample, or cprofile"""
+    value = Headers(scope=scope).get("x-profile")
+    if value is None:
+        values = parse_qs(scope.get("query_string", b"").decode("latin-1")).get("profile")
+        value = values[0] if values else None
+    if value is None:
+        return None
+    value = value.strip().lower()
+    if value in ("1", "true", "yes", "sample"):
+        return "sample"
+    if value == "cprofile":
+        return "cprofile"
+    return None
+
+class ProfilerMiddleware:
+    """
+    Profiles single requests on demand. Only requests whose session cookie
+    belongs to an admin (`authorize(token)`) are profiled, one at a time;
+    anything else runs normally. The response carries X-Profile-Id.
+    """
+
+    def __init__(self, app: ASGIApp, store: ProfileStore,
+                 authorize: Callable[[Optional[str]], Awaitable[bool]], sample_interval: float = 0.001):
+        self.app = app
+        self.store = store
+        self.authorize = authorize
+        self.sample_interval = sample_interval
+        self._busy = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        mode = requested_mode(scope) if scope["type"] == "http" else None
+        # Authorize first: checking and setting _busy with no await in between
+        # keeps two profiled requests from starting together
+        if mode is None or not await self.authorize(self.session_token(scope)) or self._busy:
+            await self.app(scope, receive, send)
+            return
+
+        self._busy = True
+        profile_id = self.store.new_id()
+        status = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message)["X-Profile-Id"] = profile_id
+            await send(message)
+
+        if mode == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.enable()
+        else:
+            profiler = StackSampler(threading.get_ident(), self.sample_interval)
+            profiler.start()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            if mode == "cprofile":
+                profiler.disable()
+                write = profiler.dump_stats
+            else:
+                profiler.stop()
+                def write(path, folded=profiler.folded()):
+                    with open(path, "w") as f:
+                        f.write(folded)
+            self._busy = False
+            meta = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "query": scope.get("query_string", b"").decode("latin-1"),
+                "status": status,
+                "duration_ms": round(elapsed * 1000, 1),
+                "created_at": time.time(),
+            }
+            await anyio.to_thread.run_sync(self.store.save, profile_id, mode, write, meta)
+
+    @staticmethod
+    def session_token(scope: Scope) -> Optional[str]:
+        return cookie_parser(Headers(scope=scope).get("cookie", "")).get("token")
@@ -0,0 +1,96 @@
+import re
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from app.config import settings
+from app.core.metrics import RequestDBStats, route_label
+
+logger = logging.getLogger("app.sql")
+
+# Shape of a statement: whitespace collapsed, literals and placeholders
+# replaced, expanded IN lists folded, so one query per row looks identical
+_WHITESPACE_RE = re.compile(r"\s+")
+_PLACEHOLDER_RE = re.compile(r"\$\d+|%\(\w+\)s|(?<!:):\w+|\?")
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+MAX_LOGGED_STATEMENT = 2000
+
+def statement_shape(statement: str) -> str:
+    shape = _WHITESPACE_RE.sub(" ", statement).strip()
+    shape = _PLACEHOLDER_RE.sub("?", shape)
+    shape = _LITERAL_RE.sub("?", shape)
+    return _LIST_RE.sub("(?...)", shape)
+
+def redact_parameters(parameters, executemany: bool) -> str:
+    """Types only: values may be emails, password hashes, tokens"""
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{k}: {type(v).__name__}" for k, v in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(v).__name__ for v in parameters) + ")"
+    return "<none>" if not parameters else f"<{type(parameters).__name__}>"
+
+def request_label(stats: Optional[RequestDBStats]) -> str:
+    if stats is None:
+        return "outside request"
+    return f"{stats.scope.get('method')} {route_label(stats.scope)}"
+
+class QueryBudget:
+    """Statements seen while a query_budget() block is active"""
+
+    def __init__(self, max_queries: int):
+        self.max_queries = max_queries
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+_budgets: list[QueryBudget] = []
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryBudget]:
+    """
+    Fails (AssertionError) when the block runs more than max_queries SQL
+    statements, listing them. Counts every statement in the process, so a
+    TestClient request (served on another thread) is covered:
+
+        with query_budget(2):
+            client.get("/api/v1/library?surah=1")
+    """
+    budget = QueryBudget(max_queries)
+    _budgets.append(budget)
+    try:
+        yield budget
+    finally:
+        _budgets.remove(budget)
+    if budget.count > max_queries:
+        listing = "\n".join(f"  {i}. {s}" for i, s in enumerate(budget.statements, 1))
+        raise AssertionError(f"{budget.count} SQL statements, budget is {max_queries}:\n{listing}")
+
+def log_statement(statement: str, parameters, executemany: bool, seconds: float,
+                  stats: Optional[RequestDBStats]):
+    """Statement observer for app.core.metrics.instrument_engine"""
+    if settings.SLOW_QUERY_MS and seconds * 1000 >= settings.SLOW_QUERY_MS:
+        logger.warning("Slow query (%.0f ms) [%s]: %s -- params %s",
+                       seconds * 1000, request_label(stats), statement[:MAX_LOGGED_STATEMENT],
+                       redact_parameters(parameters, executemany))
+
+    if _budgets:
+        shape = statement_shape(statement)
+        for budget in _budgets:
+            budget.statements.append(shape)
+
+    if settings.SQL_N_PLUS_ONE_DETECTION and stats is not None:
+        if stats.shapes is None:
+            stats.shapes = Counter()
+        shape = statement_shape(statement)
+        stats.shapes[shape] += 1
+        # Once per shape and request, when it reaches the threshold
+        if stats.shapes[shape] == settings.SQL_N_PLUS_ONE_THRESHOLD:
+            logger.warning("Suspected N+1 [%s]: same statement run %d times in one request: %s",
+                           request_label(stats), settings.SQL_N_PLUS_ONE_THRESHOLD,
+                           shape[:MAX_LOGGED_STATEMENT])
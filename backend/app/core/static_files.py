@@ -0,0 +1,285 @@
+import os
+import re
+import stat
+import uuid
+import mimetypes
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+from app.core.compression import accepted_encodings
+
+# Blob-store paths (ab/cd/<sha256>...) never change content -> cache forever
+HASHED_PATH_RE = re.compile(r"(?:^|/)([0-9a-f]{2})/([0-9a-f]{2})/(\1\2[0-9a-f]{60})(?:\.[\w.]+)?$")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Precompressed siblings (file.pdf.br, file.pdf.gz); br preferred at equal q.
+# Serving them needs no compression library, so br is offered either way.
+PRECOMPRESSED = {"br": ".br", "gzip": ".gz"}
+
+# More ranges than this is treated as abuse / not worth it: send the whole file
+MAX_RANGES = 16
+
+class StaticFileServer:
+    """
+    ASGI app serving files under `directory` (mounted at /static).
+
+    Compared to starlette's StaticFiles it adds: single and multi byte-range
+    responses (206 / multipart/byteranges, If-Range), strong ETags, 304s for
+    If-None-Match / If-Modified-Since, immutable Cache-Control for
+    content-addressed paths, precompressed .br/.gz variants and zero-copy
+    sendfile when the server offers the http.response.zerocopysend extension.
+    """
+
+    def __init__(self, directory: str, max_age: int = 3600, chunk_size: int = 64 * 1024):
+        self.directory = os.path.realpath(directory)
+        self.max_age = max_age
+        self.chunk_size = chunk_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        assert scope["type"] == "http"
+        method = scope["method"]
+        if method not in ("GET", "HEAD"):
+            await Response("Method Not Allowed", 405, headers={"Allow": "GET, HEAD"})(scope, receive, send)
+            return
+
+        relpath = self.route_path(scope)
+        full_path = self.resolve(relpath)
+        st = await self.stat(full_path) if full_path else None
+        if st is None:
+            await Response("Not Found", 404)(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        range_header = request_headers.get("range")
+
+        # Precompressed variant (never for range requests: offsets are into the identity body)
+        encoding, body_st = None, st
+        if not range_header:
+            accepted = accepted_encodings(request_headers.get("accept-encoding"), tuple(PRECOMPRESSED))
+            for name in accepted:
+                suffix = PRECOMPRESSED[name]
+                variant_st = await self.stat(full_path + suffix)
+                if variant_st is not None:
+                    encoding, full_path, body_st = name, full_path + suffix, variant_st
+                    break
+
+        etag = self.etag(relpath, st, encoding)
+        headers = {
+            "etag": etag,
+            "last-modified": formatdate(st.st_mtime, usegmt=True),
+            "cache-control": self.cache_control(relpath),
+            "accept-ranges": "bytes",
+            "vary": "Accept-Encoding",
+        }
+        content_type = mimetypes.guess_type(relpath)[0] or "application/octet-stream"
+
+        if self.not_modified(request_headers, etag, st):
+            await Response(status_code=304, headers=headers)(scope, receive, send)
+            return
+
+        size = body_st.st_size
+        ranges = None
+        if range_header and self.if_range_ok(request_headers, etag, st):
+            ranges = parse_ranges(range_header, size)
+            if ranges == []:
+                headers["content-range"] = f"bytes */{size}"
+                await Response(status_code=416, headers=headers)(scope, receive, send)
+                return
+
+        if encoding:
+            headers["content-encoding"] = encoding
+
+        if not ranges:
+            headers["content-type"] = content_type
+            headers["content-length"] = str(size)
+            await self.send_file(scope, send, full_path, 200, headers, [(0, size)], method == "HEAD")
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            headers["content-type"] = content_type
+            headers["content-range"] = f"bytes {start}-{end - 1}/{size}"
+            headers["content-length"] = str(end - start)
+            await self.send_file(scope, send, full_path, 206, headers, ranges, method == "HEAD")
+        else:
+            await self.send_multipart(scope, send, full_path, headers, content_type, ranges, size, method == "HEAD")
+
+    # --- Lookup ---
+
+    @staticmethod
+    def route_path(scope: Scope) -> str:
+        root_path = scope.get("root_path", "")
+        path = scope["path"]
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        return path.lstrip("/")
+
+    def resolve(self, relpath: str) -> Optional[str]:
+        """Absolute path inside directory, or None for traversal attempts"""
+        full_path = os.path.realpath(os.path.join(self.directory, relpath))
+        if os.path.commonpath([full_path, self.directory]) != self.directory:
+            return None
+        return full_path
+
+    @staticmethod
+    async def stat(path: str) -> Optional[os.stat_result]:
+        try:
+            st = await anyio.to_thread.run_sync(os.stat, path)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            return None
+        return st if stat.S_ISREG(st.st_mode) else None
+
+    # --- Validators ---
+
+    def cache_control(self, relpath: str) -> str:
+        if HASHED_PATH_RE.search(relpath):
+            return IMMUTABLE_CACHE_CONTROL
+        return f"public, max-age={self.max_age}"
+
+    @staticmethod
+    def etag(relpath: str, st: os.stat_result, encoding: Optional[str]) -> str:
+        # Content-addressed file names are their own validator, else mtime + size
+        tag = os.path.basename(relpath) if HASHED_PATH_RE.search(relpath) \
+            else f"{st.st_mtime_ns:x}-{st.st_size:x}"
+        if encoding:
+            tag += f"-{encoding}"
+        return f'"{tag}"'
+
+    @staticmethod
+    def not_modified(request_headers: Headers, etag: str, st: os.stat_result) -> bool:
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            # Weak comparison, as RFC 9110 requires for If-None-Match
+            tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+            return "*" in tags or etag in tags
+        if_modified_since = request_headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                return int(st.st_mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    @staticmethod
+    def if_range_ok(request_headers: Headers, etag: str, st: os.stat_result) -> bool:
+        if_range = request_headers.get("if-range")
+        if not if_range:
+            return True
+        if if_range.startswith('"'):
+            return if_range == etag  # Strong comparison
+        try:
+            return int(st.st_mtime) == int(parsedate_to_datetime(if_range).timestamp())
+        except (TypeError, ValueError):
+            return False
+
+    # --- Body ---
+
+    async def send_file(self, scope: Scope, send: Send, path: str, status: int, headers: dict,
+                        ranges: list[tuple[int, int]], head: bool):
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()],
+        })
+        if head:
+            await send({"type": "http.response.body", "body": b""})
+            return
+        start, end = ranges[0]
+        async with await anyio.open_file(path, "rb") as f:
+            await self.send_range(scope, send, f, start, end, more_body=False)
+
+    async def send_multipart(self, scope: Scope, send: Send, path: str, headers: dict, content_type: str,
+                             ranges: list[tuple[int, int]], size: int, head: bool):
+        boundary = uuid.uuid4().hex
+        part_headers = [
+            (f"--{boundary}\r\nContent-Type: {content_type}\r\n"
+             f"Content-Range: bytes {start}-{end - 1}/{size}\r\n\r\n").encode("latin-1")
+            for start, end in ranges
+        ]
+        closing = f"\r\n--{boundary}--\r\n".encode("latin-1")
+        length = sum(len(h) + (end - start) for h, (start, end) in zip(part_headers, ranges)) \
+            + 2 * (len(ranges) - 1) + len(closing)
+
+        headers["content-type"] = f"multipart/byteranges; boundary={boundary}"
+        headers["content-length"] = str(length)
+        await send({
+            "type": "http.response.start",
+            "status": 206,
+            "headers": [(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()],
+        })
+        if head:
+            await send({"type": "http.response.body", "body": b""})
+            return
+        async with await anyio.open_file(path, "rb") as f:
+            for i, (part_header, (start, end)) in enumerate(zip(part_headers, ranges)):
+                prefix = b"\r\n" + part_header if i else part_header
+                await send({"type": "http.response.body", "body": prefix, "more_body": True})
+                await self.send_range(scope, send, f, start, end, more_body=True)
+        await send({"type": "http.response.body", "body": closing})
+
+    async def send_range(self, scope: Scope, send: Send, f, start: int, end: int, more_body: bool):
+        if "http.response.zerocopysend" in scope.get("extensions", {}):
+            await send({
+                "type": "http.response.zerocopysend",
+                "file": f.wrapped.fileno(),
+                "offset": start,
+                "count": end - start,
+                "more_body": more_body,
+            })
+            return
+        await f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = await f.read(min(self.chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            await send({
+                "type": "http.response.body",
+                "body": chunk,
+                "more_body": more_body or remaining > 0,
+            })
+        if not more_body and (remaining > 0 or end == start):
+            await send({"type": "http.response.body", "body": b""})  # Close the response
+
+def parse_ranges(header: str, size: int) -> Optional[list[tuple[int, int]]]:
+    """
+    Parses a `Range: bytes=...` header into sorted, merged [start, end) pairs.
+    Returns None to ignore the header (send 200) and [] when unsatisfiable (416).
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec:
+        return None
+
+    ranges = []
+    for part in spec.split(","):
+        first, dash, last = part.strip().partition("-")
+        if not dash:
+            return None
+        try:
+            if first:
+                start = int(first)
+                end = int(last) + 1 if last else size
+            else:
+                if not last:
+                    return None
+                start, end = max(0, size - int(last)), size  # Suffix range: last N bytes
+        except ValueError:
+            return None
+        if start < 0 or end <= start and first and last:
+            return None
+        if start < size:
+            ranges.append((start, min(end, size)))
+
+    if not ranges:
+        return []
+    ranges.sort()
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        if start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged if len(merged) <= MAX_RANGES else None
@@ -0,0 +1,104 @@
+import logging
+from types import MappingProxyType
+from typing import Iterable, Mapping, NamedTuple, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import AsyncSessionLocal
+from app.models.surah import Surah
+from app.core.invalidation import bus
+from app.utils.conditional import SURAH
+
+logger = logging.getLogger(__name__)
+
+class SurahEntry(NamedTuple):
+    id: int
+    name: str
+    arabic_name: Optional[str]
+    english_name: Optional[str]
+    revelation_place: Optional[str]
+    total_verses: Optional[int]
+    description: Optional[str]
+
+    @classmethod
+    def from_model(cls, surah: Surah) -> "SurahEntry":
+        return cls(*(getattr(surah, field) for field in cls._fields))
+
+class SurahCatalog:
+    """
+    Immutable snapshot of the surahs table. Never mutated: writes build a
+    new catalog (with_surah / without_surah) and swap the module reference,
+    so readers always see one consistent version.
+    """
+
+    def __init__(self, entries: Iterable[SurahEntry]):
+        self.entries = tuple(sorted(entries, key=lambda e: e.id))
+        self.by_id: Mapping[int, SurahEntry] = MappingProxyType({e.id: e for e in self.entries})
+        by_name = {}
+        for entry in reversed(self.entries):  # Lowest id wins on duplicate names
+            for name in (entry.english_name, entry.name):
+                if name:
+                    by_name[name.strip().casefold()] = entry
+        self.by_name: Mapping[str, SurahEntry] = MappingProxyType(by_name)
+        # Column views for the vectorized bulk validator
+        self.names: Mapping[int, str] = MappingProxyType({e.id: e.name for e in self.entries})
+        self.total_verses: Mapping[int, Optional[int]] = MappingProxyType(
+            {e.id: e.total_verses for e in self.entries}
+        )
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, surah_id: int) -> Optional[SurahEntry]:
+        return self.by_id.get(surah_id)
+
+    def find(self, name: str) -> Optional[SurahEntry]:
+        """By name or English name, case-insensitive"""
+        return self.by_name.get(name.strip().casefold())
+
+    def verse_in_bounds(self, surah_id: int, ayah: int) -> bool:
+        """1 <= ayah <= total_verses (unknown totals only check the lower bound)"""
+        entry = self.by_id.get(surah_id)
+        if entry is None or ayah < 1:
+            return False
+        return entry.total_verses is None or ayah <= entry.total_verses
+
+    def with_surah(self, entry: SurahEntry) -> "SurahCatalog":
+        return SurahCatalog([*(e for e in self.entries if e.id != entry.id), entry])
+
+    def without_surah(self, surah_id: int) -> "SurahCatalog":
+        return SurahCatalog(e for e in self.entries if e.id != surah_id)
+
+_catalog: Optional[SurahCatalog] = None
+
+async def load_surah_catalog(db: AsyncSession) -> SurahCatalog:
+    """(Re)reads the table and swaps in a fresh snapshot"""
+    global _catalog
+    result = await db.execute(select(Surah))
+    _catalog = SurahCatalog(SurahEntry.from_model(s) for s in result.scalars().all())
+    return _catalog
+
+async def preload_surah_catalog():
+    """Startup hook; a missing/unmigrated database just defers loading to first use"""
+    try:
+        async with AsyncSessionLocal() as db:
+            catalog = await load_surah_catalog(db)
+        logger.info("Surah catalog loaded (%d surahs)", len(catalog))
+    except Exception:
+        logger.exception("Could not preload the surah catalog; will load on first use")
+
+async def get_surah_catalog(db: AsyncSession) -> SurahCatalog:
+    if _catalog is None:
+        return await load_surah_catalog(db)
+    return _catalog
+
+def swap_surah_catalog(catalog: SurahCatalog):
+    global _catalog
+    _catalog = catalog
+
+def invalidate_surah_catalog():
+    """Drop the snapshot; the next reader reloads it from the database"""
+    global _catalog
+    _catalog = None
+
+# The writing process already swapped in its new snapshot; others reload
+bus.subscribe(SURAH, lambda message, remote: remote and invalidate_surah_catalog())
@@ -0,0 +1,66 @@
+import time
+from typing import Optional
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+from app.config import settings
+from app.models.user import User
+from app.utils.cache import TTLCache
+from app.core.invalidation import bus
+
+# Verified JWT payloads by raw token, and user rows by email (get_current_user).
+# Entries are dropped in every app process (invalidation bus) once a user
+# change made through the ORM commits; the TTL bounds staleness for changes
+# made elsewhere (scripts, raw SQL).
+token_cache = TTLCache(maxsize=settings.AUTH_CACHE_SIZE, ttl=settings.AUTH_CACHE_TTL)
+user_cache = TTLCache(maxsize=settings.AUTH_CACHE_SIZE, ttl=settings.AUTH_CACHE_TTL)
+
+USER_FIELDS = tuple(c.key for c in inspect(User).column_attrs)
+
+def remember_payload(token: str, payload: dict):
+    # Never outlive the token itself
+    ttl = payload["exp"] - time.time() if isinstance(payload.get("exp"), (int, float)) else None
+    token_cache.set(token, payload, ttl)
+
+def cached_user(email: str) -> Optional[User]:
+    """A fresh transient User per hit, so requests never share ORM state"""
+    fields = user_cache.get(email)
+    return User(**fields) if fields is not None else None
+
+def remember_user(user: User):
+    user_cache.set(user.email, {name: getattr(user, name) for name in USER_FIELDS})
+
+def invalidate_user(*emails: str):
+    """Forget a user and every cached token issued to them"""
+    for email in emails:
+        if email:
+            user_cache.pop(email)
+            token_cache.discard_where(lambda payload: payload.get("sub") == email)
+
+def clear_auth_cache():
+    token_cache.clear()
+    user_cache.clear()
+
+def auth_cache_stats() -> dict:
+    return {"tokens": token_cache.stats(), "users": user_cache.stats()}
+
+USER_TOPIC = "user"
+
+bus.subscribe(USER_TOPIC, lambda message, remote: invalidate_user(message["key"]))
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _user_changed(mapper, connection, target: User):
+    # Email changes: drop the old address too
+    history = inspect(target).attrs.email.history
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("changed_users", set()).update([target.email, *(history.deleted or ())])
+
+@event.listens_for(Session, "after_commit")
+def _publish_user_changes(session):
+    for email in session.info.pop("changed_users", ()):
+        bus.publish(USER_TOPIC, email)
+
+@event.listens_for(Session, "after_rollback")
+def _forget_user_changes(session):
+    session.info.pop("changed_users", None)
@@ -1,23 +1,57 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
+from app.core.metrics import instrument_engine
+from app.core.query_log import log_statement
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    echo=False
-)
+# Async driver for each sync URL scheme we support
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def get_async_url(url: str) -> str:
+    """Map the configured (sync) DATABASE_URL onto its async driver"""
+    scheme, sep, rest = url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+def engine_options(url: str) -> dict:
+    """Pool settings; SQLite (local/tests) does not take pool sizing"""
+    if url.startswith("sqlite"):
+        return {"echo": False}
+    return {"pool_pre_ping": True, "pool_size": 10, "max_overflow": 20, "echo": False}
+
+# Sync engine: Alembic and CLI scripts (create_admin.py)
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Async engine: request handlers
+async_engine = create_async_engine(
+    get_async_url(settings.DATABASE_URL),
+    **engine_options(settings.DATABASE_URL)
+)
+
+# expire_on_commit=False so objects stay readable after commit without
+# triggering an implicit (and in async, illegal) lazy refresh
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+# Query count / DB time per request and in total (GET /metrics), plus the
+# slow-query log and N+1 detection (app.core.query_log)
+instrument_engine(engine, "sync", observer=log_statement)
+instrument_engine(async_engine.sync_engine, "async", observer=log_statement)
+
 Base = declarative_base()
 
-def get_db():
-    """Dependency for database sessions"""
-    db = SessionLocal()
-    try:
+async def get_db():
+    """Dependency for async database sessions"""
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -1,17 +1,55 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from app.config import settings
+from app.core.static_files import StaticFileServer
+from app.core.body_limit import BodySizeLimitMiddleware, upload_limit
+from app.core.compression import CompressionMiddleware, compression_metrics
+from app.core.metrics import MetricsMiddleware
+from app.core.profiler import ProfilerMiddleware
+from app.core.security import password_hasher
+from app.core.surah_catalog import preload_surah_catalog
+from app.core.invalidation import start_invalidation_bus, stop_invalidation_bus
+from app.utils.images import shutdown_image_pool
+from app.utils.import_jobs import start_import_workers, stop_import_workers
+
+from app.api.deps import get_admin_user, is_admin_token
 
 # Import Routers
-from app.api.v1 import auth, ebooks, videos, surahs, registrations
+from app.api.v1 import auth, ebooks, videos, imports, surahs, registrations, metrics, profiles
 
 import os
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await preload_surah_catalog()
+    await start_invalidation_bus()
+    start_import_workers()
+    yield
+    await stop_import_workers()
+    await stop_invalidation_bus()
+    shutdown_image_pool()
+    password_hasher.shutdown()
+
 app = FastAPI(
     title="WQTC API",
     description="Word for Word Quran Translation Center API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+# Request body caps, checked before multipart parsing spools anything (inside CORS: 413s stay readable)
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    default=upload_limit(settings.MAX_UPLOAD_SIZE),
+    limits={
+        "/api/v1/ebooks/upload-pdf": upload_limit(settings.MAX_PDF_UPLOAD_SIZE),
+        "/api/v1/ebooks/upload-cover": upload_limit(settings.MAX_COVER_UPLOAD_SIZE),
+        "/api/v1/library/imports": upload_limit(settings.MAX_IMPORT_UPLOAD_SIZE),
+        "/api/v1/library/bulk-preview": upload_limit(settings.MAX_IMPORT_UPLOAD_SIZE),
+    },
 )
 
 # CORS
@@ -23,16 +61,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# On-demand profiling of single admin requests (inside compression: profiles the app, not gzip)
+app.add_middleware(ProfilerMiddleware, store=profiles.profile_store, authorize=is_admin_token,
+                   sample_interval=settings.PROFILE_SAMPLE_INTERVAL)
+
+# Compression (wraps CORS-decorated and error responses too)
+if settings.COMPRESSION:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
+
+# Metrics (outermost: latency includes compression)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics.router)
+
 # Static files
 os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-app.mount("/static", StaticFiles(directory=settings.UPLOAD_DIR), name="static")
+app.mount("/static", StaticFileServer(settings.UPLOAD_DIR, max_age=settings.STATIC_MAX_AGE), name="static")
 
 # API routes
 app.include_router(auth.router, prefix="/api/v1")
 app.include_router(ebooks.router, prefix="/api/v1")
 app.include_router(videos.router, prefix="/api/v1")
+app.include_router(imports.router, prefix="/api/v1")
 app.include_router(surahs.router, prefix="/api/v1")
 app.include_router(registrations.router, prefix="/api/v1")
+app.include_router(profiles.router, prefix="/api/v1")
 
 @app.get("/")
 async def root():
@@ -41,3 +94,8 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+@app.get("/api/v1/compression-stats")
+async def get_compression_stats(current_user = Depends(get_admin_user)):
+    """Bytes saved and time spent compressing, per encoding (Admin only)"""
+    return {"code": 200, "msg": "Success", "result": compression_metrics.stats()}
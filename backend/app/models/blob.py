@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, DateTime, BigInteger
+from sqlalchemy.sql import func
+from app.database import Base
+
+class Blob(Base):
+    __tablename__ = "blobs"
+    
+    # Path relative to UPLOAD_DIR, e.g. "pdfs/ab/cd/<sha256>.pdf"
+    path = Column(String(500), primary_key=True)
+    sha256 = Column(String(64), nullable=False, index=True)
+    size = Column(BigInteger, nullable=False)
+    refcount = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
 class EBook(Base):
     __tablename__ = "ebooks"
+    __table_args__ = (
+        # Keyset pagination on /ebooks
+        Index("ix_ebooks_createddate_id", "createddate", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
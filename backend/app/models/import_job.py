@@ -0,0 +1,38 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text, JSON, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+class ImportJob(Base):
+    __tablename__ = "import_jobs"
+    __table_args__ = (
+        # Workers claim the oldest pending job
+        Index("ix_import_jobs_status_created_at", "status", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(20), nullable=False, default="videos")
+    status = Column(String(20), nullable=False, default="pending")  # pending, running, completed, failed
+    filename = Column(String(255), nullable=False)  # As uploaded
+    source_path = Column(String(500), nullable=False)  # Relative to IMPORT_DIR
+    progress = Column(Float, nullable=False, default=0.0)  # 0-100
+    processed_rows = Column(Integer, nullable=False, default=0)
+    inserted_rows = Column(Integer, nullable=False, default=0)
+    rejected_rows = Column(Integer, nullable=False, default=0)
+    error = Column(Text)
+    created_by = Column(String(100))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+
+class ImportRejection(Base):
+    __tablename__ = "import_rejections"
+    __table_args__ = (
+        Index("ix_import_rejections_job_id_row", "job_id", "row"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    job_id = Column(Integer, ForeignKey("import_jobs.id", ondelete="CASCADE"), nullable=False)
+    row = Column(Integer, nullable=False)  # Spreadsheet row number (header is row 1)
+    data = Column(JSON)
+    issues = Column(JSON, nullable=False)
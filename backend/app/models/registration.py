@@ -1,9 +1,17 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
 class ClassRegistration(Base):
     __tablename__ = "class_registrations"
+    __table_args__ = (
+        # Admin list: keyset on (registered_at, id) under each status/language filter combo
+        Index("ix_class_registrations_registered_at_id", "registered_at", "id"),
+        Index("ix_class_registrations_status_registered_at_id", "status", "registered_at", "id"),
+        Index("ix_class_registrations_language_registered_at_id", "preferred_language", "registered_at", "id"),
+        Index("ix_class_registrations_status_language_registered_at_id",
+              "status", "preferred_language", "registered_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
@@ -1,10 +1,19 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index, CheckConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
 
 class Video(Base):
     __tablename__ = "videos"
+    __table_args__ = (
+        # Verse filter on /library (Postgres also has a GiST range index, see migrations)
+        Index("ix_videos_surah_ayah", "surah_no", "starting_ayah", "ending_ayah"),
+        # Keyset pagination on /library (unfiltered and per-surah)
+        Index("ix_videos_created_date_id", "created_date", "id"),
+        Index("ix_videos_surah_created_date_id", "surah_no", "created_date", "id"),
+        # int4range(starting_ayah, ending_ayah) in the GiST index fails on inverted rows
+        CheckConstraint("ending_ayah IS NULL OR ending_ayah >= starting_ayah", name="ck_videos_ayah_order"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
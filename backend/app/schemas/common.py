@@ -1,9 +1,11 @@
 from pydantic import BaseModel
-from typing import TypeVar, Generic, List
+from typing import TypeVar, Generic, List, Optional
 
 T = TypeVar('T')
 
 class ResponseBase(BaseModel, Generic[T]):
     code: int = 200
     msg: str = "Success"
-    result: T
\ No newline at end of file
+    result: T
+    next_cursor: Optional[str] = None  # Set by paged list endpoints
+    total: Optional[int] = None  # Only when a paged endpoint is asked for it
\ No newline at end of file
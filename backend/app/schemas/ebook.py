@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
+from app.utils.images import cover_variant_urls
 
 class EBookBase(BaseModel):
     title: str
@@ -23,6 +24,12 @@ class EBookResponse(EBookBase):
     createdby: str
     createddate: datetime
 
+    # {"webp": url, "w320": url, ...}; empty for covers outside the blob store
+    @computed_field(alias="coverVariants")
+    @property
+    def cover_variants(self) -> Dict[str, str]:
+        return cover_variant_urls(self.cover_image)
+
     class Config:
         from_attributes = True
         populate_by_name = True
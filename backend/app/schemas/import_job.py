@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Any, Optional
+
+class ImportJobResponse(BaseModel):
+    id: int
+    kind: str
+    status: str
+    filename: str
+    progress: float
+    processed_rows: int
+    inserted_rows: int
+    rejected_rows: int
+    error: Optional[str] = None
+    created_by: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class ImportRejectionResponse(BaseModel):
+    row: int
+    data: Optional[dict[str, Any]] = None
+    issues: list[str]
+
+    class Config:
+        from_attributes = True
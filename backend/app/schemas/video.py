@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
 from typing import Optional
 
@@ -12,9 +12,15 @@ class VideoBase(BaseModel):
     keywords: Optional[str] = None
 
 class VideoCreate(VideoBase):
-    pass
+    @model_validator(mode="after")
+    def check_ayah_order(self):
+        # Also a database constraint (ck_videos_ayah_order): fail with 422, not 500
+        if self.starting_ayah is not None and self.ending_ayah is not None \
+                and self.ending_ayah < self.starting_ayah:
+            raise ValueError("ending_ayah is before starting_ayah")
+        return self
 
-class VideoUpdate(VideoBase):
+class VideoUpdate(VideoCreate):
     pass
 
 class VideoResponse(VideoBase):
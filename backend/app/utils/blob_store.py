@@ -0,0 +1,71 @@
+import os
+import logging
+from typing import Iterable, Optional
+from sqlalchemy import select, update, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.models.blob import Blob
+from app.utils.images import cover_derivative_paths
+
+logger = logging.getLogger(__name__)
+
+def ebook_blob_paths(filename: Optional[str], cover_image: Optional[str]) -> list[str]:
+    """Blob keys (relative to UPLOAD_DIR) referenced by an ebook row"""
+    paths = []
+    if filename:
+        paths.append(f"pdfs/{filename.lstrip('/')}")
+    if cover_image:
+        # Stored as "/coverpages/..." (the public URL path)
+        paths.append(cover_image.lstrip("/"))
+    return paths
+
+async def register_blob(db: AsyncSession, path: str, sha256: str, size: int):
+    """
+    Record a freshly uploaded blob (unreferenced until an ebook uses it).
+    Same content uploaded twice at once: the losing insert hits the primary
+    key and the row the other request wrote is kept.
+    """
+    if await db.get(Blob, path) is not None:
+        return
+    db.add(Blob(path=path, sha256=sha256, size=size, refcount=0))
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+
+async def add_refs(db: AsyncSession, paths: Iterable[str]):
+    for path in paths:
+        await db.execute(
+            update(Blob).where(Blob.path == path).values(refcount=Blob.refcount + 1)
+        )
+
+async def release_refs(db: AsyncSession, paths: Iterable[str]) -> list[str]:
+    """
+    Drop one reference per path. Returns the paths that are no longer used;
+    their rows are deleted here, the files via remove_blob_files() after commit.
+    """
+    orphaned = []
+    for path in paths:
+        result = await db.execute(
+            update(Blob).where(Blob.path == path, Blob.refcount > 0)
+                        .values(refcount=Blob.refcount - 1)
+        )
+        if result.rowcount != 1:
+            continue  # Unknown (legacy) path or never referenced
+        refcount = await db.scalar(select(Blob.refcount).where(Blob.path == path))
+        if refcount == 0:
+            await db.execute(delete(Blob).where(Blob.path == path, Blob.refcount == 0))
+            orphaned.append(path)
+    return orphaned
+
+def remove_blob_files(paths: Iterable[str]):
+    """Unlink blob files, plus any cover derivatives generated from them"""
+    paths = [p for path in paths for p in [path, *cover_derivative_paths(path)]]
+    for path in paths:
+        try:
+            os.remove(os.path.join(settings.UPLOAD_DIR, path))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not remove blob %s: %s", path, e)
@@ -0,0 +1,124 @@
+# Imports pandas and numpy: load with app.utils.lazy_import.load_module,
+# never at module level of anything imported at startup
+import numpy as np
+import pandas as pd
+from app.core.surah_catalog import SurahCatalog
+from app.utils.youtube import YOUTUBE_ID_RE
+
+def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Trim / snake_case headers so 'Surah No' and 'surah_no' both work"""
+    df.columns = [str(c).strip().lower().replace(' ', '_') for c in df.columns]
+    return df
+
+def _column(df: pd.DataFrame, name: str, default=np.nan) -> pd.Series:
+    if name in df.columns:
+        return df[name]
+    return pd.Series(default, index=df.index, dtype=object)
+
+def _blank(values: pd.Series) -> pd.Series:
+    """NaN/None or an empty / whitespace-only string"""
+    return values.isna() | values.astype(str).str.strip().eq('')
+
+def _integers(values: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """Coerces to numbers; returns (numbers, mask of values that are not whole numbers)"""
+    numbers = pd.to_numeric(values, errors='coerce').astype(float)
+    invalid = ~np.isfinite(numbers) | (numbers != np.floor(numbers))
+    return numbers, invalid
+
+def _ints_or_none(numbers: pd.Series) -> list:
+    return [None if np.isnan(v) else int(v) for v in numbers.to_numpy(dtype=float)]
+
+def _out_of_range(label: str, totals: np.ndarray):
+    return lambda pos: [
+        f"{label} out of range (1-{t:.0f})" if not np.isnan(t) else f"{label} out of range"
+        for t in totals[pos]
+    ]
+
+def validate_video_frame(df: pd.DataFrame, catalog: SurahCatalog, row_offset: int = 2):
+    """
+    Validates a bulk-upload sheet with column operations (no per-row Python).
+    Returns (valid_rows, invalid_rows) in the bulk-preview response shape;
+    row numbers are index + row_offset (2: header is spreadsheet row 1).
+    """
+    existing_surahs = catalog.names
+    title = _column(df, 'title')
+    url = _column(df, 'youtube_link')
+    url = url.where(~_blank(url), _column(df, 'video_url'))
+    surah_no, bad_surah = _integers(_column(df, 'surah_no', 0))
+    start, bad_start = _integers(_column(df, 'starting_ayah', 0))
+    end, bad_end = _integers(_column(df, 'ending_ayah'))
+    bad_end &= _column(df, 'ending_ayah').notna()  # Optional column
+    keywords = _column(df, 'keywords')
+
+    url_str = url.astype(str)
+    missing_url = _blank(url)
+    bad_url = ~missing_url & url_str.str.extract(YOUTUBE_ID_RE, expand=False).isna()
+    unknown_surah = ~bad_surah & ~surah_no.isin(list(existing_surahs))
+
+    # Ayahs must lie in 1..total_verses of their surah (unknown totals: lower bound only)
+    total = surah_no.map(catalog.total_verses).astype(float)
+    known_surah = ~bad_surah & ~unknown_surah
+    start_out_of_range = known_surah & ~bad_start & ((start < 1) | (start > total))
+    end_out_of_range = known_surah & ~bad_end & (end > total)
+    end_before_start = ~bad_start & ~bad_end & (end < start)
+
+    # One (mask, message) per check, in the order issues are reported;
+    # value-dependent messages are only formatted for the rows that fail
+    surah_values = surah_no.to_numpy()
+    total_values = total.to_numpy()
+    checks = [
+        (_blank(title), "Missing Title"),
+        (missing_url, "Missing URL"),
+        (bad_url, "Invalid YouTube URL"),
+        (bad_surah, "Invalid Surah Number"),
+        (unknown_surah, lambda pos: [f"Surah {s:.0f} does not exist in DB" for s in surah_values[pos]]),
+        (bad_start, "Invalid Starting Ayah"),
+        (start_out_of_range, _out_of_range("Starting Ayah", total_values)),
+        (bad_end, "Invalid Ending Ayah"),
+        (end_out_of_range, _out_of_range("Ending Ayah", total_values)),
+        (end_before_start, "Ending Ayah is before Starting Ayah"),
+    ]
+    masks = np.column_stack([mask.to_numpy(dtype=bool) for mask, _ in checks])
+    has_error = masks.any(axis=1)
+    ok = ~has_error
+
+    valid_rows = [
+        {
+            "title": t,
+            "video_url": u,
+            "surah_no": s,
+            "surah_name": existing_surahs.get(s),
+            "starting_ayah": st,
+            "ending_ayah": en,
+            "keywords": k,
+        }
+        for t, u, s, st, en, k in zip(
+            title[ok].astype(str).tolist(),
+            url_str[ok].tolist(),
+            _ints_or_none(surah_no[ok]),
+            _ints_or_none(start[ok]),
+            _ints_or_none(end[ok]),
+            [None if pd.isna(k) else str(k) for k in keywords[ok].tolist()],
+        )
+    ]
+
+    # Only error rows are materialised as Python objects
+    error_positions = np.flatnonzero(has_error)
+    messages = [
+        msg(error_positions) if callable(msg) else [msg] * len(error_positions)
+        for _, msg in checks
+    ]
+    error_masks = masks[error_positions]
+    error_data = [
+        {k: str(v) for k, v in record.items()}
+        for record in df.iloc[error_positions].to_dict('records')
+    ]
+    invalid_rows = [
+        {
+            "row": int(index) + row_offset,
+            "data": data,
+            "issues": [m[i] for m, flagged in zip(messages, error_masks[i]) if flagged],
+        }
+        for i, (index, data) in enumerate(zip(df.index[error_positions], error_data))
+    ]
+    return valid_rows, invalid_rows
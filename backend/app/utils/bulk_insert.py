@@ -0,0 +1,81 @@
+import logging
+from typing import Optional
+from sqlalchemy import Table, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+def scalar_defaults(table: Table) -> dict:
+    """Python-side column defaults (e.g. created_by) that COPY would not apply"""
+    return {
+        c.name: c.default.arg
+        for c in table.columns
+        if c.default is not None and c.default.is_scalar
+    }
+
+def db_error_message(exc: Exception) -> str:
+    # DBAPIError.__str__ embeds the statement and every parameter; keep the driver's first line
+    error = getattr(exc, "orig", None) or exc
+    error = error.__cause__ or error  # asyncpg's own error under SQLAlchemy's DBAPI adapter
+    lines = str(error).strip().splitlines()
+    return lines[0] if lines else type(error).__name__
+
+async def _copy_rows(db: AsyncSession, table: Table, columns: list[str], rows: list[dict]):
+    """COPY ... FROM STDIN through the session's asyncpg connection"""
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        table.name,
+        schema_name=table.schema,
+        columns=columns,
+        records=[tuple(row[c] for c in columns) for row in rows],
+    )
+
+async def bulk_insert(
+    db: AsyncSession,
+    table: Table,
+    rows: list[dict],
+    batch_size: Optional[int] = None,
+    use_copy: Optional[bool] = None,
+) -> dict:
+    """
+    Inserts `rows` in batches of `batch_size`, committing each batch on its own:
+    COPY on Postgres (asyncpg), a single executemany INSERT elsewhere.
+    A failing batch is rolled back and reported; the other batches still land.
+    """
+    batch_size = max(1, batch_size or settings.BULK_INSERT_BATCH_SIZE)
+    if use_copy is None:
+        use_copy = settings.BULK_INSERT_USE_COPY
+    use_copy = use_copy and db.bind.dialect.name == "postgresql" and db.bind.dialect.driver == "asyncpg"
+
+    # Every row gets the same column set (COPY and executemany both need that)
+    defaults = scalar_defaults(table)
+    columns = list(dict.fromkeys([*(rows[0] if rows else {}), *defaults]))
+    statement = insert(table)
+
+    batches = []
+    inserted = 0
+    for number, start in enumerate(range(0, len(rows), batch_size), start=1):
+        batch = [{**defaults, **row} for row in rows[start:start + batch_size]]
+        report = {"batch": number, "first_row": start, "rows": len(batch), "inserted": 0, "error": None}
+        try:
+            if use_copy:
+                await _copy_rows(db, table, columns, batch)
+            else:
+                await db.execute(statement, batch)
+            await db.commit()
+            report["inserted"] = len(batch)
+            inserted += len(batch)
+        except Exception as e:
+            await db.rollback()
+            report["error"] = db_error_message(e)
+            logger.warning("Bulk insert into %s: batch %d failed: %s", table.name, number, report["error"])
+        batches.append(report)
+
+    return {
+        "inserted": inserted,
+        "failed": len(rows) - inserted,
+        "method": "copy" if use_copy else "executemany",
+        "batches": batches,
+    }
@@ -0,0 +1,79 @@
+import time
+import uuid
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+from fastapi import HTTPException, Request, Response
+from app.config import settings
+from app.core.invalidation import bus
+
+# Public catalog resources whose list endpoints support conditional GET
+SURAH = "surah"
+EBOOKS = "ebooks"
+LIBRARY = "library"
+
+class ResourceVersions:
+    """
+    Version token per resource. Write handlers publish an invalidation on the
+    bus after they commit; every process (the writer included) then sets the
+    token carried by that message, so all workers agree on ETags after the
+    first write. Until then each process uses its own boot id, which also
+    keeps ETags from a previous process from ever matching.
+    """
+
+    def __init__(self):
+        self.boot_id = uuid.uuid4().hex[:8]
+        self._started = time.time()
+        self._versions: dict[str, tuple[str, float]] = {}
+
+    def set(self, resource: str, version: str, modified: float):
+        self._versions[resource] = (version, modified)
+
+    def get(self, resource: str) -> tuple[str, float]:
+        """(version token, last modified as a unix timestamp)"""
+        return self._versions.get(resource, (self.boot_id, self._started))
+
+    def etag(self, resource: str, variant: str = "") -> str:
+        version, _ = self.get(resource)
+        # Each URL (query string) is its own representation
+        digest = hashlib.blake2b(variant.encode(), digest_size=6).hexdigest()
+        return f'"{resource}-{version}-{digest}"'
+
+versions = ResourceVersions()
+
+for _resource in (SURAH, EBOOKS, LIBRARY):
+    bus.subscribe(_resource, lambda message, remote: versions.set(message["topic"], message["version"], message["ts"]))
+
+def cache_control_for(resource: str) -> str:
+    return settings.cache_control_policies.get(resource, settings.CACHE_CONTROL_DEFAULT)
+
+def is_not_modified(request: Request, etag: str, last_modified: float) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+def conditional_get(resource: str):
+    """
+    Route dependency: adds ETag / Last-Modified / Cache-Control and answers
+    a matching If-None-Match (or If-Modified-Since) with 304 before the
+    handler, and so the database, is reached.
+    """
+    async def dependency(request: Request, response: Response):
+        etag = versions.etag(resource, f"{request.url.path}?{request.url.query}")
+        _, last_modified = versions.get(resource)
+        headers = {
+            "ETag": etag,
+            "Last-Modified": formatdate(last_modified, usegmt=True),
+            "Cache-Control": cache_control_for(resource),
+        }
+        if request.method in ("GET", "HEAD") and is_not_modified(request, etag, last_modified):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+    return dependency
@@ -1,20 +1,67 @@
 import os
+import re
+import uuid
+import hashlib
 import aiofiles
-from fastapi import UploadFile
-from datetime import datetime
+from typing import NamedTuple, Optional
+from fastapi import HTTPException, UploadFile
+from app.config import settings
+
+CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+_EXT_RE = re.compile(r"^\.[a-z0-9]{1,8}$")
+
+class SavedUpload(NamedTuple):
+    filename: str  # relative to destination, e.g. "ab/cd/<sha256>.pdf"
+    sha256: str
+    size: int
+
+def blob_name(sha256: str, ext: str) -> str:
+    """Sharded, content-addressed name: the same bytes always get the same path"""
+    return f"{sha256[:2]}/{sha256[2:4]}/{sha256}{ext}"
+
+def safe_extension(filename: Optional[str]) -> str:
+    ext = os.path.splitext(filename or "")[1].lower()
+    return ext if _EXT_RE.match(ext) else ""
+
+async def save_upload_file(
+    upload_file: UploadFile,
+    destination: str,
+    max_size: Optional[int] = None
+) -> SavedUpload:
+    """
+    Stream uploaded file into the content-addressed store under destination.
+    Hashes in the same pass, aborts with 413 once max_size is exceeded and
+    only exposes the file (atomic rename) after it was written completely.
+    Identical content is stored once. By the time this runs Starlette has
+    already spooled the request; BodySizeLimitMiddleware caps that part.
+    """
+    max_size = max_size or settings.MAX_UPLOAD_SIZE
+    if upload_file.size is not None and upload_file.size > max_size:
+        raise HTTPException(status_code=413, detail=f"File exceeds {max_size} bytes")
 
-async def save_upload_file(upload_file: UploadFile, destination: str) -> str:
-    """Save uploaded file to destination directory"""
     os.makedirs(destination, exist_ok=True)
-    
-    # Generate unique filename
-    timestamp = int(datetime.now().timestamp())
-    filename = f"{timestamp}_{upload_file.filename}"
-    file_path = os.path.join(destination, filename)
-    
+    tmp_path = os.path.join(destination, f".{uuid.uuid4().hex}.part")
+
     # Save file
-    async with aiofiles.open(file_path, 'wb') as out_file:
-        content = await upload_file.read()
-        await out_file.write(content)
-    
-    return filename
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with aiofiles.open(tmp_path, 'wb') as out_file:
+            while chunk := await upload_file.read(CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise HTTPException(status_code=413, detail=f"File exceeds {max_size} bytes")
+                digest.update(chunk)
+                await out_file.write(chunk)
+
+        filename = blob_name(digest.hexdigest(), safe_extension(upload_file.filename))
+        file_path = os.path.join(destination, filename)
+        if not os.path.exists(file_path):
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            os.replace(tmp_path, file_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return SavedUpload(filename, digest.hexdigest(), size)
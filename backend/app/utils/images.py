@@ -0,0 +1,92 @@
+import os
+import re
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from PIL import Image, ImageOps
+from app.config import settings
+
+# Covers live in the blob store as coverpages/ab/cd/<sha256>.<ext>; derivatives
+# sit next to them with deterministic names, so URLs can be derived from
+# cover_image alone (no extra columns or lookups):
+#   <sha256>.full.webp   full size WebP
+#   <sha256>.w320.webp   320px wide WebP (never upscaled)
+_COVER_BLOB_RE = re.compile(r"^/?coverpages/([0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64})\.[a-z0-9]+$")
+DERIVATIVE_RE = re.compile(r"^[0-9a-f]{64}\.(full|w\d+)\.webp$")
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+def get_image_pool() -> ProcessPoolExecutor:
+    """Process pool for Pillow work (CPU bound, would block the event loop)"""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=settings.IMAGE_WORKERS)
+    return _pool
+
+def shutdown_image_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+def derivative_names(stem: str, widths: list[int]) -> dict[str, str]:
+    """{"webp": "<stem>.full.webp", "w320": "<stem>.w320.webp", ...}"""
+    names = {"webp": f"{stem}.full.webp"}
+    for width in widths:
+        names[f"w{width}"] = f"{stem}.w{width}.webp"
+    return names
+
+def cover_variant_urls(cover_image: Optional[str]) -> dict[str, str]:
+    """Public derivative URLs for a blob-store cover ({} for legacy covers)"""
+    match = _COVER_BLOB_RE.match(cover_image or "")
+    if not match:
+        return {}
+    return {
+        key: f"/coverpages/{name}"
+        for key, name in derivative_names(match.group(1), settings.cover_widths_list).items()
+    }
+
+def cover_derivative_paths(path: str) -> list[str]:
+    """Derivative files (relative to UPLOAD_DIR) belonging to a cover blob path"""
+    return [url.lstrip("/") for url in cover_variant_urls(path).values()]
+
+def _save_webp(img: Image.Image, dest: str, quality: int):
+    tmp = f"{dest}.{os.getpid()}.part"
+    img.save(tmp, "WEBP", quality=quality, method=4)
+    os.replace(tmp, dest)
+
+def generate_cover_derivatives(src_path: str, widths: list[int], quality: int, force: bool = False) -> int:
+    """
+    Runs in a pool worker: writes the WebP derivatives next to src_path.
+    Returns how many files were written. Raises if Pillow cannot decode the image.
+    """
+    directory = os.path.dirname(src_path)
+    names = derivative_names(os.path.splitext(os.path.basename(src_path))[0], widths)
+    targets = {None: os.path.join(directory, names["webp"])}  # None = full size
+    targets.update({w: os.path.join(directory, names[f"w{w}"]) for w in widths})
+    missing = {w: p for w, p in targets.items() if force or not os.path.exists(p)}
+    if not missing:
+        return 0
+
+    with Image.open(src_path) as img:
+        img = ImageOps.exif_transpose(img)
+        img = img.convert("RGBA" if img.mode in ("RGBA", "LA", "P") else "RGB")
+        for width, dest in missing.items():
+            if width is None or width >= img.width:
+                _save_webp(img, dest, quality)
+            else:
+                height = max(1, round(img.height * width / img.width))
+                _save_webp(img.resize((width, height), Image.LANCZOS), dest, quality)
+    return len(missing)
+
+async def create_cover_derivatives(src_path: str, force: bool = False) -> int:
+    """Generate derivatives for one cover without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_image_pool(),
+        generate_cover_derivatives,
+        src_path,
+        settings.cover_widths_list,
+        settings.COVER_WEBP_QUALITY,
+        force,
+    )
@@ -0,0 +1,213 @@
+import os
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Iterator, Optional
+import anyio
+from sqlalchemy import func, insert, select, update
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.import_job import ImportJob, ImportRejection
+from app.core.surah_catalog import get_surah_catalog
+from app.models.video import Video
+from app.utils.bulk_insert import bulk_insert, db_error_message
+from app.utils.conditional import LIBRARY
+from app.utils.lazy_import import load_module
+from app.core.invalidation import publish
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Jobs live in the import_jobs table (the queue); every app process runs
+# IMPORT_WORKERS tasks that claim pending rows with a conditional UPDATE,
+# so several uvicorn workers on one node can share the queue.
+_workers: list[asyncio.Task] = []
+_wakeup: Optional[asyncio.Event] = None
+
+SHEET_EXTENSIONS = ('.csv', '.xls', '.xlsx')
+
+def read_sheet_chunks(path: str, chunk_size: int) -> Iterator[tuple["pd.DataFrame", float]]:
+    """
+    Yields (chunk, percent of the file read). CSV is parsed incrementally;
+    Excel has no chunked reader, so the sheet is loaded once and sliced.
+    """
+    import pandas as pd  # Not at startup: first next() runs in a worker thread
+
+    if path.endswith('.csv'):
+        size = os.path.getsize(path) or 1
+        with open(path, 'rb') as f:
+            for chunk in pd.read_csv(f, chunksize=chunk_size):
+                yield chunk, min(100.0, 100.0 * f.tell() / size)
+        return
+
+    df = pd.read_excel(path)
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start:start + chunk_size], 100.0 * min(len(df), start + chunk_size) / len(df)
+
+def notify_import_workers():
+    """Wake idle workers (a job was queued by this process)"""
+    if _wakeup is not None:
+        _wakeup.set()
+
+def start_import_workers():
+    global _wakeup
+    if _workers:
+        return
+    _wakeup = asyncio.Event()
+    for number in range(settings.IMPORT_WORKERS):
+        _workers.append(asyncio.create_task(_worker(number), name=f"import-worker-{number}"))
+
+async def stop_import_workers():
+    for task in _workers:
+        task.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+
+async def _worker(number: int):
+    while True:
+        try:
+            await fail_stale_jobs()
+            job_id = await claim_next_job()
+            if job_id is not None:
+                await run_import_job(job_id)
+                continue
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Import worker %d crashed; retrying", number)
+
+        _wakeup.clear()
+        try:
+            await asyncio.wait_for(_wakeup.wait(), timeout=settings.IMPORT_POLL_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+async def claim_next_job() -> Optional[int]:
+    """Marks the oldest pending job running; None when the queue is empty"""
+    async with AsyncSessionLocal() as db:
+        while True:
+            query = select(ImportJob.id).where(ImportJob.status == "pending") \
+                .order_by(ImportJob.created_at, ImportJob.id).limit(1)
+            if db.bind.dialect.name == "postgresql":
+                query = query.with_for_update(skip_locked=True)
+            job_id = (await db.execute(query)).scalar_one_or_none()
+            if job_id is None:
+                await db.rollback()
+                return None
+
+            result = await db.execute(
+                update(ImportJob)
+                .where(ImportJob.id == job_id, ImportJob.status == "pending")
+                .values(status="running", started_at=func.now(), updated_at=func.now())
+            )
+            await db.commit()
+            if result.rowcount == 1:
+                return job_id
+            # Another worker won the race; try the next one
+
+async def fail_stale_jobs():
+    """
+    Running jobs that stopped reporting progress (process killed mid-import)
+    are failed rather than resumed: rows inserted so far are already committed.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.IMPORT_STALE_AFTER)
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(ImportJob)
+            .where(ImportJob.status == "running", ImportJob.updated_at < cutoff)
+            .values(status="failed", error="Interrupted (no progress reported)", finished_at=func.now())
+        )
+        await db.commit()
+
+async def run_import_job(job_id: int):
+    """Parse, validate and insert one job's sheet chunk by chunk, reporting progress per chunk"""
+    async with AsyncSessionLocal() as db:
+        job = await db.get(ImportJob, job_id)
+        source_path = job.source_path  # The ORM object expires on rollback
+        source = os.path.join(settings.IMPORT_DIR, source_path)
+        catalog = await get_surah_catalog(db)
+
+        bulk_import = await load_module("app.utils.bulk_import")
+
+        counts = {"processed_rows": 0, "inserted_rows": 0, "rejected_rows": 0}
+        chunks = read_sheet_chunks(source, settings.IMPORT_CHUNK_SIZE)
+        try:
+            while True:
+                # Parsing and validation are CPU bound: keep them off the event loop
+                item = await anyio.to_thread.run_sync(next, chunks, None)
+                if item is None:
+                    break
+                chunk, progress = item
+                chunk = bulk_import.normalize_columns(chunk)
+                valid_rows, invalid_rows = await anyio.to_thread.run_sync(
+                    bulk_import.validate_video_frame, chunk, catalog
+                )
+
+                rejections = [
+                    {"job_id": job_id, "row": r["row"], "data": r["data"], "issues": r["issues"]}
+                    for r in invalid_rows
+                ]
+                report = await bulk_insert(db, Video.__table__, valid_rows)
+                if report["failed"]:
+                    # Whole batches failed in the database: reject their rows too
+                    invalid = {r["row"] for r in invalid_rows}
+                    valid_numbers = [int(i) + 2 for i in chunk.index if int(i) + 2 not in invalid]
+                    for batch in report["batches"]:
+                        if batch["error"] is None:
+                            continue
+                        first = batch["first_row"]
+                        for row, number in zip(valid_rows[first:first + batch["rows"]],
+                                               valid_numbers[first:first + batch["rows"]]):
+                            rejections.append({
+                                "job_id": job_id,
+                                "row": number,
+                                "data": {k: str(v) for k, v in row.items()},
+                                "issues": [f"Database error: {batch['error']}"],
+                            })
+
+                counts["processed_rows"] += len(chunk)
+                counts["inserted_rows"] += report["inserted"]
+                counts["rejected_rows"] += len(rejections)
+                if rejections:
+                    await db.execute(insert(ImportRejection), rejections)
+                await db.execute(
+                    update(ImportJob).where(ImportJob.id == job_id)
+                    .values(progress=progress, updated_at=func.now(), **counts)
+                )
+                await db.commit()
+                if report["inserted"]:
+                    publish(LIBRARY)
+
+            status, error = "completed", None
+        except Exception as e:
+            await db.rollback()
+            logger.exception("Import job %d failed", job_id)
+            status, error = "failed", db_error_message(e)
+        finally:
+            chunks.close()
+
+        # Only a job still running is ours to finish: fail_stale_jobs() may have
+        # reaped it meanwhile, and its "failed" status stays
+        result = await db.execute(
+            update(ImportJob).where(ImportJob.id == job_id, ImportJob.status == "running")
+            .values(status=status, error=error, finished_at=func.now(), updated_at=func.now(),
+                    progress=100.0 if status == "completed" else ImportJob.progress)
+        )
+        await db.commit()
+        if result.rowcount == 0:
+            logger.warning("Import job %d was reaped as stale before it finished (%s)", job_id, status)
+        await remove_source_if_unused(db, source_path)
+
+async def remove_source_if_unused(db, source_path: str):
+    """Uploads are content-addressed: another queued job may share the file"""
+    result = await db.execute(
+        select(func.count()).select_from(ImportJob)
+        .where(ImportJob.source_path == source_path, ImportJob.status.in_(("pending", "running")))
+    )
+    if result.scalar_one() == 0:
+        try:
+            os.remove(os.path.join(settings.IMPORT_DIR, source_path))
+        except FileNotFoundError:
+            pass
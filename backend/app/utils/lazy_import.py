@@ -0,0 +1,20 @@
+import sys
+import importlib
+from types import ModuleType
+import anyio
+
+# Loaded on first use, never at startup: only admin sheet uploads need them,
+# and each one costs every worker import time and resident memory.
+# (startup_report.py fails when one of these shows up after `import app.main`.)
+LAZY_MODULES = ("pandas", "numpy", "openpyxl", "app.utils.bulk_import")
+
+async def load_module(name: str) -> ModuleType:
+    """
+    Imports `name` in a worker thread the first time (a cold pandas import
+    would stall the event loop for a few hundred ms); afterwards it is a
+    sys.modules lookup.
+    """
+    module = sys.modules.get(name)
+    if module is None:
+        module = await anyio.to_thread.run_sync(importlib.import_module, name)
+    return module
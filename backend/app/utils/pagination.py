@@ -0,0 +1,125 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional
+from fastapi import HTTPException
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.core.invalidation import bus
+from app.utils.cache import TTLCache
+
+# SQLite keeps timestamps as text: "YYYY-MM-DD HH:MM:SS.ffffff" when written
+# from Python, without the fraction when set by CURRENT_TIMESTAMP
+SQLITE_TS_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+SQLITE_TS_LENGTH = 26
+
+def sqlite_timestamp(column):
+    """Stored text padded to microseconds, so both forms order and compare alike"""
+    return func.substr(column.op("||")(".000000"), 1, SQLITE_TS_LENGTH)
+
+def page_size(limit) -> int:
+    """Requested page size, clamped to the server maximum"""
+    try:
+        size = int(limit) if limit else settings.DEFAULT_PAGE_SIZE
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid limit")
+    return max(1, min(size, settings.MAX_PAGE_SIZE))
+
+def encode_cursor(data: dict) -> str:
+    raw = json.dumps(data, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(data, dict):
+            raise ValueError
+        return data
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def keyset_cursor(created: Optional[datetime], row_id: int) -> str:
+    """Opaque token for the position just after (created, row_id)"""
+    return encode_cursor({"k": [created.isoformat() if created else None, row_id]})
+
+def apply_keyset(query: Select, created_col, id_col, cursor: Optional[str], descending: bool,
+                 dialect: str = "postgresql") -> Select:
+    """
+    Orders by (created, id) and, when a cursor is given, seeks past it.
+    Backed by the composite (created, id) indexes, so every page costs the same.
+    """
+    if dialect == "sqlite":
+        # ORDER BY and the seek below must use the same representation
+        created_col = sqlite_timestamp(created_col)
+    if descending:
+        query = query.order_by(created_col.desc(), id_col.desc())
+    else:
+        query = query.order_by(created_col.asc(), id_col.asc())
+
+    if cursor:
+        try:
+            created, row_id = decode_cursor(cursor)["k"]
+            position = (datetime.fromisoformat(created), int(row_id))
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if dialect == "sqlite":
+            position = (position[0].strftime(SQLITE_TS_FORMAT), position[1])
+        key = tuple_(created_col, id_col)
+        query = query.where(key < position if descending else key > position)
+    return query
+
+def apply_offset(query: Select, cursor: Optional[str]) -> tuple[Select, int]:
+    """Offset cursor, for orderings with no indexable key (e.g. search rank)"""
+    offset = 0
+    if cursor:
+        try:
+            offset = max(0, int(decode_cursor(cursor)["o"]))
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    return query.offset(offset), offset
+
+async def explain(db: AsyncSession, query: Select, options: str = "FORMAT JSON"):
+    """
+    EXPLAIN of a select with its parameters bound by the driver (never
+    inlined into the SQL text). Postgres only; returns the plan column.
+    """
+    conn = await db.connection()
+    compiled = query.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+    params = compiled.construct_params()
+    if compiled.positiontup is not None:  # asyncpg / psycopg numbered placeholders
+        params = tuple(params[name] for name in compiled.positiontup)
+    result = await conn.exec_driver_sql(f"EXPLAIN ({options}) {compiled.string}", params)
+    return [row[0] for row in result]
+
+async def estimate_count(db: AsyncSession, query: Select) -> int:
+    """Planner row estimate (Postgres); cheap but approximate"""
+    plan = (await explain(db, query.order_by(None)))[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+class CountCache:
+    """
+    Exact COUNT(*) results per filter key, reused for `ttl` seconds and kept
+    for at most `maxsize` keys. invalidate() publishes `topic`, so every app
+    process drops its counts after a write, not only the writer.
+    """
+
+    def __init__(self, topic: str, ttl: float, maxsize: int = 256):
+        self.topic = topic
+        self._counts = TTLCache(maxsize, ttl)
+        bus.subscribe(topic, lambda message, remote: self._counts.clear())
+
+    async def get(self, db: AsyncSession, key, query: Select) -> int:
+        total = self._counts.get(key)
+        if total is not None:
+            return total
+        total = await db.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+        self._counts.set(key, total)
+        return total
+
+    def invalidate(self):
+        """Call after the write has committed"""
+        bus.publish(self.topic)
@@ -0,0 +1,64 @@
+from typing import Awaitable, Callable, Hashable, Mapping, Optional
+from fastapi import Request, Response
+from pydantic import BaseModel
+from app.config import settings
+from app.core.compression import compress_async, compression_metrics, negotiate_encoding, weak_etag
+from app.utils.cache import TTLCache
+from app.utils.conditional import versions
+
+class EncodedJSON:
+    """A response body encoded once, plus its br / gzip variants (each built on first use)"""
+
+    __slots__ = ("body", "_variants")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self._variants: dict[str, bytes] = {}
+
+    async def compressed(self, encoding: str) -> tuple[bytes, bool]:
+        """(compressed body, whether it was reused from an earlier request)"""
+        variant = self._variants.get(encoding)
+        if variant is not None:
+            return variant, True
+        variant = self._variants[encoding] = await compress_async(self.body, encoding)
+        return variant, False
+
+# Encoded list pages keyed by (resource, data version, variant). A write
+# changes the version, so stale entries are never read again and just age out.
+response_cache = TTLCache(settings.RESPONSE_CACHE_SIZE, settings.RESPONSE_CACHE_TTL)
+
+def version_key(resource: str, *variant: Hashable) -> tuple:
+    return (resource, versions.get(resource)[0], *variant)
+
+def encode_json(model: type[BaseModel], content) -> EncodedJSON:
+    """
+    Validates like FastAPI's response_model (ORM attributes, aliases) and
+    serializes in one step; the bytes match what the route would have sent.
+    """
+    return EncodedJSON(model.model_validate(content, from_attributes=True).model_dump_json(by_alias=True).encode())
+
+async def cached_json(key: tuple, build: Callable[[], Awaitable[EncodedJSON]]) -> EncodedJSON:
+    encoded = response_cache.get(key)
+    if encoded is None:
+        encoded = await build()
+        response_cache.set(key, encoded)
+    return encoded
+
+async def json_response(request: Request, encoded: EncodedJSON,
+                        headers: Optional[Mapping[str, str]] = None) -> Response:
+    """
+    Sends pre-encoded JSON, compressed here (not by CompressionMiddleware)
+    so the compressed bytes are kept with the cache entry and reused.
+    `headers`: e.g. those set by conditional_get, which FastAPI drops when a
+    route returns its own Response.
+    """
+    response_headers = {**(headers or {}), "Vary": "Accept-Encoding"}
+    body = encoded.body
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    if settings.COMPRESSION and encoding and len(body) >= settings.COMPRESSION_MIN_SIZE:
+        body, reused = await encoded.compressed(encoding)
+        compression_metrics.sent(encoding, len(encoded.body), len(body), reused=reused)
+        response_headers["Content-Encoding"] = encoding
+        if "etag" in response_headers:
+            response_headers["etag"] = weak_etag(response_headers["etag"])
+    return Response(content=body, media_type="application/json", headers=response_headers)
@@ -0,0 +1,58 @@
+import re
+from sqlalchemy import Select, or_, func, literal_column
+from app.models.video import Video
+
+# Maintained by Postgres (generated column, see migration 3b7e2c91d4a0);
+# not mapped on the model so SQLite/test schemas stay portable
+SEARCH_VECTOR = literal_column("videos.search_vector")
+TS_CONFIG = "simple"
+
+# Trigram similarity used for typo fallback (pg_trgm default is 0.3)
+TRGM_WEIGHT = 0.5
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+def search_terms(search: str) -> list[str]:
+    """Split user input into safe tsquery / LIKE terms"""
+    return _TERM_RE.findall(search.lower())
+
+def escape_like(term: str) -> str:
+    """LIKE wildcards matched literally (\\w keeps "_"); use with escape="\\\\" """
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def prefix_tsquery(terms: list[str]) -> str:
+    """'al fat' -> 'al:* & fat:*' (every term, prefix matched)"""
+    return " & ".join(f"{t}:*" for t in terms)
+
+def apply_video_search(query: Select, search: str, dialect: str) -> tuple[Select, object]:
+    """
+    Adds the search filter to a Video select.
+    Returns the filtered query and a rank expression (None when unranked).
+    """
+    terms = search_terms(search)
+    if not terms:
+        return query, None
+
+    if dialect == "postgresql":
+        tsquery = func.to_tsquery(TS_CONFIG, prefix_tsquery(terms))
+        # `%` is the pg_trgm similarity operator, served by the gin_trgm_ops indexes
+        query = query.where(
+            or_(
+                SEARCH_VECTOR.op("@@")(tsquery),
+                Video.title.op("%")(search),
+                Video.surah_name.op("%")(search),
+            )
+        )
+        rank = func.ts_rank_cd(SEARCH_VECTOR, tsquery) + \
+            TRGM_WEIGHT * func.similarity(Video.title, search)
+        return query, rank
+
+    # Fallback (SQLite / tests)
+    return apply_like_search(query, terms, (Video.title, Video.surah_name, Video.keywords)), None
+
+def apply_like_search(query: Select, terms: list[str], columns) -> Select:
+    """Every term must appear (case-insensitive substring) in one of the columns"""
+    for term in terms:
+        pattern = f"%{escape_like(term)}%"
+        query = query.where(or_(*(column.ilike(pattern, escape="\\") for column in columns)))
+    return query
@@ -0,0 +1,53 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+from app.utils.cache import TTLCache
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key onto one execution: the
+    first caller starts it, later callers await the same result (or error).
+    The work runs in its own task, so one caller disconnecting does not
+    cancel it for the others. With ttl > 0 the result is also reused for
+    that many seconds after it completes.
+    """
+
+    def __init__(self, ttl: float = 0.0, maxsize: int = 256):
+        self.requests = 0
+        self.executions = 0
+        self.joined = 0
+        self._recent = TTLCache(maxsize, ttl)
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self.requests += 1
+        result = self._recent.get(key)
+        if result is not None:
+            return result
+
+        future = self._inflight.get(key)
+        if future is None:
+            self.executions += 1
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._finished(key, f))
+        else:
+            self.joined += 1
+        return await asyncio.shield(future)
+
+    def _finished(self, key: Hashable, future: asyncio.Future):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # Also marks the exception retrieved when every caller went away
+        if not future.cancelled() and future.exception() is None:
+            self._recent.set(key, future.result())
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "executions": self.executions,
+            "joined_in_flight": self.joined,
+            "cache_hits": self._recent.hits,
+            "in_flight": len(self._inflight),
+            # Share of requests that did not run their own query
+            "coalescing_ratio": round(1 - self.executions / self.requests, 4) if self.requests else None,
+        }
@@ -0,0 +1,67 @@
+from fastapi import HTTPException
+from sqlalchemy import Select, and_, or_, func, literal_column
+from app.models.video import Video
+
+# Closed [starting_ayah, ending_ayah] range; a NULL ending_ayah gives an
+# open-ended range. Must stay identical to the ix_videos_surah_ayah_range
+# expression (see migration 8d41f0a6c3e5) or Postgres will not use the index,
+# hence the bounds are a literal rather than a bind parameter.
+RANGE_BOUNDS = literal_column("'[]'")
+
+def ayah_range():
+    return func.int4range(Video.starting_ayah, Video.ending_ayah, RANGE_BOUNDS)
+
+def parse_versus(versus) -> tuple[int, int] | None:
+    """
+    "1-5" -> (1, 5) range mode, 3 / "3" -> (3, 3) point mode.
+    Returns None for unparsable input; an inverted range ("5-1") is a 400.
+    """
+    try:
+        if isinstance(versus, str) and '-' in versus:
+            start, end = map(int, versus.split('-'))
+            if start > end:
+                # int4range(5, 1) is an error on Postgres, not an empty range
+                raise HTTPException(status_code=400, detail="Invalid verse range: start is after end")
+            return start, end
+        ayah_num = int(versus)
+        return ayah_num, ayah_num
+    except ValueError:
+        return None
+
+def apply_verse_filter(query: Select, versus, dialect: str) -> Select:
+    """Adds the ayah point / range filter to a Video select"""
+    bounds = parse_versus(versus)
+    if bounds is None:
+        return query  # Ignore invalid versus inputs
+    start, end = bounds
+    is_range = isinstance(versus, str) and '-' in versus
+
+    if dialect == "postgresql":
+        # Served by the GiST index on (surah_no, ayah_range())
+        if is_range:
+            # Whole video lies inside the requested range
+            wanted = func.int4range(start, end, RANGE_BOUNDS)
+            return query.where(
+                Video.ending_ayah.isnot(None),
+                ayah_range().op("<@")(wanted)
+            )
+        # Video covers this ayah
+        return query.where(
+            Video.starting_ayah.isnot(None),
+            ayah_range().op("@>")(start)
+        )
+
+    # Fallback (SQLite / tests): B-tree (surah_no, starting_ayah, ending_ayah)
+    if is_range:
+        return query.where(
+            and_(
+                Video.starting_ayah >= start,
+                Video.ending_ayah <= end
+            )
+        )
+    return query.where(
+        and_(
+            Video.starting_ayah <= start,
+            or_(Video.ending_ayah >= start, Video.ending_ayah.is_(None))
+        )
+    )
@@ -0,0 +1,10 @@
+import re
+
+# Anything followed by an 11 character id after "v=" or "/" (watch, embed, youtu.be, v/)
+YOUTUBE_ID_RE = re.compile(r'(?:v=|/)([0-9A-Za-z_-]{11})')
+
+def extract_youtube_id(url: str) -> str | None:
+    if not isinstance(url, str):
+        return None
+    match = YOUTUBE_ID_RE.search(url)
+    return match.group(1) if match else None
@@ -0,0 +1,44 @@
+# backfill_covers.py
+"""
+Generate WebP cover derivatives for every cover in the blob store.
+
+    python backfill_covers.py [--force]
+
+Run migrate_uploads.py first so legacy covers are in the blob store.
+"""
+import os
+import sys
+from concurrent.futures import as_completed
+from app.config import settings
+from app.utils.images import DERIVATIVE_RE, generate_cover_derivatives, get_image_pool, shutdown_image_pool
+
+def cover_files() -> list[str]:
+    root = os.path.join(settings.UPLOAD_DIR, "coverpages")
+    paths = []
+    for dirpath, _, files in os.walk(root):
+        for name in files:
+            if name.startswith(".") or DERIVATIVE_RE.match(name):
+                continue
+            paths.append(os.path.join(dirpath, name))
+    return paths
+
+def main():
+    force = "--force" in sys.argv
+    pool = get_image_pool()
+    futures = {
+        pool.submit(generate_cover_derivatives, path, settings.cover_widths_list,
+                    settings.COVER_WEBP_QUALITY, force): path
+        for path in cover_files()
+    }
+    written = failed = 0
+    for future in as_completed(futures):
+        try:
+            written += future.result()
+        except Exception as e:
+            failed += 1
+            print(f"Skipped {futures[future]}: {e}")
+    shutdown_image_pool()
+    print(f"Processed {len(futures)} cover(s): {written} derivative(s) written, {failed} failed.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Minimal in-process ASGI driver: no sockets, no HTTP client dependency"""
+import asyncio
+import time
+from typing import Iterable, Optional
+
+async def call(app, method: str, path: str, headers: Iterable[tuple[str, str]] = (),
+               body: bytes = b"", query_string: bytes = b"") -> tuple[int, dict, int]:
+    """Runs one request through `app`; returns (status, headers, body length)"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string,
+        "root_path": "",
+        "headers": [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.sleep(3600)  # Client never disconnects mid-request
+        return {"type": "http.disconnect"}
+
+    status, response_headers, length = 0, {}, 0
+
+    async def send(message):
+        nonlocal status, response_headers, length
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in message["headers"]}
+        elif message["type"] == "http.response.body":
+            length += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, response_headers, length
+
+async def run_load(make_request, total: int, concurrency: int) -> dict:
+    """
+    Calls `await make_request(i)` `total` times with at most `concurrency` in flight.
+    Returns throughput and latency percentiles (ms).
+    """
+    latencies: list[float] = []
+    counter = iter(range(total))
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            try:
+                await make_request(i)
+            except Exception:
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {"requests": total, "errors": errors, "seconds": elapsed,
+            "rps": total / elapsed if elapsed else 0.0, **percentiles(latencies)}
+
+def percentiles(samples: list[float], points: Optional[Iterable[int]] = (50, 95, 99)) -> dict:
+    if not samples:
+        return {f"p{p}": 0.0 for p in points}
+    ordered = sorted(samples)
+    return {f"p{p}": ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] for p in points}
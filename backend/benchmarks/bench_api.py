@@ -0,0 +1,188 @@
+"""
+Latency and throughput of the public API at fixed concurrency, in process.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_api \\
+        [--requests 2000] [--concurrency 32] [--scenarios library_surah ebooks ...] \\
+        [--cold] [--output results.json] [--compare previous.json]
+
+Seed the database first (python -m benchmarks.seed). Requests go straight
+into the ASGI app (lifespan and middleware included), so numbers exclude
+sockets and HTTP parsing. Parameters vary per request (surah, verse, search
+term), so the response cache sees a realistic mix; --cold clears it
+before every request to measure the query path. Results are written as JSON
+(default benchmarks/results/<UTC time>.json); --compare prints the change
+against an earlier file.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import time
+from urllib.parse import urlencode
+from sqlalchemy import func, select
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.main import app
+from app.models.ebook import EBook
+from app.models.registration import ClassRegistration
+from app.models.video import Video
+from app.utils.responses import response_cache
+from benchmarks.asgi import call, run_load
+from benchmarks.seed import ADMIN_EMAIL, ADMIN_PASSWORD, LANGUAGES, SURAH_VERSES, TOPICS
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# Relative change beyond which --compare flags a metric
+REGRESSION_THRESHOLD = 0.10
+
+def library_surah(rng: random.Random, i: int):
+    return "GET", "/api/v1/library", {"surah": rng.randint(1, 114)}, None
+
+def library_verse(rng: random.Random, i: int):
+    surah = rng.randint(1, 114)
+    verse = rng.randint(1, SURAH_VERSES[surah - 1])
+    # Single verses and short ranges, as the verse picker sends them
+    versus = str(verse) if rng.random() < 0.5 else f"{verse}-{min(SURAH_VERSES[surah - 1], verse + 4)}"
+    return "GET", "/api/v1/library", {"surah": surah, "versus": versus}, None
+
+def library_search(rng: random.Random, i: int):
+    return "GET", "/api/v1/library", {"search": rng.choice(TOPICS)}, None
+
+def ebooks(rng: random.Random, i: int):
+    return "GET", "/api/v1/ebooks", {"limit": 20}, None
+
+def surahs(rng: random.Random, i: int):
+    return "GET", "/api/v1/surah", {}, None
+
+def auth_login(rng: random.Random, i: int):
+    return "POST", "/api/v1/auth/login", {}, {"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD}
+
+def class_registration(rng: random.Random, i: int):
+    return "POST", "/api/v1/class-registration", {}, {
+        "name": f"Bench Student {i}",
+        "email": f"bench{i}.{rng.getrandbits(32):x}@example.com",
+        "phone": "+919000000000",
+        "country": "India",
+        "language": rng.choice(LANGUAGES),
+        "classType": "Online",
+        "timing": "Evening",
+        "days": "Weekends",
+        "contactNumber": "+919000000000",
+    }
+
+# name -> (request builder, expected status, request cap)
+SCENARIOS = {
+    "library_surah": (library_surah, 200, None),
+    "library_verse": (library_verse, 200, None),
+    "library_search": (library_search, 200, None),
+    "ebooks": (ebooks, 200, None),
+    "surah": (surahs, 200, None),
+    # bcrypt-bound (PASSWORD_HASH_WORKERS threads): a few requests per second
+    "auth_login": (auth_login, 200, 200),
+    "class_registration": (class_registration, 200, None),
+}
+
+async def run_scenario(name: str, total: int, concurrency: int, cold: bool, seed: int) -> dict:
+    build, expected, cap = SCENARIOS[name]
+    total = min(total, cap or total)
+    rng = random.Random(seed)
+    statuses: dict[int, int] = {}
+
+    async def make_request(i: int):
+        method, path, params, payload = build(rng, i)
+        headers = [("accept-encoding", "br, gzip")]
+        body = b""
+        if payload is not None:
+            body = json.dumps(payload).encode()
+            headers.append(("content-type", "application/json"))
+        if cold:
+            response_cache.clear()
+        status, _, _ = await call(app, method, path, headers, body, urlencode(params).encode())
+        statuses[status] = statuses.get(status, 0) + 1
+        if status != expected:
+            raise RuntimeError(f"{method} {path}: {status}")
+
+    # Warm-up: connection pool, surah catalog, first compilation of each statement
+    await run_load(make_request, min(total, concurrency * 2), concurrency)
+    statuses.clear()
+    result = await run_load(make_request, total, concurrency)
+    result["statuses"] = {str(s): n for s, n in sorted(statuses.items())}
+    return result
+
+async def table_counts() -> dict:
+    async with AsyncSessionLocal() as db:
+        return {
+            name: await db.scalar(select(func.count()).select_from(model))
+            for name, model in (("videos", Video), ("ebooks", EBook), ("registrations", ClassRegistration))
+        }
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(previous: dict, current: dict):
+    """Prints relative change per scenario; latency up or throughput down is a regression"""
+    print(f"\nvs {previous.get('created_at')} ({previous.get('git')})")
+    for key in ("database", "concurrency", "cold"):
+        if previous.get(key) != current.get(key):
+            print(f"warning: {key} differs ({previous.get(key)} -> {current.get(key)}), not like for like")
+    print(f"{'scenario':<20} {'metric':<6} {'before':>10} {'after':>10} {'change':>8}")
+    for name, after in current["scenarios"].items():
+        before = previous.get("scenarios", {}).get(name)
+        if before is None:
+            continue
+        for metric in ("p50", "p95", "p99", "rps"):
+            old, new = before[metric], after[metric]
+            change = (new - old) / old if old else 0.0
+            worse = change < -REGRESSION_THRESHOLD if metric == "rps" else change > REGRESSION_THRESHOLD
+            print(f"{name:<20} {metric:<6} {old:>10.2f} {new:>10.2f} {change:>+7.0%}{'  REGRESSION' if worse else ''}")
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000, help="per scenario")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--cold", action="store_true", help="clear the response cache before every request")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output")
+    parser.add_argument("--compare", help="earlier results file")
+    args = parser.parse_args()
+
+    results = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "git": git_revision(),
+        "python": platform.python_version(),
+        "database": settings.DATABASE_URL.split(":", 1)[0],
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "cold": args.cold,
+        "scenarios": {},
+    }
+
+    async with app.router.lifespan_context(app):
+        results["rows"] = await table_counts()
+        print(f"{'scenario':<20} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+        for name in args.scenarios:
+            result = await run_scenario(name, args.requests, args.concurrency, args.cold, args.seed)
+            results["scenarios"][name] = result
+            print(f"{name:<20} {result['rps']:>8.0f} {result['p50']:>8.2f} {result['p95']:>8.2f} "
+                  f"{result['p99']:>8.2f} {result['errors']:>7}")
+
+    output = args.output or os.path.join(RESULTS_DIR, time.strftime("%Y%m%dT%H%M%SZ", time.gmtime()) + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), results)
+
+if __name__ == "__main__":
+    asyncio.run(main())
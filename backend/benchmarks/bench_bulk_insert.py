@@ -0,0 +1,83 @@
+"""
+Bulk video import throughput: per-object ORM adds vs batched executemany vs COPY.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_bulk_insert \\
+        [--rows 10000 100000 1000000] [--methods orm executemany copy] [--batch-size 5000]
+
+Point DATABASE_URL at a scratch database: tables are created if missing and
+the videos table is emptied before every run.
+"""
+import argparse
+import asyncio
+import random
+import time
+from sqlalchemy import delete
+from app.database import AsyncSessionLocal, Base, engine
+from app.models.surah import Surah
+from app.models.video import Video
+from app.utils.bulk_insert import bulk_insert
+
+def make_rows(count: int, seed: int = 11) -> list[dict]:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        start = rng.randint(1, 280)
+        rows.append({
+            "title": f"Lesson {i}",
+            "video_url": f"https://www.youtube.com/watch?v={i:011d}",
+            "surah_no": rng.randint(1, 114),
+            "surah_name": None,
+            "starting_ayah": start,
+            "ending_ayah": start + rng.randint(0, 10),
+            "keywords": "tafsir, word by word",
+        })
+    return rows
+
+async def prepare():
+    Base.metadata.create_all(engine)
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Video))
+        for number in range(1, 115):
+            if await db.get(Surah, number) is None:
+                db.add(Surah(id=number, name=f"Surah {number}", total_verses=286))
+        await db.commit()
+
+async def insert_orm(rows: list[dict], batch_size: int) -> int:
+    """The pre-batching endpoint: one Video object per row, one transaction"""
+    async with AsyncSessionLocal() as db:
+        for row in rows:
+            db.add(Video(**row))
+        await db.commit()
+    return len(rows)
+
+async def insert_batched(rows: list[dict], batch_size: int, use_copy: bool) -> int:
+    async with AsyncSessionLocal() as db:
+        report = await bulk_insert(db, Video.__table__, rows, batch_size=batch_size, use_copy=use_copy)
+    assert not report["failed"], report
+    return report["inserted"]
+
+METHODS = {
+    "orm": insert_orm,
+    "executemany": lambda rows, batch_size: insert_batched(rows, batch_size, use_copy=False),
+    "copy": lambda rows, batch_size: insert_batched(rows, batch_size, use_copy=True),
+}
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--methods", nargs="+", choices=list(METHODS), default=list(METHODS))
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'rows':>9} {'method':<12} {'seconds':>9} {'rows/s':>10}")
+    for count in args.rows:
+        rows = make_rows(count)
+        for method in args.methods:
+            await prepare()
+            start = time.perf_counter()
+            inserted = await METHODS[method](rows, args.batch_size)
+            elapsed = time.perf_counter() - start
+            print(f"{count:>9} {method:<12} {elapsed:>9.2f} {inserted / elapsed:>10.0f}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,118 @@
+"""
+Bulk-preview validation: vectorized validate_video_frame vs the old iterrows loop.
+
+    python -m benchmarks.bench_bulk_preview [--rows 100000] [--skip-legacy]
+
+Builds a synthetic sheet (~5% bad rows of every kind), checks both
+implementations agree and prints wall time and speedup.
+"""
+import argparse
+import random
+import time
+import pandas as pd
+from app.core.surah_catalog import SurahCatalog, SurahEntry
+from app.utils.bulk_import import YOUTUBE_ID_RE, validate_video_frame
+
+SURAHS = {i: f"Surah {i}" for i in range(1, 115)}
+# No total_verses: the legacy loop had no ayah bounds checks to compare against
+CATALOG = SurahCatalog(SurahEntry(i, name, None, None, None, None, None) for i, name in SURAHS.items())
+
+def make_fixture(rows: int, seed: int = 7) -> pd.DataFrame:
+    rng = random.Random(seed)
+    data = {"title": [], "youtube_link": [], "surah_no": [], "starting_ayah": [],
+            "ending_ayah": [], "keywords": []}
+    for i in range(rows):
+        start = rng.randint(1, 280)
+        data["title"].append(f"Lesson {i}")
+        data["youtube_link"].append(f"https://www.youtube.com/watch?v={i:011d}")
+        data["surah_no"].append(rng.randint(1, 114))
+        data["starting_ayah"].append(start)
+        data["ending_ayah"].append(start + rng.randint(0, 10) if rng.random() > 0.1 else None)
+        data["keywords"].append("tafsir, word by word" if rng.random() > 0.5 else None)
+        roll = rng.random()
+        if roll < 0.01:
+            data["title"][-1] = None
+        elif roll < 0.02:
+            data["youtube_link"][-1] = "not a link"
+        elif roll < 0.03:
+            data["surah_no"][-1] = 200
+        elif roll < 0.04:
+            data["surah_no"][-1] = "abc"
+        elif roll < 0.05:
+            data["starting_ayah"][-1] = "x"
+    return pd.DataFrame(data)
+
+def legacy_validate(df: pd.DataFrame, existing_surahs: dict):
+    """The pre-vectorization loop from bulk_video_preview (for comparison)"""
+    def extract_youtube_id(url):
+        if not isinstance(url, str):
+            return None
+        match = YOUTUBE_ID_RE.search(url)
+        return match.group(1) if match else None
+
+    valid_rows, errors = [], []
+    for index, row in df.iterrows():
+        row_errors = []
+        title = row.get('title', '')
+        url = row.get('youtube_link', '') or row.get('video_url', '')
+        surah_no = row.get('surah_no', 0)
+        start = row.get('starting_ayah', 0)
+        end = row.get('ending_ayah', None)
+        keywords = row.get('keywords', '')
+        if not title or pd.isna(title):
+            row_errors.append("Missing Title")
+        if not url or pd.isna(url):
+            row_errors.append("Missing URL")
+        elif not extract_youtube_id(str(url)):
+            row_errors.append("Invalid YouTube URL")
+        try:
+            s_no = int(surah_no)
+            if s_no not in existing_surahs:
+                row_errors.append(f"Surah {s_no} does not exist in DB")
+        except (TypeError, ValueError):
+            row_errors.append("Invalid Surah Number")
+            s_no = None
+        try:
+            st_ayah = int(start)
+        except (TypeError, ValueError):
+            row_errors.append("Invalid Starting Ayah")
+            st_ayah = None
+        if not row_errors:
+            valid_rows.append({
+                "title": str(title), "video_url": str(url), "surah_no": s_no,
+                "surah_name": existing_surahs.get(s_no), "starting_ayah": st_ayah,
+                "ending_ayah": int(end) if pd.notna(end) else None,
+                "keywords": str(keywords) if pd.notna(keywords) else None
+            })
+        else:
+            errors.append({"row": index + 2, "data": {k: str(v) for k, v in row.items()}, "issues": row_errors})
+    return valid_rows, errors
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    df = make_fixture(args.rows)
+    (valid, invalid), vectorized = timed(validate_video_frame, df, CATALOG)
+    print(f"{args.rows} rows: {len(valid)} valid, {len(invalid)} invalid")
+    print(f"vectorized: {vectorized:8.3f} s")
+    if args.skip_legacy:
+        return
+
+    (old_valid, old_invalid), legacy = timed(legacy_validate, df, SURAHS)
+    print(f"iterrows:   {legacy:8.3f} s")
+    print(f"speedup:    {legacy / vectorized:8.1f}x")
+    assert valid == old_valid, "valid rows differ"
+    assert [r["row"] for r in invalid] == [r["row"] for r in old_invalid], "invalid rows differ"
+    assert [r["issues"] for r in invalid] == [r["issues"] for r in old_invalid], "issues differ"
+    print("results identical")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Per-request CPU for a large /library listing: the old response_model +
+JSONResponse route vs encoding once into the response cache.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_responses [--videos 10000] [--requests 20]
+
+Point DATABASE_URL at a scratch database: the videos table is emptied and
+refilled. The whole table is requested as one page (MAX_PAGE_SIZE is raised
+for the run). CPU is process time, so it includes the driver's threads.
+"""
+import argparse
+import asyncio
+import time
+from fastapi import Depends, FastAPI
+from sqlalchemy import delete
+from app.config import settings
+from app.database import AsyncSessionLocal, Base, engine, get_db
+from app.main import app
+from app.models.video import Video
+from app.api.v1.videos import LibraryPage, library_page
+from app.utils.bulk_insert import bulk_insert
+from app.utils.responses import response_cache
+from benchmarks.asgi import call
+from benchmarks.bench_bulk_insert import make_rows
+
+# The route as it was: handler returns ORM objects, FastAPI validates and encodes
+legacy = FastAPI()
+
+@legacy.get("/api/v1/library", response_model=LibraryPage)
+async def legacy_library(limit: int, db=Depends(get_db)):
+    return await library_page({"limit": limit}, db)
+
+async def prepare(videos: int):
+    Base.metadata.create_all(engine)
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Video))
+        await db.commit()
+        await bulk_insert(db, Video.__table__, make_rows(videos))
+
+def cold(_):
+    response_cache.clear()
+
+SCENARIOS = [
+    # name, app, request headers, before each request
+    ("response_model + JSONResponse (old)", legacy, [], None),
+    ("encode once, cache miss", app, [], cold),
+    ("cache hit", app, [], None),
+    ("cache hit, gzip", app, [("accept-encoding", "gzip")], None),
+]
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--videos", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    await prepare(args.videos)
+    settings.MAX_PAGE_SIZE = args.videos
+    query = f"limit={args.videos}".encode()
+
+    print(f"{args.videos} videos in one page, {args.requests} sequential requests\n")
+    print(f"{'scenario':<38} {'cpu ms/req':>11} {'wall ms/req':>12} {'bytes':>10}")
+    for name, target, headers, before in SCENARIOS:
+        status, _, length = await call(target, "GET", "/api/v1/library", headers, query_string=query)
+        assert status == 200, (name, status)
+        cpu = wall = 0.0
+        for i in range(args.requests):
+            if before:
+                before(i)
+            cpu_start, wall_start = time.process_time(), time.perf_counter()
+            await call(target, "GET", "/api/v1/library", headers, query_string=query)
+            cpu += time.process_time() - cpu_start
+            wall += time.perf_counter() - wall_start
+        print(f"{name:<38} {cpu / args.requests * 1000:>11.1f} {wall / args.requests * 1000:>12.1f} {length:>10}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
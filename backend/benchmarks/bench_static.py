@@ -0,0 +1,57 @@
+"""
+Static file serving: StaticFileServer vs starlette StaticFiles (the old mount).
+
+    python -m benchmarks.bench_static [--size-mb 20] [--requests 400] [--concurrency 16]
+
+Runs both ASGI apps in-process against the same temp directory and prints
+requests/s and latency for full downloads, single ranges and revalidation.
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+from starlette.staticfiles import StaticFiles
+from app.core.static_files import StaticFileServer
+from benchmarks.asgi import call, run_load
+
+SCENARIOS = {
+    "full GET": lambda etag, size: [],
+    "range 64KiB": lambda etag, size: [("range", "bytes=1048576-1114111")],
+    "revalidate (If-None-Match)": lambda etag, size: [("if-none-match", etag)],
+}
+
+async def bench(size_mb: int, total: int, concurrency: int):
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "book.pdf"), "wb") as f:
+            f.write(os.urandom(size_mb * 1024 * 1024))
+
+        apps = {
+            "StaticFiles (old)": StaticFiles(directory=directory),
+            "StaticFileServer": StaticFileServer(directory),
+        }
+        print(f"{size_mb} MiB file, {total} requests, concurrency {concurrency}\n")
+        print(f"{'scenario':<28} {'app':<20} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8}  status")
+        for scenario, make_headers in SCENARIOS.items():
+            for name, app in apps.items():
+                _, headers, _ = await call(app, "GET", "/book.pdf")
+                request_headers = make_headers(headers.get("etag", ""), size_mb * 1024 * 1024)
+                statuses = set()
+
+                async def request(_):
+                    status, _, _ = await call(app, "GET", "/book.pdf", request_headers)
+                    statuses.add(status)
+
+                result = await run_load(request, total, concurrency)
+                print(f"{scenario:<28} {name:<20} {result['rps']:>9.1f} "
+                      f"{result['p50']:>8.2f} {result['p99']:>8.2f}  {sorted(statuses)}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(bench(args.size_mb, args.requests, args.concurrency))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Seeds a scratch database with production-like volume for the API benchmark.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.seed \\
+        [--videos 100000] [--ebooks 10000] [--registrations 1000000] [--seed 7]
+
+The 114 surahs carry their real verse counts (6,236 ayahs). Every ayah is
+covered by at least one video range (about 1,100 videos, so that is the
+minimum); the remaining videos repeat random ranges, like several lecturers
+covering the same passage. Videos, ebooks, registrations and surahs are
+emptied and refilled; an admin user is (re)created.
+Run `alembic upgrade head` first on Postgres: search needs pg_trgm and the
+migration indexes (create_all only adds tables that are missing).
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import delete
+from app.database import AsyncSessionLocal, Base, async_engine, engine
+from app.core.security import get_password_hash
+from app.models.ebook import EBook
+from app.models.registration import ClassRegistration
+from app.models.surah import Surah
+from app.models.user import User
+from app.models.video import Video
+import app.main  # noqa: F401  (registers every model for create_all)
+from app.utils.bulk_insert import bulk_insert
+
+# Verses per surah, in order (sum: 6,236)
+SURAH_VERSES = (
+    7, 286, 200, 176, 120, 165, 206, 75, 129, 109, 123, 111, 43, 52, 99, 128, 111, 110, 98, 135,
+    112, 78, 118, 64, 77, 227, 93, 88, 69, 60, 34, 30, 73, 54, 45, 83, 182, 88, 75, 85,
+    54, 53, 89, 59, 37, 35, 38, 29, 18, 45, 60, 49, 62, 55, 78, 96, 29, 22, 24, 13,
+    14, 11, 11, 18, 12, 12, 30, 52, 52, 44, 28, 28, 20, 56, 40, 31, 50, 40, 46, 42,
+    29, 19, 36, 25, 22, 17, 19, 26, 30, 20, 15, 21, 11, 8, 8, 19, 5, 8, 8, 11,
+    11, 8, 3, 9, 5, 4, 7, 3, 6, 3, 5, 4, 5, 6,
+)
+
+# Words the synthetic titles and keywords are drawn from (and the search benchmark queries)
+TOPICS = ("tafsir", "grammar", "word by word", "revision", "tajweed", "vocabulary",
+          "morphology", "reflection", "translation", "recitation")
+LANGUAGES = ("English", "Tamil", "Urdu", "Malayalam", "Hindi", "Arabic")
+DAYS = ("Weekdays", "Weekends", "Saturday", "Sunday", "Friday")
+TIMES = ("Morning", "Afternoon", "Evening", "Night")
+COUNTRIES = ("India", "Sri Lanka", "UAE", "Saudi Arabia", "UK", "USA", "Malaysia")
+STATUSES = ("pending", "contacted", "enrolled", "rejected")
+
+ADMIN_EMAIL = "bench-admin@example.com"
+ADMIN_PASSWORD = "bench-admin"
+
+# Rows are spread over this window so keyset pages and sort orders are realistic
+HISTORY = timedelta(days=5 * 365)
+
+def surah_rows() -> list[dict]:
+    return [
+        {"id": number, "name": f"Surah {number}", "english_name": f"Surah {number}",
+         "total_verses": verses, "revelation_place": "Makkah" if number % 3 else "Madinah"}
+        for number, verses in enumerate(SURAH_VERSES, start=1)
+    ]
+
+def video_rows(count: int, rng: random.Random, now: datetime) -> list[dict]:
+    ranges = []
+    # 1. Cover every ayah once with consecutive lessons of 1-10 ayahs
+    for number, verses in enumerate(SURAH_VERSES, start=1):
+        start = 1
+        while start <= verses:
+            end = min(verses, start + rng.randint(0, 9))
+            ranges.append((number, start, end))
+            start = end + 1
+    # 2. The rest: random passages, weighted by surah length
+    while len(ranges) < count:
+        number = rng.choices(range(1, 115), weights=SURAH_VERSES)[0]
+        start = rng.randint(1, SURAH_VERSES[number - 1])
+        ranges.append((number, start, min(SURAH_VERSES[number - 1], start + rng.randint(0, 14))))
+
+    rows = []
+    for i, (number, start, end) in enumerate(ranges):
+        topic = rng.choice(TOPICS)
+        rows.append({
+            "title": f"Surah {number} {start}-{end} {topic} lesson {i}",
+            "video_url": f"https://www.youtube.com/watch?v={i:011d}",
+            "surah_no": number,
+            "surah_name": f"Surah {number}",
+            "starting_ayah": start,
+            "ending_ayah": end,
+            "keywords": ", ".join(rng.sample(TOPICS, 3)),
+            "created_date": now - HISTORY * rng.random(),
+        })
+    return rows
+
+def ebook_rows(count: int, rng: random.Random, now: datetime) -> list[dict]:
+    return [
+        {
+            "title": f"{rng.choice(TOPICS).title()} notes volume {i}",
+            "filename": f"/static/uploads/pdfs/bench-{i}.pdf",
+            "cover_image": f"/static/uploads/covers/bench-{i}.jpg",
+            "description": f"Study notes on {rng.choice(TOPICS)}",
+            "pages": rng.randint(20, 600),
+            "createddate": now - HISTORY * rng.random(),
+        }
+        for i in range(count)
+    ]
+
+def registration_rows(count: int, rng: random.Random, now: datetime) -> list[dict]:
+    return [
+        {
+            "name": f"Student {i}",
+            "email": f"student{i}@example.com",
+            "phone": f"+91{rng.randint(6_000_000_000, 9_999_999_999)}",
+            "country": rng.choice(COUNTRIES),
+            "preferred_language": rng.choice(LANGUAGES),
+            "preferred_day": rng.choice(DAYS),
+            "preferred_time": rng.choice(TIMES),
+            "status": rng.choice(STATUSES),
+            "notes": None,
+            "registered_at": now - HISTORY * rng.random(),
+        }
+        for i in range(count)
+    ]
+
+async def insert(model, rows: list[dict]) -> float:
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        report = await bulk_insert(db, model.__table__, rows)
+    assert not report["failed"], report["failed"]
+    return time.perf_counter() - start
+
+async def seed(videos: int, ebooks: int, registrations: int, seed: int = 7) -> dict:
+    """Empties and refills the benchmark tables; returns row counts"""
+    Base.metadata.create_all(engine)
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+
+    async with AsyncSessionLocal() as db:
+        for model in (Video, EBook, ClassRegistration, Surah):
+            await db.execute(delete(model))
+        await db.execute(delete(User).where(User.email == ADMIN_EMAIL))
+        db.add(User(email=ADMIN_EMAIL, username="bench-admin",
+                    password_hash=get_password_hash(ADMIN_PASSWORD), role="admin"))
+        await db.commit()
+
+    counts = {}
+    for name, model, rows in (
+        ("surahs", Surah, surah_rows()),
+        ("videos", Video, video_rows(videos, rng, now)),
+        ("ebooks", EBook, ebook_rows(ebooks, rng, now)),
+        ("registrations", ClassRegistration, registration_rows(registrations, rng, now)),
+    ):
+        elapsed = await insert(model, rows) if rows else 0.0
+        counts[name] = len(rows)
+        print(f"{name:<14} {len(rows):>9} rows {elapsed:>8.1f} s")
+    return counts
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--videos", type=int, default=100_000)
+    parser.add_argument("--ebooks", type=int, default=10_000)
+    parser.add_argument("--registrations", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    await seed(args.videos, args.ebooks, args.registrations, args.seed)
+    await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,162 @@
+# migrate_uploads.py
+"""
+One-shot migration of UPLOAD_DIR into the content-addressed blob store.
+
+- Rehashes every legacy upload in pdfs/ and coverpages/
+- Rewrites ebooks.filename / ebooks.cover_image to the sharded paths and
+  rebuilds blobs rows and their refcounts from the ebooks table (committed)
+- Then moves the files (duplicates collapse into one file)
+
+Safe to re-run, also after an interruption: files only move once the rows
+are committed, and a re-run moves whatever is still at a legacy path.
+Pass --gc to also delete blobs (and cover derivatives) no ebook references.
+
+    python migrate_uploads.py [--dry-run] [--gc]
+"""
+import os
+import sys
+import hashlib
+from sqlalchemy import func, select
+from app.config import settings
+from app.database import SessionLocal
+from app.models.blob import Blob
+from app.models.ebook import EBook
+from app.utils.blob_store import ebook_blob_paths, remove_blob_files
+from app.utils.file_upload import CHUNK_SIZE, blob_name, safe_extension
+from app.utils.images import DERIVATIVE_RE
+
+NAMESPACES = ("pdfs", "coverpages")
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def is_blob_name(relname: str) -> bool:
+    parts = relname.split("/")
+    if len(parts) != 3:
+        return False
+    stem = os.path.splitext(parts[2])[0]
+    return len(stem) == 64 and parts[0] == stem[:2] and parts[1] == stem[2:4]
+
+def plan_moves() -> dict:
+    """Hash legacy files (nothing is moved yet); returns {old relative path: new relative path}"""
+    moves = {}
+    for namespace in NAMESPACES:
+        root = os.path.join(settings.UPLOAD_DIR, namespace)
+        if not os.path.isdir(root):
+            continue
+        for dirpath, _, files in os.walk(root):
+            for name in files:
+                src = os.path.join(dirpath, name)
+                relname = os.path.relpath(src, root).replace(os.sep, "/")
+                if name.startswith(".") or is_blob_name(relname) or DERIVATIVE_RE.match(name):
+                    continue
+                new_relname = blob_name(file_sha256(src), safe_extension(name))
+                moves[f"{namespace}/{relname}"] = f"{namespace}/{new_relname}"
+                print(f"{namespace}/{relname} -> {namespace}/{new_relname}")
+    return moves
+
+def move_files(moves: dict):
+    """Runs after the rows are committed; a file already moved by an interrupted run is skipped"""
+    for old, new in moves.items():
+        src = os.path.join(settings.UPLOAD_DIR, old)
+        dst = os.path.join(settings.UPLOAD_DIR, new)
+        if not os.path.exists(src):
+            continue
+        if os.path.exists(dst):
+            os.remove(src)  # Duplicate content
+        else:
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            os.replace(src, dst)
+
+def rewrite_ebooks(db, moves: dict):
+    for ebook in db.query(EBook).all():
+        pdf_key = f"pdfs/{(ebook.filename or '').lstrip('/')}"
+        if pdf_key in moves:
+            ebook.filename = moves[pdf_key][len("pdfs/"):]
+        cover_key = (ebook.cover_image or "").lstrip("/")
+        if cover_key in moves:
+            ebook.cover_image = f"/{moves[cover_key]}"
+
+def stored_files(moves: dict) -> dict:
+    """{blob path: file on disk}, counting planned moves as already in place"""
+    files = {}
+    for namespace in NAMESPACES:
+        root = os.path.join(settings.UPLOAD_DIR, namespace)
+        for dirpath, _, names in os.walk(root):
+            for name in names:
+                relname = os.path.relpath(os.path.join(dirpath, name), root).replace(os.sep, "/")
+                if is_blob_name(relname):
+                    files[f"{namespace}/{relname}"] = os.path.join(dirpath, name)
+    for old, new in moves.items():
+        files.setdefault(new, os.path.join(settings.UPLOAD_DIR, old))
+    return files
+
+def rebuild_blobs(db, moves: dict):
+    """Blob rows for every stored file, refcounts recomputed from ebooks"""
+    refs = {}
+    for ebook in db.query(EBook).all():
+        for path in ebook_blob_paths(ebook.filename, ebook.cover_image):
+            refs[path] = refs.get(path, 0) + 1
+
+    known = {b.path: b for b in db.query(Blob).all()}
+    for path, file in stored_files(moves).items():
+        blob = known.pop(path, None)
+        if blob is None:
+            blob = Blob(
+                path=path,
+                sha256=os.path.splitext(os.path.basename(path))[0],
+                size=os.path.getsize(file)
+            )
+            db.add(blob)
+        blob.refcount = refs.get(path, 0)
+
+    # Rows whose file is gone
+    for blob in known.values():
+        db.delete(blob)
+
+def collect_garbage(db) -> list[str]:
+    """Deletes unreferenced blob rows; returns their paths for remove_blob_files() after commit"""
+    paths = []
+    for blob in db.query(Blob).filter(Blob.refcount == 0).all():
+        paths.append(blob.path)
+        db.delete(blob)
+    return paths
+
+def main():
+    dry_run = "--dry-run" in sys.argv
+    db = SessionLocal()
+    try:
+        # 1. Plan only: an interrupted run leaves the files where the rows point
+        moves = plan_moves()
+        if dry_run:
+            print(f"Dry run: {len(moves)} file(s) would be migrated.")
+            return
+
+        # 2. Rows first. Until step 3 finishes they point at files still being
+        # moved; a re-run finds the leftovers and moves them.
+        rewrite_ebooks(db, moves)
+        db.flush()
+        rebuild_blobs(db, moves)
+        db.commit()
+
+        # 3. Files
+        move_files(moves)
+
+        # 4. Garbage: rows go first, then the files and their cover derivatives
+        if "--gc" in sys.argv:
+            garbage = collect_garbage(db)
+            db.commit()
+            remove_blob_files(garbage)
+            print(f"Removed {len(garbage)} unreferenced blob(s).")
+
+        total = db.scalar(select(func.count()).select_from(Blob))
+        print(f"Migrated {len(moves)} file(s); {total} blob(s) tracked.")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
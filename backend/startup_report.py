@@ -0,0 +1,138 @@
+# startup_report.py
+"""
+Cold-start cost of one worker: import time, resident memory and the modules
+that dominate `import app.main`.
+
+    python startup_report.py [--top 25] [--runs 3] [--json]
+        [--max-import-ms 2000] [--max-rss-mb 150]
+
+Every measurement runs in a fresh interpreter (python -X importtime for the
+breakdown), with the current environment (DATABASE_URL, JWT_SECRET, ...).
+Exits 1 when a module from app.utils.lazy_import.LAZY_MODULES is loaded at
+startup or a --max-* budget is exceeded, so it can gate CI.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from app.utils.lazy_import import LAZY_MODULES
+
+TARGET = "app.main"
+
+# Runs in the child: wall-clock import time, RSS after import, heavy modules present
+PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+import {TARGET}
+elapsed = time.perf_counter() - start
+rss = None
+try:
+    with open("/proc/self/status") as f:
+        rss = next(int(line.split()[1]) * 1024 for line in f if line.startswith("VmRSS:"))
+except OSError:
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss = peak if sys.platform == "darwin" else peak * 1024  # bytes on macOS, KiB elsewhere
+print(json.dumps({{
+    "import_seconds": elapsed,
+    "rss_bytes": rss,
+    "modules": len(sys.modules),
+    "lazy_loaded": [m for m in {LAZY_MODULES!r} if m in sys.modules],
+}}))
+"""
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    result = subprocess.run([sys.executable, *args], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        sys.exit(f"`import {TARGET}` failed:\n{result.stderr.strip()}")
+    return result
+
+def probe(runs: int) -> dict:
+    """Median of `runs` fresh-interpreter imports"""
+    samples = [json.loads(run_python("-c", PROBE).stdout) for _ in range(runs)]
+    return {
+        "import_ms": round(statistics.median(s["import_seconds"] for s in samples) * 1000, 1),
+        "rss_mb": round(statistics.median(s["rss_bytes"] for s in samples) / 2**20, 1),
+        "modules": samples[0]["modules"],
+        "lazy_loaded": samples[0]["lazy_loaded"],
+    }
+
+def import_breakdown() -> list[dict]:
+    """
+    Parses `python -X importtime` (stderr: "import time: self | cumulative | name",
+    microseconds, nesting shown by indentation).
+    """
+    stderr = run_python("-X", "importtime", "-c", f"import {TARGET}").stderr
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():  # Header line
+            continue
+        modules.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+    return modules
+
+def by_package(modules: list[dict]) -> list[tuple[str, float]]:
+    """Self time summed per top-level package (app.* split one level deeper)"""
+    totals = defaultdict(float)
+    for m in modules:
+        parts = m["module"].split(".")
+        package = ".".join(parts[:2]) if parts[0] == "app" and len(parts) > 1 else parts[0]
+        totals[package] += m["self_ms"]
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--top", type=int, default=25, help="rows per table")
+    parser.add_argument("--runs", type=int, default=3, help="fresh imports to take the median of")
+    parser.add_argument("--json", action="store_true", help="machine-readable output")
+    parser.add_argument("--max-import-ms", type=float)
+    parser.add_argument("--max-rss-mb", type=float)
+    args = parser.parse_args()
+
+    summary = probe(max(1, args.runs))
+    modules = import_breakdown()
+    packages = by_package(modules)
+    slowest = sorted(modules, key=lambda m: m["cumulative_ms"], reverse=True)
+
+    problems = []
+    if summary["lazy_loaded"]:
+        problems.append(f"loaded at startup, should be lazy: {', '.join(summary['lazy_loaded'])}")
+    if args.max_import_ms is not None and summary["import_ms"] > args.max_import_ms:
+        problems.append(f"import {summary['import_ms']} ms > budget {args.max_import_ms} ms")
+    if args.max_rss_mb is not None and summary["rss_mb"] > args.max_rss_mb:
+        problems.append(f"RSS {summary['rss_mb']} MB > budget {args.max_rss_mb} MB")
+
+    if args.json:
+        print(json.dumps({
+            **summary,
+            "packages": [{"package": p, "self_ms": round(ms, 1)} for p, ms in packages[:args.top]],
+            "slowest": slowest[:args.top],
+            "problems": problems,
+        }, indent=2))
+    else:
+        print(f"import {TARGET}: {summary['import_ms']} ms (median of {args.runs}), "
+              f"RSS {summary['rss_mb']} MB, {summary['modules']} modules\n")
+        print(f"{'package':<32} {'self ms':>9}")
+        for package, ms in packages[:args.top]:
+            print(f"{package:<32} {ms:>9.1f}")
+        print(f"\n{'module (importtime)':<48} {'self ms':>9} {'cumul ms':>9}")
+        for m in slowest[:args.top]:
+            print(f"{'  ' * m['depth'] + m['module']:<48} {m['self_ms']:>9.1f} {m['cumulative_ms']:>9.1f}")
+        for problem in problems:
+            print(f"\nFAIL: {problem}")
+
+    sys.exit(1 if problems else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Tests run against a throwaway SQLite database. Postgres-only behaviour
+(GiST / full-text indexes, planner choices) is covered by tests using the
+`pg_session` fixture: point TEST_POSTGRES_URL at a scratch database migrated
+with `alembic upgrade head`, otherwise they are skipped.
+"""
+import os
+import tempfile
+
+_tmp = tempfile.mkdtemp(prefix="wqtc-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/test.db"
+os.environ.setdefault("JWT_SECRET", "test-secret")
+os.environ["UPLOAD_DIR"] = os.path.join(_tmp, "static")
+os.environ["IMPORT_DIR"] = os.path.join(_tmp, "imports")
+os.environ["PROFILE_DIR"] = os.path.join(_tmp, "profiles")
+os.environ["CACHE_BUS_BACKEND"] = "local"
+os.environ["IMPORT_WORKERS"] = "0"  # Tests run jobs directly (run_import_job)
+os.environ["BCRYPT_ROUNDS"] = "4"
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from app.main import app as fastapi_app
+from app.core.security import create_access_token, get_password_hash
+from app.database import Base, SessionLocal, engine, get_async_url
+from app.models.surah import Surah
+from app.models.user import User
+from app.utils.responses import response_cache
+from app.api.v1.registrations import registration_counts
+from app.api.v1.videos import library_flights
+from app.core.user_cache import clear_auth_cache
+
+Base.metadata.create_all(engine)
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    """Empty tables and per-process caches between tests"""
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+    response_cache.clear()
+    library_flights._recent.clear()
+    registration_counts._counts.clear()
+    clear_auth_cache()
+    yield
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+@pytest.fixture
+def surahs(db):
+    db.add_all(Surah(id=n, name=f"Surah {n}", total_verses=286) for n in range(1, 115))
+    db.commit()
+
+@pytest.fixture
+def client(surahs):
+    with TestClient(fastapi_app) as c:
+        yield c
+
+@pytest.fixture
+def add_user(db):
+    """add_user(email, role) creates a user and returns a session token for it"""
+    def add(email: str, role: str) -> str:
+        db.add(User(email=email, username=email.split("@")[0],
+                    password_hash=get_password_hash("secret"), role=role))
+        db.commit()
+        return create_access_token({"sub": email})
+    return add
+
+@pytest.fixture
+def admin_client(client, add_user):
+    client.cookies.set("token", add_user("admin@example.com", "admin"))
+    return client
+
+@pytest.fixture
+def asgi():
+    """asgi(app, method, path, headers) runs one request in process: (status, headers, body, body messages)"""
+    async def call(app, method: str, path: str, headers: dict = {}):
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method,
+            "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+            "headers": [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()],
+        }
+        start, messages = {}, []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+            else:
+                messages.append(message)
+
+        await app(scope, receive, send)
+        response_headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in start["headers"]}
+        body = b"".join(m.get("body", b"") for m in messages)
+        return start["status"], response_headers, body, messages
+    return call
+
+@pytest.fixture
+async def pg_session():
+    """Session on TEST_POSTGRES_URL inside a transaction that is rolled back"""
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL not set")
+    pg_engine = create_async_engine(get_async_url(url))
+    try:
+        conn = await pg_engine.connect()
+    except Exception as e:  # Refused, unknown database, bad credentials
+        await pg_engine.dispose()
+        pytest.skip(f"Postgres unavailable: {e}")
+    transaction = await conn.begin()
+    try:
+        if not await conn.scalar(text("SELECT to_regclass('alembic_version') IS NOT NULL")):
+            pytest.skip("TEST_POSTGRES_URL is not migrated (alembic upgrade head)")
+        yield AsyncSession(bind=conn, expire_on_commit=False)
+    finally:
+        await transaction.rollback()
+        await conn.close()
+        await pg_engine.dispose()
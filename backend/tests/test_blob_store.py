@@ -0,0 +1,78 @@
+import hashlib
+import os
+import sys
+import pytest
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.blob import Blob
+from app.models.ebook import EBook
+from app.utils.blob_store import register_blob
+from app.utils.file_upload import blob_name
+from app.utils.images import cover_derivative_paths
+import migrate_uploads
+
+def write_upload(relpath: str, content: bytes) -> str:
+    path = os.path.join(settings.UPLOAD_DIR, relpath)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+    return path
+
+def run_migration(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["migrate_uploads.py", *args])
+    migrate_uploads.main()
+
+@pytest.fixture
+def legacy_ebook(db):
+    write_upload("pdfs/notes.pdf", b"%PDF notes")
+    write_upload("coverpages/notes.jpg", b"cover")
+    db.add(EBook(title="Notes", filename="notes.pdf", cover_image="/coverpages/notes.jpg"))
+    db.commit()
+    return {
+        "pdf": f"pdfs/{blob_name(hashlib.sha256(b'%PDF notes').hexdigest(), '.pdf')}",
+        "cover": f"coverpages/{blob_name(hashlib.sha256(b'cover').hexdigest(), '.jpg')}",
+    }
+
+@pytest.mark.anyio
+async def test_register_blob_tolerates_concurrent_insert(db, monkeypatch):
+    db.add(Blob(path="pdfs/ab/cd/x.pdf", sha256="x", size=1, refcount=0))
+    db.commit()
+
+    async with AsyncSessionLocal() as session:
+        async def not_there_yet(*args, **kwargs):
+            return None  # The other request inserts between our check and our insert
+        monkeypatch.setattr(session, "get", not_there_yet)
+        await register_blob(session, "pdfs/ab/cd/x.pdf", "x", 1)
+
+    assert db.query(Blob).count() == 1
+
+def test_interrupted_migration_is_finished_by_rerun(db, legacy_ebook, monkeypatch):
+    def interrupted(moves):
+        raise KeyboardInterrupt
+    with monkeypatch.context() as m:
+        m.setattr(migrate_uploads, "move_files", interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            run_migration(m)
+
+    # Rows were committed before any file moved
+    ebook = db.query(EBook).one()
+    assert ebook.filename == legacy_ebook["pdf"][len("pdfs/"):]
+    assert os.path.exists(os.path.join(settings.UPLOAD_DIR, "pdfs/notes.pdf"))
+
+    run_migration(monkeypatch)
+
+    db.expire_all()
+    for path in legacy_ebook.values():
+        assert os.path.exists(os.path.join(settings.UPLOAD_DIR, path))
+    assert not os.path.exists(os.path.join(settings.UPLOAD_DIR, "pdfs/notes.pdf"))
+    assert {b.path: b.refcount for b in db.query(Blob)} == {path: 1 for path in legacy_ebook.values()}
+
+def test_gc_removes_cover_derivatives(db, monkeypatch):
+    sha = hashlib.sha256(b"orphan").hexdigest()
+    cover = f"coverpages/{blob_name(sha, '.jpg')}"
+    files = [write_upload(path, b"orphan") for path in [cover, *cover_derivative_paths(cover)]]
+
+    run_migration(monkeypatch, "--gc")
+
+    assert db.query(Blob).count() == 0
+    assert not any(os.path.exists(f) for f in files)
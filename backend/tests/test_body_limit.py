@@ -0,0 +1,69 @@
+import pytest
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+from app.config import settings
+from app.core.body_limit import BodySizeLimitMiddleware, upload_limit
+
+@pytest.fixture
+def upload_client():
+    app = FastAPI()
+    parsed = []
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        parsed.append(file.filename)
+        return {"size": len(await file.read())}
+
+    @app.post("/small")
+    async def small(file: UploadFile = File(...)):
+        parsed.append(file.filename)
+        return {"size": len(await file.read())}
+
+    app.add_middleware(BodySizeLimitMiddleware, default=upload_limit(4096), limits={"/small": upload_limit(1024)})
+    with TestClient(app) as client:
+        client.parsed = parsed
+        yield client
+
+def chunks(content: bytes, size: int = 1000):
+    """Body without Content-Length (chunked), e.g. a client that does not announce it"""
+    for start in range(0, len(content), size):
+        yield content[start:start + size]
+
+def multipart(file: bytes) -> tuple[bytes, dict]:
+    boundary = "limit-test"
+    body = (f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"a.pdf\"\r\n"
+            f"Content-Type: application/pdf\r\n\r\n").encode() + file + f"\r\n--{boundary}--\r\n".encode()
+    return body, {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+
+def test_within_limit_is_parsed(upload_client):
+    response = upload_client.post("/upload", files={"file": ("a.pdf", b"x" * 4096)})
+
+    assert response.json() == {"size": 4096}
+
+def test_declared_length_over_limit_is_refused_before_parsing(upload_client):
+    response = upload_client.post("/small", files={"file": ("a.pdf", b"x" * 70_000)})
+
+    assert response.status_code == 413
+    assert response.json() == {"detail": f"Request body exceeds {upload_limit(1024)} bytes"}
+    assert upload_client.parsed == []
+
+def test_undeclared_length_is_cut_off_while_reading(upload_client):
+    body, headers = multipart(b"x" * 70_000)
+
+    response = upload_client.post("/small", content=chunks(body), headers=headers)
+
+    assert response.status_code == 413  # Not the 400 FastAPI gives other form parsing errors
+    assert upload_client.parsed == []
+
+def test_per_path_limit_falls_back_to_default(upload_client):
+    body, headers = multipart(b"x" * 10_000)
+
+    assert upload_client.post("/upload", content=chunks(body), headers=headers).json() == {"size": 10_000}
+    assert upload_client.post("/upload", files={"file": ("a.pdf", b"x" * 80_000)}).status_code == 413
+
+def test_app_refuses_oversized_cover_before_auth(client):
+    response = client.post("/api/v1/ebooks/upload-cover", content=b"",
+                           headers={"Content-Length": str(upload_limit(settings.MAX_COVER_UPLOAD_SIZE) + 1),
+                                    "Content-Type": "multipart/form-data; boundary=x"})
+
+    assert response.status_code == 413
@@ -0,0 +1,89 @@
+import pandas as pd
+import pytest
+from app.core.surah_catalog import SurahCatalog, SurahEntry
+from app.utils.bulk_import import validate_video_frame
+from benchmarks.bench_bulk_preview import CATALOG, SURAHS, legacy_validate, make_fixture
+
+URL = "https://youtu.be/abcdefghijk"
+
+def entry(surah_id: int, total_verses) -> SurahEntry:
+    return SurahEntry(surah_id, f"Surah {surah_id}", None, None, None, total_verses, None)
+
+# Al-Fatiha has 7 verses; surah 2's total is unknown (lower bound only)
+BOUNDED = SurahCatalog([entry(1, 7), entry(2, None)])
+
+def sheet(*rows: dict) -> pd.DataFrame:
+    defaults = {"title": "Lesson", "youtube_link": URL, "surah_no": 1, "starting_ayah": 1, "ending_ayah": 5}
+    return pd.DataFrame([{**defaults, **row} for row in rows])
+
+def issues(df: pd.DataFrame, catalog: SurahCatalog = BOUNDED) -> list[list[str]]:
+    valid, invalid = validate_video_frame(df, catalog)
+    by_row = {r["row"]: r["issues"] for r in invalid}
+    return [by_row.get(i + 2, []) for i in range(len(df))]
+
+def test_matches_legacy_loop_on_mixed_sheet():
+    df = make_fixture(2000)
+
+    valid, invalid = validate_video_frame(df, CATALOG)
+    old_valid, old_invalid = legacy_validate(df, SURAHS)
+
+    assert 0 < len(invalid) < len(df)
+    assert valid == old_valid
+    assert [(r["row"], r["issues"], r["data"]) for r in invalid] == \
+        [(r["row"], r["issues"], r["data"]) for r in old_invalid]
+
+@pytest.mark.parametrize("row", [
+    {"youtube_link": "not a link"},
+    {"youtube_link": None},
+    {"title": None},
+    {"surah_no": 200},
+    {"surah_no": "abc"},
+    {"starting_ayah": "x"},
+    {"title": None, "youtube_link": "https://example.com/watch", "surah_no": 300, "starting_ayah": "?"},
+])
+def test_per_row_issues_match_legacy_loop(row):
+    df = sheet({}, row)
+    legacy = {r["row"]: r["issues"] for r in legacy_validate(df, SURAHS)[1]}
+
+    assert issues(df, CATALOG) == [legacy.get(i + 2, []) for i in range(len(df))]
+
+def test_reports_each_issue():
+    df = sheet(
+        {},
+        {"youtube_link": "https://example.com/watch?v=abc"},
+        {"surah_no": 99},
+        {"starting_ayah": 5, "ending_ayah": 3},
+        {"starting_ayah": "one", "ending_ayah": "two"},
+        {"starting_ayah": 1.5},
+        {"starting_ayah": 0},
+        {"starting_ayah": 7, "ending_ayah": 8},
+        {"surah_no": 2, "starting_ayah": 250, "ending_ayah": 300},
+    )
+
+    assert issues(df) == [
+        [],
+        ["Invalid YouTube URL"],
+        ["Surah 99 does not exist in DB"],
+        ["Ending Ayah is before Starting Ayah"],
+        ["Invalid Starting Ayah", "Invalid Ending Ayah"],
+        ["Invalid Starting Ayah"],  # Fractions are not truncated
+        ["Starting Ayah out of range (1-7)"],
+        ["Ending Ayah out of range (1-7)"],
+        [],  # Unknown total: no upper bound
+    ]
+
+def test_valid_rows_and_fallbacks():
+    df = sheet({"youtube_link": "", "video_url": URL, "ending_ayah": None, "keywords": "tafsir"})
+
+    valid, invalid = validate_video_frame(df, BOUNDED)
+
+    assert invalid == []
+    assert valid == [{"title": "Lesson", "video_url": URL, "surah_no": 1, "surah_name": "Surah 1",
+                      "starting_ayah": 1, "ending_ayah": None, "keywords": "tafsir"}]
+
+def test_invalid_row_keeps_the_submitted_data():
+    _, invalid = validate_video_frame(sheet({}, {"surah_no": "abc"}), BOUNDED)
+
+    assert invalid == [{"row": 3, "data": {"title": "Lesson", "youtube_link": URL, "surah_no": "abc",
+                                           "starting_ayah": "1", "ending_ayah": "5"},
+                        "issues": ["Invalid Surah Number"]}]
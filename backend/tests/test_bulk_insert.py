@@ -0,0 +1,45 @@
+import pytest
+from app.database import AsyncSessionLocal
+from app.models.video import Video
+from app.utils.bulk_insert import bulk_insert
+
+def lesson(i: int, **fields) -> dict:
+    return {"title": f"Lesson {i}", "video_url": "https://youtu.be/abcdefghijk", "surah_no": 2,
+            "starting_ayah": 1, "ending_ayah": 5, **fields}
+
+@pytest.mark.anyio
+async def test_failing_batch_does_not_stop_the_others(db, surahs):
+    rows = [lesson(i) for i in range(8)]
+    rows[4] = lesson(4, title=None)  # NOT NULL: fails the second batch
+
+    async with AsyncSessionLocal() as session:
+        report = await bulk_insert(session, Video.__table__, rows, batch_size=3, use_copy=True)
+
+    assert (report["inserted"], report["failed"], report["method"]) == (5, 3, "executemany")  # No COPY on SQLite
+    assert [(b["batch"], b["first_row"], b["rows"], b["inserted"]) for b in report["batches"]] == \
+        [(1, 0, 3, 3), (2, 3, 3, 0), (3, 6, 2, 2)]
+    assert [b["error"] is None for b in report["batches"]] == [True, False, True]
+    assert "NOT NULL" in report["batches"][1]["error"]
+    assert "INSERT" not in report["batches"][1]["error"]  # Driver message only, no statement or parameters
+
+    # The whole second batch was rolled back, the rest committed
+    titles = [v.title for v in db.query(Video).order_by(Video.id)]
+    assert titles == ["Lesson 0", "Lesson 1", "Lesson 2", "Lesson 6", "Lesson 7"]
+
+@pytest.mark.anyio
+async def test_check_constraint_failure_is_reported(db, surahs):
+    rows = [lesson(0), lesson(1, starting_ayah=7, ending_ayah=3)]
+
+    async with AsyncSessionLocal() as session:
+        report = await bulk_insert(session, Video.__table__, rows, batch_size=1)
+
+    assert (report["inserted"], report["failed"]) == (1, 1)
+    assert "ck_videos_ayah_order" in report["batches"][1]["error"]
+
+@pytest.mark.anyio
+async def test_python_defaults_are_applied(db, surahs):
+    async with AsyncSessionLocal() as session:
+        report = await bulk_insert(session, Video.__table__, [lesson(0), lesson(1, created_by="Editor")])
+
+    assert report["inserted"] == 2
+    assert [v.created_by for v in db.query(Video).order_by(Video.id)] == ["WQTCTeam", "Editor"]
@@ -0,0 +1,90 @@
+import gzip
+import pytest
+from app.core.compression import CompressionMiddleware, accepted_encodings, compression_metrics, negotiate_encoding
+
+BODY = b'{"result": "' + b"tafsir " * 400 + b'"}'
+
+@pytest.mark.parametrize("accept, expected", [
+    (None, []),
+    ("", []),
+    ("gzip", ["gzip"]),
+    ("gzip, br", ["br", "gzip"]),  # Equal q: server preference
+    ("gzip;q=0.5, br;q=0.4", ["gzip", "br"]),
+    ("br;q=0, gzip", ["gzip"]),  # q=0 is a refusal
+    ("GZIP;q=0", []),
+    ("*", ["br", "gzip"]),
+    ("*;q=0.1, gzip", ["gzip", "br"]),  # Explicit beats *
+    ("*;q=0, gzip", ["gzip"]),
+    ("br;q=0, *", ["gzip"]),
+    ("identity", []),
+    ("gzip;q=abc", []),
+])
+def test_accepted_encodings(accept, expected):
+    assert accepted_encodings(accept, ("br", "gzip")) == expected
+
+def test_negotiate_encoding_picks_the_best():
+    assert negotiate_encoding("gzip;q=0.8, br") == "br"
+    assert negotiate_encoding("br;q=0, *") == "gzip"
+    assert negotiate_encoding("br;q=0, gzip;q=0") is None
+
+def app_sending(status: int = 200, headers: dict = {}, body: bytes = BODY, more_body: bool = False):
+    async def app(scope, receive, send):
+        raw = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+        raw += [(k.lower().encode(), v.encode()) for k, v in headers.items()]
+        await send({"type": "http.response.start", "status": status, "headers": raw})
+        await send({"type": "http.response.body", "body": body, "more_body": more_body})
+        if more_body:
+            await send({"type": "http.response.body", "body": body})
+    return CompressionMiddleware(app, minimum_size=1024)
+
+@pytest.mark.anyio
+async def test_compresses_and_weakens_etag(asgi):
+    status, headers, body, _ = await asgi(app_sending(headers={"ETag": '"library-1"'}), "GET", "/",
+                                          {"Accept-Encoding": "br;q=0, gzip"})
+
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body) == BODY
+    assert headers["content-length"] == str(len(body))
+    assert headers["vary"] == "Accept-Encoding"
+    assert headers["etag"] == 'W/"library-1"'
+
+@pytest.mark.anyio
+async def test_not_accepted_still_varies(asgi):
+    status, headers, body, _ = await asgi(app_sending(headers={"ETag": '"library-1"', "Vary": "Cookie"}),
+                                          "GET", "/", {"Accept-Encoding": "gzip;q=0"})
+
+    assert (status, body) == (200, BODY)
+    assert "content-encoding" not in headers
+    assert headers["vary"] == "Cookie, Accept-Encoding"  # A cache must not serve this to gzip clients
+    assert headers["etag"] == '"library-1"'
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("response, reason", [
+    ({"status": 206, "headers": {"Content-Range": f"bytes 0-{len(BODY) - 1}/{len(BODY) * 2}"}}, "no_body"),
+    ({"status": 304, "body": b""}, "no_body"),
+    ({"more_body": True}, "streamed"),
+    ({"headers": {"Content-Encoding": "br"}}, "already_encoded"),
+    ({"headers": {"Cache-Control": "no-transform"}}, "no_transform"),
+    ({"body": b"{}"}, "small"),
+])
+async def test_skipped_responses_pass_through(asgi, response, reason):
+    before = compression_metrics.skipped[reason]
+    body = response.get("body", BODY)
+
+    _, headers, _, messages = await asgi(app_sending(**response), "GET", "/", {"Accept-Encoding": "gzip"})
+
+    assert [m["body"] for m in messages] == ([body, body] if response.get("more_body") else [body])
+    assert headers.get("content-encoding") == response.get("headers", {}).get("Content-Encoding")
+    assert "vary" not in headers
+    assert compression_metrics.skipped[reason] == before + 1
+
+@pytest.mark.anyio
+async def test_media_types_already_compressed_pass_through(asgi):
+    async def pdf(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/pdf")]})
+        await send({"type": "http.response.body", "body": BODY})
+
+    _, headers, body, _ = await asgi(CompressionMiddleware(pdf), "GET", "/", {"Accept-Encoding": "gzip"})
+
+    assert (headers.get("content-encoding"), body) == (None, BODY)
@@ -0,0 +1,54 @@
+import pytest
+from app.core.invalidation import bus
+from app.utils.conditional import LIBRARY
+
+def test_matching_etag_is_not_modified(client, surahs):
+    first = client.get("/api/v1/library")
+    etag = first.headers["etag"]
+
+    again = client.get("/api/v1/library", headers={"If-None-Match": etag})
+    weak = client.get("/api/v1/library", headers={"If-None-Match": f'"other", W/{etag}'})
+
+    assert first.status_code == 200
+    assert (again.status_code, again.content) == (304, b"")
+    assert again.headers["etag"] == etag
+    assert weak.status_code == 304  # Weak comparison, as the compression middleware weakens ETags
+
+def test_etag_differs_per_query(client, surahs):
+    etag = client.get("/api/v1/library").headers["etag"]
+
+    other = client.get("/api/v1/library", params={"surah_no": 2}, headers={"If-None-Match": etag})
+
+    assert other.status_code == 200
+    assert other.headers["etag"] != etag
+
+def test_publish_changes_etag(client, surahs):
+    etag = client.get("/api/v1/library").headers["etag"]
+
+    bus.publish(LIBRARY)
+    after = client.get("/api/v1/library", headers={"If-None-Match": etag})
+
+    assert after.status_code == 200
+    assert after.headers["etag"] != etag
+    assert client.get("/api/v1/library", headers={"If-None-Match": after.headers["etag"]}).status_code == 304
+
+@pytest.mark.parametrize("topic", ["ebooks", "surah"])
+def test_other_topics_keep_library_etag(client, surahs, topic):
+    etag = client.get("/api/v1/library").headers["etag"]
+
+    bus.publish(topic)
+
+    assert client.get("/api/v1/library", headers={"If-None-Match": etag}).status_code == 304
+
+def test_write_changes_etag(admin_client, surahs):
+    etag = admin_client.get("/api/v1/library").headers["etag"]
+
+    created = admin_client.post("/api/v1/library/create", json={
+        "title": "Lesson", "video_url": "https://youtu.be/abcdefghijk", "surah_no": 2,
+        "starting_ayah": 1, "ending_ayah": 5,
+    })
+    after = admin_client.get("/api/v1/library", headers={"If-None-Match": etag})
+
+    assert created.status_code == 200, created.text
+    assert after.status_code == 200
+    assert [v["title"] for v in after.json()["result"]] == ["Lesson"]
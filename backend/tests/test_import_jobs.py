@@ -0,0 +1,36 @@
+import os
+import pytest
+from app.config import settings
+from app.models.import_job import ImportJob
+from app.models.video import Video
+from app.utils.import_jobs import run_import_job
+
+@pytest.fixture
+def job(db, surahs):
+    os.makedirs(settings.IMPORT_DIR, exist_ok=True)
+    with open(os.path.join(settings.IMPORT_DIR, "sheet.csv"), "w") as f:
+        f.write("title,video_url,surah_no,starting_ayah,ending_ayah\n"
+                "Lesson 1,https://youtu.be/abcdefghijk,2,1,5\n")
+    job = ImportJob(filename="sheet.csv", source_path="sheet.csv", status="running")
+    db.add(job)
+    db.commit()
+    return job
+
+@pytest.mark.anyio
+async def test_job_completes(db, job):
+    await run_import_job(job.id)
+
+    db.refresh(job)
+    assert (job.status, job.progress, job.inserted_rows) == ("completed", 100.0, 1)
+    assert db.query(Video).count() == 1
+
+@pytest.mark.anyio
+async def test_reaped_job_stays_failed(db, job):
+    # fail_stale_jobs() gave up on the job while this worker was still importing
+    job.status, job.error = "failed", "Interrupted (no progress reported)"
+    db.commit()
+
+    await run_import_job(job.id)
+
+    db.refresh(job)
+    assert (job.status, job.error) == ("failed", "Interrupted (no progress reported)")
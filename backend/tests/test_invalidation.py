@@ -0,0 +1,45 @@
+import pytest
+from app.core import surah_catalog
+from app.core.invalidation import InvalidationBus, LocalBackend, bus
+from app.core.surah_catalog import SurahCatalog, swap_surah_catalog
+from app.utils.conditional import LIBRARY, SURAH
+from app.utils.responses import EncodedJSON, cached_json, version_key
+
+@pytest.fixture
+async def peer():
+    """The app's bus and a second worker's bus, attached to one LocalBackend hub"""
+    hub = []
+    other = InvalidationBus()
+    await bus.start(LocalBackend(hub))
+    await other.start(LocalBackend(hub))
+    try:
+        yield other
+    finally:
+        await other.stop()
+        await bus.stop()
+
+async def cached(body: bytes) -> bytes:
+    async def build():
+        return EncodedJSON(body)
+    return (await cached_json(version_key(LIBRARY, "page-1"), build)).body
+
+@pytest.mark.anyio
+async def test_publish_elsewhere_invalidates_response_cache(peer):
+    assert await cached(b"before") == b"before"
+    assert await cached(b"after") == b"before"  # Served from the cache
+
+    peer.publish(LIBRARY)
+    await peer.stop()  # Waits for delivery
+
+    assert await cached(b"after") == b"after"
+
+@pytest.mark.anyio
+async def test_publish_elsewhere_drops_surah_catalog(peer):
+    swap_surah_catalog(SurahCatalog([]))
+
+    bus.publish(SURAH)  # The writer keeps the snapshot it just swapped in
+    assert surah_catalog._catalog is not None
+
+    peer.publish(SURAH)
+    await peer.stop()
+    assert surah_catalog._catalog is None
@@ -0,0 +1,31 @@
+import pytest
+from app.config import settings
+
+@pytest.fixture
+def metrics_token(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+    return "scrape-secret"
+
+def test_requires_auth_by_default(client):
+    assert client.get("/metrics").status_code == 401
+
+def test_scraper_token(client, metrics_token):
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+    response = client.get("/metrics", headers={"Authorization": f"Bearer {metrics_token}"})
+
+    assert response.status_code == 200
+    assert "app_cache_hits_total" in response.text
+
+def test_admin_session(admin_client):
+    assert admin_client.get("/metrics").status_code == 200
+
+def test_other_users_are_refused(client, add_user):
+    client.cookies.set("token", add_user("student@example.com", "user"))
+
+    assert client.get("/metrics").status_code == 401
+
+def test_public_opt_out(client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_PUBLIC", True)
+
+    assert client.get("/metrics").status_code == 200
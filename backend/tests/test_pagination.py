@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import select
+from app.api.v1.registrations import REGISTRATIONS_TOPIC
+from app.core.invalidation import InvalidationBus, LocalBackend, bus
+from app.database import AsyncSessionLocal
+from app.models.registration import ClassRegistration
+from app.models.video import Video
+from app.utils.pagination import CountCache, estimate_count
+
+def add_videos(db):
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    created = [
+        base + timedelta(microseconds=63506),  # Rounds up to .064 at millisecond precision
+        base + timedelta(microseconds=63506),  # Exact tie: broken by id
+        base + timedelta(microseconds=63900),  # Same millisecond, later
+        base + timedelta(microseconds=64100),
+        base,                                  # Whole second
+        base + timedelta(seconds=1),
+        None,                                  # CURRENT_TIMESTAMP: stored without a fraction
+        None,
+    ]
+    for i, value in enumerate(created):
+        video = Video(title=f"Lesson {i}", video_url=f"https://youtu.be/{i:011d}", surah_no=1,
+                      starting_ayah=1, ending_ayah=5)
+        if value is not None:
+            video.created_date = value
+        db.add(video)
+    db.commit()
+    return {v.id for v in db.query(Video)}
+
+def walk(client, sort: str, limit: int) -> list[int]:
+    ids, cursor = [], None
+    for _ in range(100):  # A cursor that does not advance would loop forever
+        params = {"limit": limit, "sort": sort}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/api/v1/library", params=params).json()
+        ids += [v["id"] for v in body["result"]]
+        cursor = body["next_cursor"]
+        if not cursor:
+            return ids
+    pytest.fail(f"pagination did not terminate: {ids[:20]}...")
+
+@pytest.mark.parametrize("sort", ["ASC", "DESC"])
+@pytest.mark.parametrize("limit", [1, 2, 3])
+def test_keyset_walk_has_no_duplicates_or_gaps(client, db, sort, limit):
+    expected = add_videos(db)
+
+    ids = walk(client, sort, limit)
+
+    assert len(ids) == len(set(ids)), f"duplicates: {ids}"
+    assert set(ids) == expected
+
+def test_keyset_walk_matches_single_page_order(client, db):
+    add_videos(db)
+
+    for sort in ("ASC", "DESC"):
+        whole = [v["id"] for v in client.get("/api/v1/library", params={"limit": 100, "sort": sort}).json()["result"]]
+        assert walk(client, sort, 2) == whole
+
+@pytest.mark.anyio
+async def test_estimate_count_binds_filter_values(pg_session):
+    # ":word" and quotes in a value used to break the inlined EXPLAIN text
+    query = select(ClassRegistration).where(ClassRegistration.status == "x:pending 'quoted'")
+
+    assert await estimate_count(pg_session, query) >= 0
+
+def add_registrations(db, n: int, status: str = "pending"):
+    db.add_all(ClassRegistration(name=f"Student {i}", email=f"s{i}@example.com", phone="+1 555 0100",
+                                 country="UK", preferred_language="English", preferred_day="Saturday",
+                                 preferred_time="Morning", status=status) for i in range(n))
+    db.commit()
+
+def exact_total(client, **params) -> int:
+    return client.get("/api/v1/class-registration", params={"withTotal": "exact", **params}).json()["total"]
+
+def test_exact_total_is_cached_until_a_write(admin_client, db):
+    add_registrations(db, 3)
+    assert exact_total(admin_client) == 3
+    assert exact_total(admin_client, status="pending") == 3
+
+    add_registrations(db, 2)  # Behind the app's back: served from the cache
+    assert exact_total(admin_client) == 3
+
+    reg_id = db.query(ClassRegistration.id).first()[0]
+    assert admin_client.put(f"/api/v1/class-registration/{reg_id}", json={"status": "contacted"}).status_code == 200
+
+    assert exact_total(admin_client) == 5
+    assert exact_total(admin_client, status="pending") == 4
+
+@pytest.mark.anyio
+async def test_write_in_another_process_drops_counts(admin_client, db):
+    add_registrations(db, 1)
+    assert exact_total(admin_client) == 1
+    add_registrations(db, 1)
+
+    hub, other = [], InvalidationBus()
+    await bus.start(LocalBackend(hub))
+    await other.start(LocalBackend(hub))
+    try:
+        other.publish(REGISTRATIONS_TOPIC)
+        await other.stop()  # Waits for delivery
+    finally:
+        await bus.stop()
+
+    assert exact_total(admin_client) == 2
+
+@pytest.mark.anyio
+async def test_count_cache_is_bounded(db):
+    add_registrations(db, 2)
+    counts = CountCache("test-counts", ttl=60, maxsize=2)
+    query = select(ClassRegistration)
+
+    async with AsyncSessionLocal() as session:
+        for key in ("a", "b", "c"):
+            assert await counts.get(session, key, query) == 2
+
+    assert counts._counts.stats()["size"] == 2
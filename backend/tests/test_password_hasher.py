@@ -0,0 +1,72 @@
+import threading
+import anyio
+import pytest
+from fastapi import HTTPException
+from passlib.hash import bcrypt
+from app.config import settings
+from app.core.security import PasswordHasher
+from app.models.user import User
+
+@pytest.fixture
+def old_hash_user(db):
+    # Hashed with a different cost than BCRYPT_ROUNDS, e.g. before the setting changed
+    db.add(User(email="reader@example.com", username="reader", role="user",
+                password_hash=bcrypt.using(rounds=settings.BCRYPT_ROUNDS + 1).hash("secret")))
+    db.commit()
+
+def stored_hash(db) -> str:
+    db.expire_all()
+    return db.query(User).filter_by(email="reader@example.com").one().password_hash
+
+def login(client, password: str = "secret"):
+    return client.post("/api/v1/auth/login", json={"email": "reader@example.com", "password": password})
+
+def test_login_rehashes_outdated_cost(client, db, old_hash_user):
+    before = stored_hash(db)
+
+    assert login(client).status_code == 200
+
+    after = stored_hash(db)
+    assert after != before
+    assert bcrypt.from_string(after).rounds == settings.BCRYPT_ROUNDS
+    assert bcrypt.verify("secret", after)
+
+    assert login(client).status_code == 200
+    assert stored_hash(db) == after  # Up to date: left alone
+
+def test_failed_login_keeps_the_hash(client, db, old_hash_user):
+    before = stored_hash(db)
+
+    assert login(client, "wrong").status_code == 401
+    assert stored_hash(db) == before
+
+@pytest.mark.anyio
+async def test_hasher_bounds_concurrency_and_queue():
+    hasher = PasswordHasher(workers=1, max_pending=1)
+    release = threading.Event()
+    results, rejected = [], []
+
+    def slow_hash(value):
+        release.wait(5)
+        return value
+
+    async def hash_one(value):
+        try:
+            results.append(await hasher.run(slow_hash, value))
+        except HTTPException as e:
+            rejected.append((e.status_code, e.headers))
+
+    try:
+        async with anyio.create_task_group() as tg:
+            for value in range(3):
+                tg.start_soon(hash_one, value)
+            await anyio.sleep(0.05)
+            # One running, one queued, the third turned away
+            assert (hasher.running, hasher.waiting) == (1, 1)
+            assert rejected == [(503, {"Retry-After": "1"})]
+            release.set()
+    finally:
+        hasher.shutdown()
+
+    assert sorted(results) == [0, 1]
+    assert (hasher.completed, hasher.rejected, hasher.max_waiting) == (2, 1, 1)
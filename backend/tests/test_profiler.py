@@ -0,0 +1,42 @@
+import anyio
+import pytest
+from app.core.profiler import ProfilerMiddleware, ProfileStore
+
+async def slow_app(scope, receive, send):
+    await anyio.sleep(0.05)
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+async def admin_after_a_lookup(token):
+    await anyio.sleep(0.01)  # Session lookup in the database
+    return token == "admin"
+
+async def profiled(middleware) -> bool:
+    scope = {"type": "http", "method": "GET", "path": "/", "query_string": b"profile=1",
+             "headers": [(b"cookie", b"token=admin")]}
+    headers = {}
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            headers.update(message["headers"])
+
+    await middleware(scope, receive, send)
+    return b"x-profile-id" in headers
+
+@pytest.mark.anyio
+async def test_one_profile_at_a_time(tmp_path):
+    middleware = ProfilerMiddleware(slow_app, ProfileStore(str(tmp_path), 10), admin_after_a_lookup)
+    results = []
+
+    async def request():
+        results.append(await profiled(middleware))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(request)
+
+    assert sorted(results) == [False, False, True]
+    assert len(ProfileStore(str(tmp_path), 10).list()) == 1
@@ -0,0 +1,39 @@
+import pytest
+from app.core.query_log import query_budget
+from app.models.ebook import EBook
+from app.models.import_job import ImportJob
+from app.models.registration import ClassRegistration
+from app.models.video import Video
+from app.utils.responses import response_cache
+
+ROWS = 30  # One query per row would blow every budget below
+
+@pytest.fixture
+def rows(db, surahs):
+    db.add_all(Video(title=f"Lesson {i}", video_url="https://youtu.be/abcdefghijk", surah_no=2,
+                     starting_ayah=1, ending_ayah=5, keywords="tafsir") for i in range(ROWS))
+    db.add_all(EBook(title=f"Notes {i}", filename="notes.pdf") for i in range(ROWS))
+    db.add_all(ClassRegistration(name=f"Student {i}", email=f"student{i}@example.com", phone="+919000000000",
+                                 country="India", preferred_language="English", preferred_day="Weekends",
+                                 preferred_time="Evening", status="pending") for i in range(ROWS))
+    db.add_all(ImportJob(filename="sheet.csv", source_path="sheet.csv", status="completed") for i in range(ROWS))
+    db.commit()
+
+@pytest.mark.parametrize("url, budget", [
+    ("/api/v1/library?limit=50", 1),
+    ("/api/v1/library?surah=2&versus=3&limit=50", 1),
+    ("/api/v1/library?search=tafsir&limit=50", 1),
+    ("/api/v1/ebooks?limit=50", 1),
+    ("/api/v1/class-registration?perPage=50&status=pending", 1),
+    ("/api/v1/class-registration?perPage=50&withTotal=exact", 2),  # Plus the COUNT
+    ("/api/v1/library/imports?limit=50", 1),
+])
+def test_list_routes_stay_within_query_budget(admin_client, rows, url, budget):
+    admin_client.get("/api/v1/auth/me")  # Session user cached, as on any later request
+    response_cache.clear()
+
+    with query_budget(budget):
+        response = admin_client.get(url)
+
+    assert response.status_code == 200
+    assert len(response.json()["result"]) == ROWS
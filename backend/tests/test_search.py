@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import select
+from app.models.ebook import EBook
+from app.models.surah import Surah
+from app.models.video import Video
+from app.utils.search import apply_video_search
+
+LESSONS = [
+    # title, surah_name, keywords
+    ("Tafsir of Al-Fatiha", "Al-Fatiha", "opening, tafsir"),
+    ("Word by word: Al-Fatiha", "Al-Fatiha", "grammar"),
+    ("Grammar notes", "Al-Baqarah", "tafsir, grammar"),
+    ("Recitation", "Al-Baqarah", None),
+]
+
+def lesson_videos(surah_no: int = 2) -> list[Video]:
+    return [
+        Video(title=title, surah_name=surah_name, keywords=keywords, surah_no=surah_no,
+              video_url="https://youtu.be/abcdefghijk", starting_ayah=1, ending_ayah=5)
+        for title, surah_name, keywords in LESSONS
+    ]
+
+@pytest.fixture
+def videos(db, surahs):
+    db.add_all(lesson_videos())
+    db.commit()
+
+def titles(client, search: str) -> list[str]:
+    body = client.get("/api/v1/library", params={"search": search}).json()
+    return sorted(v["title"] for v in body["result"])
+
+def test_fallback_matches_any_column_case_insensitively(client, videos):
+    assert titles(client, "TAFSIR") == ["Grammar notes", "Tafsir of Al-Fatiha"]  # Title or keywords
+    assert titles(client, "baqarah") == ["Grammar notes", "Recitation"]  # Surah name
+
+def test_fallback_requires_every_term(client, videos):
+    assert titles(client, "fatiha grammar") == ["Word by word: Al-Fatiha"]
+    assert titles(client, "fatiha recitation") == []
+
+def test_fallback_ignores_punctuation(client, videos):
+    # No word characters: no filter
+    assert len(titles(client, "%!?")) == len(LESSONS)
+    assert titles(client, "al-fatiha, tafsir!") == ["Tafsir of Al-Fatiha"]
+
+def test_fallback_matches_underscore_literally(client, db, videos):
+    db.add_all(Video(title=title, surah_no=2, video_url="https://youtu.be/abcdefghijk")
+               for title in ("axb lesson", "a_b lesson"))
+    db.commit()
+
+    # "_" is a LIKE wildcard: unescaped, "a_b" would match "axb" and "_" every row
+    assert titles(client, "a_b") == ["a_b lesson"]
+    assert titles(client, "_") == ["a_b lesson"]
+
+@pytest.mark.anyio
+async def test_ranking_prefers_title_matches(pg_session):
+    surah_no = 114
+    await pg_session.merge(Surah(id=surah_no, name="An-Nas", total_verses=6))
+    pg_session.add_all(lesson_videos(surah_no))
+    await pg_session.flush()
+
+    query, rank = apply_video_search(select(Video.title).where(Video.surah_no == surah_no), "tafs", "postgresql")
+    ranked = (await pg_session.execute(query.order_by(rank.desc(), Video.title))).scalars().all()
+
+    # Prefix match; title (weight A) beats keywords (weight C); non-matches excluded
+    assert ranked == ["Tafsir of Al-Fatiha", "Grammar notes"]
+
+def test_ebooks_search_pages_through_matches(client, db):
+    db.add_all(EBook(title=f"{topic} notes {i}", filename="notes.pdf")
+               for i in range(3) for topic in ("Tafsir", "Grammar"))
+    db.commit()
+
+    first = client.get("/api/v1/ebooks", params={"search": "tafsir", "limit": 2}).json()
+    rest = client.get("/api/v1/ebooks", params={"search": "tafsir", "limit": 2,
+                                                "cursor": first["next_cursor"]}).json()
+
+    assert sorted(e["title"] for e in first["result"] + rest["result"]) == \
+        ["Tafsir notes 0", "Tafsir notes 1", "Tafsir notes 2"]
+    assert rest["next_cursor"] is None
@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+from app.utils import cache
+from app.utils.singleflight import SingleFlight
+
+class Clock:
+    """Stands in for the time module in app.utils.cache"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache, "time", clock)
+    return clock
+
+async def call_together(flight: SingleFlight, key, fn, n: int = 5) -> list:
+    return await asyncio.gather(*(flight.do(key, fn) for _ in range(n)), return_exceptions=True)
+
+@pytest.mark.anyio
+async def test_concurrent_calls_share_one_execution():
+    flight, calls = SingleFlight(), []
+
+    async def query():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ["row"]
+
+    results = await call_together(flight, "page-1", query)
+
+    assert len(calls) == 1
+    assert results == [["row"]] * 5
+    assert all(r is results[0] for r in results)
+    assert (flight.executions, flight.joined) == (1, 4)
+
+@pytest.mark.anyio
+async def test_concurrent_calls_share_the_exception():
+    flight, calls = SingleFlight(ttl=60), []
+
+    async def failing():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("database down")
+
+    results = await call_together(flight, "page-1", failing)
+
+    assert len(calls) == 1
+    assert all(isinstance(r, ValueError) and r is results[0] for r in results)
+
+    # Errors are not cached: the next call runs again
+    async def working():
+        return ["row"]
+    assert await flight.do("page-1", working) == ["row"]
+    assert flight.stats()["in_flight"] == 0
+
+@pytest.mark.anyio
+async def test_different_keys_run_separately():
+    flight = SingleFlight()
+
+    async def query():
+        await asyncio.sleep(0.01)
+        return object()
+
+    first, second = await asyncio.gather(flight.do("page-1", query), flight.do("page-2", query))
+
+    assert first is not second
+    assert flight.executions == 2
+
+@pytest.mark.anyio
+async def test_result_reused_until_ttl_expires(clock):
+    flight, calls = SingleFlight(ttl=2.0), []
+
+    async def query():
+        calls.append(1)
+        return len(calls)
+
+    assert await flight.do("page-1", query) == 1
+    clock.now += 1.9
+    assert await flight.do("page-1", query) == 1  # Within the TTL
+    clock.now += 0.2
+    assert await flight.do("page-1", query) == 2  # Expired: runs again
+    assert flight.stats()["cache_hits"] == 1
+
+@pytest.mark.anyio
+async def test_no_ttl_keeps_nothing(clock):
+    flight, calls = SingleFlight(), []
+
+    async def query():
+        calls.append(1)
+        return len(calls)
+
+    assert [await flight.do("page-1", query) for _ in range(2)] == [1, 2]
+
+@pytest.mark.anyio
+async def test_cancelled_caller_does_not_cancel_the_others():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def query():
+        started.set()
+        await asyncio.sleep(0.02)
+        return "rows"
+
+    first = asyncio.ensure_future(flight.do("page-1", query))
+    await started.wait()
+    second = asyncio.ensure_future(flight.do("page-1", query))
+    first.cancel()
+
+    assert await second == "rows"
+    assert first.cancelled()
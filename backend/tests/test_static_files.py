@@ -0,0 +1,137 @@
+import gzip
+import re
+import pytest
+from app.core.static_files import MAX_RANGES, StaticFileServer, parse_ranges
+
+CONTENT = bytes(range(256)) * 4  # 1 KiB, every offset distinguishable
+
+@pytest.fixture
+def server(tmp_path):
+    (tmp_path / "book.pdf").write_bytes(CONTENT)
+    (tmp_path / "notes.txt").write_bytes(CONTENT)
+    (tmp_path / "notes.txt.gz").write_bytes(gzip.compress(CONTENT))
+    (tmp_path / "notes.txt.br").write_bytes(b"brotli bytes")
+    return StaticFileServer(str(tmp_path))
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-9", [(0, 10)]),
+    ("bytes=5-", [(5, 100)]),
+    ("bytes=-10", [(90, 100)]),  # Suffix: last 10 bytes
+    ("bytes=-500", [(0, 100)]),  # Suffix longer than the file
+    ("bytes=90-200", [(90, 100)]),  # End clamped
+    ("bytes=0-9,5-19", [(0, 20)]),  # Overlapping ranges merge
+    ("bytes=10-19,0-9", [(0, 20)]),  # Adjacent, out of order
+    ("bytes=0-0,50-59", [(0, 1), (50, 60)]),
+    ("bytes=200-300", []),  # Unsatisfiable: 416
+    ("bytes=-0", []),
+    ("bytes=9-5", None),  # Invalid: ignored (200)
+    ("bytes=abc", None),
+    ("items=0-9", None),
+])
+def test_parse_ranges(header, expected):
+    assert parse_ranges(header, 100) == expected
+
+def test_too_many_ranges_are_ignored():
+    spec = ",".join(f"{i * 4}-{i * 4 + 1}" for i in range(MAX_RANGES + 1))
+    merged = ",".join(f"{i * 4}-{i * 4 + 3}" for i in range(MAX_RANGES + 1))  # Adjacent: merges into one
+
+    assert parse_ranges(f"bytes={merged}", 100) == [(0, (MAX_RANGES + 1) * 4)]
+    assert parse_ranges(f"bytes={spec}", 100) is None
+
+@pytest.mark.anyio
+async def test_single_range(server, asgi):
+    status, headers, body, _ = await asgi(server, "GET", "/book.pdf", {"Range": "bytes=10-19"})
+
+    assert status == 206
+    assert headers["content-range"] == f"bytes 10-19/{len(CONTENT)}"
+    assert body == CONTENT[10:20]
+
+@pytest.mark.anyio
+async def test_multipart_ranges(server, asgi):
+    status, headers, body, _ = await asgi(server, "GET", "/book.pdf", {"Range": "bytes=0-3,100-107"})
+
+    assert status == 206
+    boundary = re.match(r"multipart/byteranges; boundary=(\w+)$", headers["content-type"]).group(1)
+    assert int(headers["content-length"]) == len(body)
+    parts = body.split(f"--{boundary}".encode())
+    assert parts[-1] == b"--\r\n"
+    assert [p.split(b"\r\n\r\n", 1)[1].removesuffix(b"\r\n") for p in parts[1:-1]] == \
+        [CONTENT[0:4], CONTENT[100:108]]
+    assert f"Content-Range: bytes 100-107/{len(CONTENT)}".encode() in parts[2]
+
+@pytest.mark.anyio
+async def test_unsatisfiable_range(server, asgi):
+    status, headers, _, _ = await asgi(server, "GET", "/book.pdf", {"Range": "bytes=5000-"})
+
+    assert status == 416
+    assert headers["content-range"] == f"bytes */{len(CONTENT)}"
+
+@pytest.mark.anyio
+async def test_too_many_ranges_send_whole_file(server, asgi):
+    spec = ",".join(f"{i * 10}-{i * 10 + 1}" for i in range(MAX_RANGES + 1))
+
+    status, _, body, _ = await asgi(server, "GET", "/book.pdf", {"Range": f"bytes={spec}"})
+
+    assert (status, body) == (200, CONTENT)
+
+@pytest.mark.anyio
+async def test_if_range(server, asgi):
+    _, headers, _, _ = await asgi(server, "GET", "/book.pdf")
+
+    matching = await asgi(server, "GET", "/book.pdf", {"Range": "bytes=0-9", "If-Range": headers["etag"]})
+    stale = await asgi(server, "GET", "/book.pdf", {"Range": "bytes=0-9", "If-Range": '"older-version"'})
+
+    assert (matching[0], matching[2]) == (206, CONTENT[:10])
+    assert (stale[0], stale[2]) == (200, CONTENT)  # Changed since: whole new file
+
+@pytest.mark.anyio
+async def test_not_modified(server, asgi):
+    _, headers, _, _ = await asgi(server, "GET", "/book.pdf")
+
+    status, _, body, _ = await asgi(server, "GET", "/book.pdf", {"If-None-Match": headers["etag"]})
+
+    assert (status, body) == (304, b"")
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("range_header", [None, "bytes=0-9", "bytes=0-3,100-107"])
+async def test_head_matches_get_without_body(server, asgi, range_header):
+    headers = {"Range": range_header} if range_header else {}
+
+    get_status, get_headers, get_body, _ = await asgi(server, "GET", "/book.pdf", headers)
+    status, head_headers, body, _ = await asgi(server, "HEAD", "/book.pdf", headers)
+
+    assert (status, body) == (get_status, b"")
+    assert head_headers["content-length"] == get_headers["content-length"] == str(len(get_body))
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("accept, encoding", [
+    ("br, gzip", "br"),
+    ("gzip, br;q=0.5", "gzip"),
+    ("br;q=0, gzip", "gzip"),  # q=0 means "not acceptable"
+    ("*", "br"),
+    ("br;q=0, *;q=0", None),
+    ("identity", None),
+])
+async def test_precompressed_variant(server, asgi, accept, encoding):
+    status, headers, body, _ = await asgi(server, "GET", "/notes.txt", {"Accept-Encoding": accept})
+
+    assert status == 200
+    assert headers.get("content-encoding") == encoding
+    assert headers["vary"] == "Accept-Encoding"
+    if encoding == "gzip":
+        assert gzip.decompress(body) == CONTENT
+    elif encoding is None:
+        assert body == CONTENT
+
+@pytest.mark.anyio
+async def test_range_request_ignores_precompressed_variant(server, asgi):
+    status, headers, body, _ = await asgi(server, "GET", "/notes.txt", {"Accept-Encoding": "gzip", "Range": "bytes=0-9"})
+
+    assert (status, body) == (206, CONTENT[:10])
+    assert "content-encoding" not in headers
+
+@pytest.mark.anyio
+async def test_path_traversal_is_not_found(server, asgi):
+    status, _, _, _ = await asgi(server, "GET", "/../etc/passwd")
+
+    assert status == 404
@@ -0,0 +1,81 @@
+import pytest
+from app.core.invalidation import InvalidationBus, LocalBackend, bus
+from app.core.security import get_password_hash
+from app.core.user_cache import USER_TOPIC, cached_user, token_cache, user_cache
+from app.models.user import User
+
+@pytest.fixture
+def editor(client, add_user):
+    client.cookies.set("token", add_user("editor@example.com", "admin"))
+    return client
+
+def user(db, email: str = "editor@example.com") -> User:
+    return db.query(User).filter_by(email=email).one()
+
+def test_repeat_requests_hit_the_cache(editor):
+    assert editor.get("/api/v1/auth/me").status_code == 200
+    hits = user_cache.hits
+
+    assert editor.get("/api/v1/auth/me").status_code == 200
+    assert user_cache.hits == hits + 1
+
+def test_role_change_applies_on_the_next_request(editor, db):
+    assert editor.get("/api/v1/auth/cache-stats").status_code == 200
+
+    user(db).role = "user"
+    db.commit()
+
+    assert editor.get("/api/v1/auth/cache-stats").status_code == 403
+    assert editor.get("/api/v1/auth/me").json()["role"] == "user"
+
+def test_password_change_drops_user_and_tokens(editor, db):
+    token = editor.cookies["token"]
+    editor.get("/api/v1/auth/me")
+    assert cached_user("editor@example.com") is not None
+    assert token_cache.get(token) is not None
+
+    user(db).password_hash = get_password_hash("new secret")
+    db.commit()
+
+    assert cached_user("editor@example.com") is None
+    assert token_cache.get(token) is None
+
+def test_rolled_back_change_keeps_the_cache(editor, db):
+    editor.get("/api/v1/auth/me")
+
+    user(db).role = "user"
+    db.flush()
+    db.rollback()
+
+    assert cached_user("editor@example.com").role == "admin"
+
+def test_email_change_drops_the_old_address(editor, db):
+    editor.get("/api/v1/auth/me")
+
+    user(db).email = "renamed@example.com"
+    db.commit()
+
+    assert cached_user("editor@example.com") is None
+    assert editor.get("/api/v1/auth/me").status_code == 401  # The token names the old address
+
+def test_deleted_user_is_rejected(editor, db):
+    editor.get("/api/v1/auth/me")
+
+    db.delete(user(db))
+    db.commit()
+
+    assert editor.get("/api/v1/auth/me").status_code == 401
+
+@pytest.mark.anyio
+async def test_change_in_another_process_drops_the_cache(editor):
+    editor.get("/api/v1/auth/me")
+    hub, other = [], InvalidationBus()
+    await bus.start(LocalBackend(hub))
+    await other.start(LocalBackend(hub))
+    try:
+        other.publish(USER_TOPIC, "editor@example.com")
+        await other.stop()  # Waits for delivery
+    finally:
+        await bus.stop()
+
+    assert cached_user("editor@example.com") is None
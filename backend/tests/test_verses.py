@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from app.models.video import Video
+from app.utils.pagination import explain
+from app.utils.verses import apply_verse_filter
+
+@pytest.fixture
+def videos(db, surahs):
+    for start, end in [(1, 5), (3, 8), (6, 10), (7, None)]:
+        db.add(Video(title=f"Lesson {start}", video_url="https://youtu.be/abcdefghijk", surah_no=2,
+                     starting_ayah=start, ending_ayah=end))
+    db.commit()
+
+def titles(client, **params):
+    body = client.get("/api/v1/library", params={"surah": 2, **params}).json()
+    return sorted(v["title"] for v in body["result"])
+
+def test_point_matches_videos_covering_the_ayah(client, videos):
+    assert titles(client, versus="4") == ["Lesson 1", "Lesson 3"]
+    assert titles(client, versus="9") == ["Lesson 6", "Lesson 7"]  # Open-ended range included
+
+def test_range_matches_videos_inside_it(client, videos):
+    assert titles(client, versus="1-8") == ["Lesson 1", "Lesson 3"]
+
+def test_inverted_range_is_rejected(client, videos):
+    response = client.get("/api/v1/library", params={"surah": 2, "versus": "5-1"})
+
+    assert response.status_code == 400
+
+@pytest.mark.parametrize("path, as_list", [
+    ("/api/v1/library/create", False),
+    ("/api/v1/library/bulk-create", True),
+])
+def test_inverted_video_range_is_rejected_on_write(admin_client, path, as_list):
+    video = {"title": "Lesson", "video_url": "https://youtu.be/abcdefghijk", "surah_no": 2,
+             "starting_ayah": 7, "ending_ayah": 3}
+
+    response = admin_client.post(path, json=[video] if as_list else video)
+
+    assert response.status_code == 422
+
+def test_inverted_range_violates_constraint(db, surahs):
+    db.add(Video(title="Lesson", video_url="https://youtu.be/abcdefghijk", surah_no=2,
+                 starting_ayah=7, ending_ayah=3))
+    with pytest.raises(IntegrityError):
+        db.commit()
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("versus", ["3", "1-5"])
+async def test_verse_filter_uses_range_index(pg_session, versus):
+    # Small test tables favour sequential scans; rule them out to see which index the planner picks
+    conn = await pg_session.connection()
+    await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    query = apply_verse_filter(select(Video).where(Video.surah_no == 2), versus, "postgresql")
+
+    plan = "\n".join(await explain(pg_session, query, "COSTS OFF"))
+
+    assert "ix_videos_surah_ayah_range" in plan, plan
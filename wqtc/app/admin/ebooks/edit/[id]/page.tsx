@@ -34,8 +34,7 @@ export default function EditEBookPage({ params }: { params: Promise<{ id: string
 
   const fetchEBook = async () => {
     try {
-      const data = await api.getEbooks({});
-      const ebook = (data || []).find((e: any) => e.id === parseInt(id));
+      const ebook = await api.findEbook(parseInt(id));
 
       if (ebook) {
         setFormData({
@@ -13,6 +13,8 @@ export default function AdminEBooksPage() {
   const [ebooks, setEbooks] = useState<EBook[]>([]);
   const [searchTerm, setSearchTerm] = useState('');
   const [loading, setLoading] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     fetchEBooks();
@@ -21,12 +23,11 @@ export default function AdminEBooksPage() {
   const fetchEBooks = async () => {
     setLoading(true);
     try {
-      // FastAPI uses GET query params, our api.getEbooks handles this conversion
-      const data = await api.getEbooks({ sort: 'DESC' });
-      // FastAPI returns list directly in some endpoints, or wrapped in 'result'. 
-      // Check your FastAPI response schema. Based on your export:
-      // get_ebooks returns List[EBookResponse] directly.
-      setEbooks(data || []); 
+      // FastAPI uses GET query params, our api.getEbooksPage handles this conversion
+      const data = await api.getEbooksPage({ sort: 'DESC' });
+      // get_ebooks returns ResponseBase[List[EBookResponse]], one page at a time
+      setEbooks(data.result || []);
+      setNextCursor(data.next_cursor || null);
     } catch (error) {
       console.error('Error fetching ebooks:', error);
     } finally {
@@ -34,6 +35,20 @@ export default function AdminEBooksPage() {
     }
   };
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const data = await api.getEbooksPage({ sort: 'DESC' }, nextCursor);
+      setEbooks((prev) => [...prev, ...(data.result || [])]);
+      setNextCursor(data.next_cursor || null);
+    } catch (error) {
+      console.error('Error fetching ebooks:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleDelete = async (id: number) => {
     if (!confirm('Are you sure you want to delete this ebook?')) return;
     
@@ -138,6 +153,18 @@ export default function AdminEBooksPage() {
               </table>
             </div>
           )}
+          {nextCursor && !loading && (
+            <div className="text-center mt-6">
+              <Button
+                onClick={loadMore}
+                disabled={loadingMore}
+                variant="outline"
+                className="border-[#453142] text-[#453142] hover:bg-[#453142]/10"
+              >
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </Button>
+            </div>
+          )}
         </CardContent>
       </Card>
     </div>
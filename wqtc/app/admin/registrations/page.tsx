@@ -37,6 +37,10 @@ interface Registration {
   createdAt: string;
 }
 
+// Rows per request; more are loaded on demand
+const PAGE_SIZE = 50;
+const STATUSES = ['pending', 'confirmed', 'cancelled'] as const;
+
 export default function AdminRegistrationsPage() {
   const router = useRouter();
   const [registrations, setRegistrations] = useState<Registration[]>([]);
@@ -45,11 +49,19 @@ export default function AdminRegistrationsPage() {
   const [searchTerm, setSearchTerm] = useState('');
   const [statusFilter, setStatusFilter] = useState<string>('all');
   const [languageFilter, setLanguageFilter] = useState<string>('all');
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [stats, setStats] = useState({ total: 0, pending: 0, confirmed: 0, cancelled: 0 });
+
+  useEffect(() => {
+    fetchStats();
+  }, []);
 
+  // Status and language are filtered server-side; search applies to the loaded rows
   useEffect(() => {
     fetchRegistrations();
     // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, []);
+  }, [statusFilter, languageFilter]);
 
   useEffect(() => {
     filterRegistrations();
@@ -60,11 +72,12 @@ export default function AdminRegistrationsPage() {
     setLoading(true);
     try {
       // Use the central api client
-      const data = await api.getRegistrations({});
+      const data = await api.getRegistrations(listParams());
       // Some backends return {result: [...]}, some just [...], so support both
       const result = data.result || data || [];
       setRegistrations(result);
       setFilteredRegistrations(result);
+      setNextCursor(data.next_cursor || null);
     } catch (error) {
       console.error('Error fetching registrations:', error);
     } finally {
@@ -72,6 +85,41 @@ export default function AdminRegistrationsPage() {
     }
   };
 
+  const listParams = () => ({ status: statusFilter, language: languageFilter, perPage: PAGE_SIZE });
+
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const data = await api.getRegistrations(listParams(), nextCursor);
+      setRegistrations((prev) => [...prev, ...(data.result || [])]);
+      setNextCursor(data.next_cursor || null);
+    } catch (error) {
+      console.error('Error fetching registrations:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  // Counts come from the server (cached COUNT per filter), not from the loaded pages
+  const fetchStats = async () => {
+    try {
+      const [total, ...byStatus] = await Promise.all(
+        ['all', ...STATUSES].map((status) =>
+          api.getRegistrations({ status, perPage: 1, withTotal: 'exact' })
+        )
+      );
+      setStats({
+        total: total.total ?? 0,
+        pending: byStatus[0].total ?? 0,
+        confirmed: byStatus[1].total ?? 0,
+        cancelled: byStatus[2].total ?? 0,
+      });
+    } catch (error) {
+      console.error('Error fetching registration counts:', error);
+    }
+  };
+
   const filterRegistrations = () => {
     let filtered = [...registrations];
 
@@ -104,6 +152,7 @@ export default function AdminRegistrationsPage() {
       await api.updateRegistrationStatus(id, status);
       alert('Status updated successfully');
       fetchRegistrations();
+      fetchStats();
     } catch (error) {
       console.error('Error updating status:', error);
       alert('Error updating status');
@@ -169,14 +218,9 @@ export default function AdminRegistrationsPage() {
     }
   };
 
-  const stats = {
-    total: registrations.length,
-    pending: registrations.filter((r) => r.status === 'pending').length,
-    confirmed: registrations.filter((r) => r.status === 'confirmed').length,
-    cancelled: registrations.filter((r) => r.status === 'cancelled').length,
-  };
-
-  const languages = Array.from(new Set(registrations.map((r) => r.language)));
+  const languages = Array.from(
+    new Set([...registrations.map((r) => r.language), ...(languageFilter !== 'all' ? [languageFilter] : [])])
+  );
 
   return (
     <div className="container mx-auto px-4 py-8">
@@ -475,6 +519,18 @@ export default function AdminRegistrationsPage() {
               </table>
             </div>
           )}
+          {nextCursor && !loading && (
+            <div className="text-center py-6 border-t">
+              <Button
+                onClick={loadMore}
+                disabled={loadingMore}
+                variant="outline"
+                className="border-[#453142] text-[#453142] hover:bg-[#453142]/10"
+              >
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </Button>
+            </div>
+          )}
         </CardContent>
       </Card>
 
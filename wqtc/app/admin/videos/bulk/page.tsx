@@ -1,6 +1,6 @@
 'use client';
 
-import { useState } from 'react';
+import { useEffect, useState } from 'react';
 import { useRouter } from 'next/navigation';
 import { Button } from '@/components/ui/button';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
@@ -10,9 +10,11 @@ import { api } from '@/lib/api';
 export default function BulkUploadPage() {
   const router = useRouter();
   const [file, setFile] = useState<File | null>(null);
-  const [step, setStep] = useState<'upload' | 'preview'>('upload');
+  const [step, setStep] = useState<'upload' | 'preview' | 'job'>('upload');
   const [previewData, setPreviewData] = useState<{ valid: any[], invalid: any[] }>({ valid: [], invalid: [] });
   const [loading, setLoading] = useState(false);
+  const [job, setJob] = useState<any>(null);
+  const [rejected, setRejected] = useState<{ rows: any[], nextCursor: string | null }>({ rows: [], nextCursor: null });
 
   const handleFileChange = (e: React.ChangeEvent<HTMLInputElement>) => {
     if (e.target.files?.[0]) setFile(e.target.files[0]);
@@ -41,8 +43,9 @@ export default function BulkUploadPage() {
     if (previewData.valid.length === 0) return;
     setLoading(true);
     try {
-      await api.createBulkVideos(previewData.valid);
-      alert(`Successfully imported ${previewData.valid.length} videos!`);
+      const res = await api.createBulkVideos(previewData.valid);
+      alert(res.msg);
+      if (res.result?.failed) return; // Stay on the preview so the failed import can be reviewed
       router.push('/admin/videos');
     } catch (error: any) {
       console.error(error);
@@ -52,6 +55,48 @@ export default function BulkUploadPage() {
     }
   };
 
+  // Alternative to 1 + 2 for large sheets: queue a background import and poll its progress
+  const handleBackgroundImport = async () => {
+    if (!file) return;
+    setLoading(true);
+    try {
+      const formData = new FormData();
+      formData.append('file', file);
+      const res = await api.startVideoImport(formData);
+      setJob(res.result);
+      setRejected({ rows: [], nextCursor: null });
+      setStep('job');
+    } catch (error: any) {
+      alert(error.message || "Failed to start import");
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  useEffect(() => {
+    if (step !== 'job' || !job || job.status === 'completed' || job.status === 'failed') return;
+    const timer = setTimeout(async () => {
+      try {
+        const res = await api.getImportJob(job.id);
+        setJob(res.result);
+      } catch (error) {
+        console.error(error);
+      }
+    }, 2000);
+    return () => clearTimeout(timer);
+  }, [step, job]);
+
+  const loadRejected = async () => {
+    if (!job) return;
+    const res = await api.getImportRejections(job.id, rejected.nextCursor || undefined);
+    setRejected({ rows: [...rejected.rows, ...res.result], nextCursor: res.next_cursor });
+  };
+
+  useEffect(() => {
+    if (job?.status === 'completed' && job.rejected_rows > 0 && rejected.rows.length === 0) loadRejected();
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [job?.status]);
+
   // 3. Helper to download a CSV template
   const downloadTemplate = () => {
     const headers = "title,surah_no,starting_ayah,ending_ayah,youtube_link,keywords";
@@ -120,6 +165,9 @@ export default function BulkUploadPage() {
                   <Button onClick={handlePreview} disabled={loading} className="w-full">
                     {loading ? <Loader2 className="animate-spin mr-2 h-4 w-4"/> : "Analyze File"}
                   </Button>
+                  <Button onClick={handleBackgroundImport} disabled={loading} variant="outline" className="w-full mt-2">
+                    Import in Background (large files)
+                  </Button>
                 </div>
               )}
             </div>
@@ -219,6 +267,69 @@ export default function BulkUploadPage() {
             </div>
           )}
 
+          {/* BACKGROUND IMPORT PROGRESS */}
+          {step === 'job' && job && (
+            <div className="space-y-6">
+              <div>
+                <div className="flex justify-between text-sm mb-2">
+                  <span className="font-medium">{job.filename} &middot; {job.status}</span>
+                  <span>{Math.round(job.progress)}%</span>
+                </div>
+                <div className="w-full bg-gray-100 rounded-full h-3">
+                  <div className="bg-[#453142] h-3 rounded-full transition-all" style={{ width: `${job.progress}%` }} />
+                </div>
+              </div>
+
+              <div className="flex gap-4 text-sm">
+                <div className="bg-green-50 text-green-700 px-4 py-3 rounded-md flex items-center">
+                  <CheckCircle className="mr-2 h-5 w-5" />
+                  {job.inserted_rows} of {job.processed_rows} rows imported
+                </div>
+                {job.rejected_rows > 0 && (
+                  <div className="bg-red-50 text-red-700 px-4 py-3 rounded-md flex items-center">
+                    <AlertTriangle className="mr-2 h-5 w-5" />
+                    {job.rejected_rows} rows rejected
+                  </div>
+                )}
+              </div>
+
+              {job.status === 'failed' && (
+                <p className="text-red-600 text-sm">Import failed: {job.error}</p>
+              )}
+
+              {rejected.rows.length > 0 && (
+                <div className="border border-red-200 rounded-md overflow-hidden">
+                  <div className="bg-red-50 px-4 py-2 font-semibold text-sm text-red-800 border-b border-red-200">Rejected Rows</div>
+                  <div className="max-h-64 overflow-y-auto">
+                    <table className="w-full text-sm text-left">
+                      <tbody>
+                        {rejected.rows.map((err) => (
+                          <tr key={err.row} className="border-b last:border-0">
+                            <td className="p-3 font-bold">{err.row}</td>
+                            <td className="p-3 text-red-600">{err.issues.join(', ')}</td>
+                            <td className="p-3 text-gray-500 text-xs font-mono">{JSON.stringify(err.data)}</td>
+                          </tr>
+                        ))}
+                      </tbody>
+                    </table>
+                  </div>
+                  {rejected.nextCursor && (
+                    <Button variant="ghost" onClick={loadRejected} className="w-full">Load more</Button>
+                  )}
+                </div>
+              )}
+
+              <div className="flex justify-end gap-4 pt-4 border-t">
+                <Button variant="ghost" onClick={() => { setStep('upload'); setFile(null); setJob(null); }}>
+                  Import Another File
+                </Button>
+                <Button onClick={() => router.push('/admin/videos')} className="bg-[#453142] text-white">
+                  Go to Videos
+                </Button>
+              </div>
+            </div>
+          )}
+
         </CardContent>
       </Card>
     </div>
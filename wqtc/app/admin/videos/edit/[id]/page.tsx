@@ -45,8 +45,7 @@ export default function EditVideoPage({ params }: { params: Promise<{ id: string
 
   const fetchVideo = async () => {
     try {
-      const data = await api.getVideos({ sort: 'DESC' });
-      const video = data.result?.find((v: any) => v.id === parseInt(id));
+      const video = await api.findVideo(parseInt(id));
       
       if (video) {
         // Safely handle all fields with fallbacks
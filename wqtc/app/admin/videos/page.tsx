@@ -13,6 +13,8 @@ export default function AdminVideosPage() {
   const [videos, setVideos] = useState<Video[]>([]);
   const [searchTerm, setSearchTerm] = useState('');
   const [loading, setLoading] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     fetchVideos();
@@ -21,8 +23,9 @@ export default function AdminVideosPage() {
   const fetchVideos = async () => {
     setLoading(true);
     try {
-      const data = await api.getVideos({ sort: 'DESC' });
+      const data = await api.getVideosPage({ sort: 'DESC' });
       setVideos(data.result || []);
+      setNextCursor(data.next_cursor || null);
     } catch (error) {
       console.error('Error fetching videos:', error);
     } finally {
@@ -30,6 +33,20 @@ export default function AdminVideosPage() {
     }
   };
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const data = await api.getVideosPage({ sort: 'DESC' }, nextCursor);
+      setVideos((prev) => [...prev, ...(data.result || [])]);
+      setNextCursor(data.next_cursor || null);
+    } catch (error) {
+      console.error('Error fetching videos:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleDelete = async (id: number) => {
     if (!confirm('Are you sure you want to delete this video?')) return;
 
@@ -150,6 +167,18 @@ export default function AdminVideosPage() {
               </table>
             </div>
           )}
+          {nextCursor && !loading && (
+            <div className="text-center mt-6">
+              <Button
+                onClick={loadMore}
+                disabled={loadingMore}
+                variant="outline"
+                className="border-[#453142] text-[#453142] hover:bg-[#453142]/10"
+              >
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </Button>
+            </div>
+          )}
         </CardContent>
       </Card>
     </div>
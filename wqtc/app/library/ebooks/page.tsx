@@ -10,6 +10,9 @@ import dynamic from 'next/dynamic';
 import Image from 'next/image';
 import { api } from '@/lib/api'; // Import the shared client
 
+const PAGE_SIZE = 24;
+const SEARCH_DELAY_MS = 300;
+
 // Dynamic import with SSR disabled to avoid DOMMatrix error
 const PDFFlipbook = dynamic(() => import('@/components/flipbook/PDFFlipbook'), {
   ssr: false,
@@ -45,47 +48,27 @@ export default function EBooksPage() {
   const [hoveredBookId, setHoveredBookId] = useState<number | null>(null);
   const [loading, setLoading] = useState(true);
 
-  // Pagination state
-  const [currentPage, setCurrentPage] = useState(1);
-  const [totalPages, setTotalPages] = useState(1);
-  const [total, setTotal] = useState(0);
-  const ebooksPerPage = 12;
+  // Server-side pages: next_cursor continues the list for the same search
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [activeParams, setActiveParams] = useState<Record<string, any>>({});
 
+  // Search runs on the server; wait for a pause in typing
   useEffect(() => {
-    fetchEBooks();
+    const timer = setTimeout(fetchEBooks, searchTerm ? SEARCH_DELAY_MS : 0);
+    return () => clearTimeout(timer);
     // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [currentPage, searchTerm]);
+  }, [searchTerm]);
 
-  // --- NEW fetchEBooks LOGIC (Sorted Alphabetically) ---
+  // Newest first; more via loadMore
   const fetchEBooks = async () => {
+    const params = { sort: 'DESC', limit: PAGE_SIZE, search: searchTerm.trim() };
+    setActiveParams(params);
     setLoading(true);
     try {
-      // Fetch data (ignoring backend sort since we will sort in frontend)
-      const data = await api.getEbooks({ sort: 'DESC' });
-
-      // Coerce to array either from "data" (FastAPI) or "data.result"
-      let allBooks: EBook[] = Array.isArray(data) ? data : (data.result || []);
-
-      // 1. Frontend Sort: Alphabetical by Title
-      allBooks.sort((a, b) => a.title.localeCompare(b.title));
-
-      // 2. Filter by Search
-      if (searchTerm) {
-        allBooks = allBooks.filter((book) =>
-          book.title.toLowerCase().includes(searchTerm.toLowerCase())
-        );
-      }
-
-      setTotal(allBooks.length);
-      setTotalPages(Math.max(1, Math.ceil(allBooks.length / ebooksPerPage)));
-
-      // 3. Paginate
-      const startIndex = (currentPage - 1) * ebooksPerPage;
-      const endIndex = startIndex + ebooksPerPage;
-      const paginatedBooks = allBooks.slice(startIndex, endIndex);
-
-      setEbooks(paginatedBooks);
-
+      const data = await api.getEbooksPage(params);
+      setEbooks(data.result || []);
+      setNextCursor(data.next_cursor || null);
     } catch (error) {
       console.error('Error fetching ebooks:', error);
     } finally {
@@ -93,11 +76,25 @@ export default function EBooksPage() {
     }
   };
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const data = await api.getEbooksPage(activeParams, nextCursor);
+      setEbooks((prev) => [...prev, ...(data.result || [])]);
+      setNextCursor(data.next_cursor || null);
+    } catch (error) {
+      console.error('Error fetching ebooks:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // Download handler for PDF files using /pdfs (with new rewrite rule)
   const handleDownload = (filename: string) => {
-    // Ensure we get the clean filename (no directory)
+    // filename is relative to /pdfs and may be sharded (ab/cd/<hash>.pdf)
     const cleanFilename = filename.split('/').pop();
-    const fileUrl = `/pdfs/${cleanFilename}`;
+    const fileUrl = `/pdfs/${filename}`;
     const link = document.createElement('a');
     link.href = fileUrl;
     link.download = cleanFilename || 'ebook.pdf';
@@ -122,11 +119,6 @@ export default function EBooksPage() {
           <p className="text-[#453142]/80 text-lg">
             Browse and read our collection of Quran translations
           </p>
-          {total > 0 && (
-            <p className="text-[#453142]/60 text-sm mt-2">
-              {total} ebook{total !== 1 ? 's' : ''} available
-            </p>
-          )}
         </motion.div>
 
         {/* Search */}
@@ -137,10 +129,7 @@ export default function EBooksPage() {
               <input
                 type="text"
                 value={searchTerm}
-                onChange={(e) => {
-                  setSearchTerm(e.target.value);
-                  setCurrentPage(1);
-                }}
+                onChange={(e) => setSearchTerm(e.target.value)}
                 placeholder="Search ebooks..."
                 className="w-full pl-10 pr-4 py-2 border border-[#453142]/20 rounded-md focus:ring-2 focus:ring-[#453142] focus:border-transparent"
               />
@@ -164,7 +153,7 @@ export default function EBooksPage() {
                   key={book.id}
                   initial={{ opacity: 0, y: 20 }}
                   animate={{ opacity: 1, y: 0 }}
-                  transition={{ delay: index * 0.05 }}
+                  transition={{ delay: (index % PAGE_SIZE) * 0.05 }}
                   whileHover={{ y: -8 }}
                 >
                   <Card className="group border-0 shadow-md hover:shadow-xl transition-all duration-300 bg-white overflow-visible rounded-lg">
@@ -382,77 +371,15 @@ export default function EBooksPage() {
               </div>
             )}
 
-            {/* Smart Pagination */}
-            {totalPages > 1 && (
-              <div className="flex justify-center gap-2 mt-8 flex-wrap">
-                <Button
-                  onClick={() => setCurrentPage((prev) => Math.max(prev - 1, 1))}
-                  disabled={currentPage === 1}
-                  variant="outline"
-                  className="border-[#453142] text-[#453142]"
-                >
-                  Previous
-                </Button>
-
-                {/* Smart Page Numbers Generation */}
-                {(() => {
-                  const pages = [];
-                  // Always show these limits
-                  const showEdges = 1;
-                  // Show this many neighbors around current page
-                  const siblings = 1; 
-                  
-                  // Logic to create ranges like: 1 ... 4 5 6 ... 20
-                  for (let i = 1; i <= totalPages; i++) {
-                     if (
-                       i <= showEdges || // First page(s)
-                       i > totalPages - showEdges || // Last page(s)
-                       (i >= currentPage - siblings && i <= currentPage + siblings) // Neighbors
-                     ) {
-                       pages.push(i);
-                     } else if (
-                       (i === currentPage - siblings - 1 && i > showEdges) || 
-                       (i === currentPage + siblings + 1 && i < totalPages - showEdges)
-                     ) {
-                       // Add separator only at the boundaries
-                       pages.push('...');
-                     }
-                  }
-                  
-                  // Deduplicate '...' if logic pushed multiple
-                  const uniquePages = pages.filter((v, i, a) => v !== a[i-1] || typeof v === 'number');
-
-                  return uniquePages.map((page, idx) => {
-                    if (page === '...') {
-                      return (
-                        <span key={`dots-${idx}`} className="px-2 py-2 text-[#453142]/50">
-                          ...
-                        </span>
-                      );
-                    }
-                    return (
-                      <Button
-                        key={page}
-                        onClick={() => setCurrentPage(Number(page))}
-                        className={
-                          currentPage === page
-                            ? 'bg-[#453142] text-[#faf9f7]'
-                            : 'bg-white text-[#453142] border border-[#453142]/20'
-                        }
-                      >
-                        {page}
-                      </Button>
-                    );
-                  });
-                })()}
-
+            {nextCursor && (
+              <div className="flex justify-center mt-8">
                 <Button
-                  onClick={() => setCurrentPage((prev) => Math.min(prev + 1, totalPages))}
-                  disabled={currentPage === totalPages}
+                  onClick={loadMore}
+                  disabled={loadingMore}
                   variant="outline"
-                  className="border-[#453142] text-[#453142]"
+                  className="border-[#453142] text-[#453142] hover:bg-[#453142]/10"
                 >
-                  Next
+                  {loadingMore ? 'Loading...' : 'Load more ebooks'}
                 </Button>
               </div>
             )}
@@ -483,7 +410,7 @@ function FlipbookModal({
   // Download handler for modal, rewritten for consistent PDF path
   const handleDownload = () => {
     const cleanFilename = ebook.filename.split('/').pop();
-    const fileUrl = `/pdfs/${cleanFilename}`;
+    const fileUrl = `/pdfs/${ebook.filename}`;
     const link = document.createElement('a');
     link.href = fileUrl;
     link.download = cleanFilename || 'ebook.pdf';
@@ -10,6 +10,8 @@ import { motion, AnimatePresence } from 'framer-motion';
 import type { Video, Surah } from '@/types/video';
 import { api } from '@/lib/api'; // Import the new client
 
+const PAGE_SIZE = 24;
+
 export default function VideosPage() {
   const [videos, setVideos] = useState<Video[]>([]);
   const [surahs, setSurahs] = useState<Surah[]>([]);
@@ -19,10 +21,10 @@ export default function VideosPage() {
   const [selectedVideo, setSelectedVideo] = useState<Video | null>(null);
   const [loading, setLoading] = useState(false);
 
-  // Pagination
-  const [currentPage, setCurrentPage] = useState(1);
-  const videosPerPage = 12;
-  const [totalPages, setTotalPages] = useState(1);
+  // Server-side pages: next_cursor continues the list under the same filters
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [activeFilters, setActiveFilters] = useState<Record<string, any>>({});
 
   // Fetch Surahs & Videos on mount
   useEffect(() => {
@@ -46,50 +48,21 @@ export default function VideosPage() {
     }
   };
 
-  // --- NEW fetchVideos LOGIC (Sorted Alphabetically) ---
+  // Newest first (best matches first when searching); more via loadMore
   const fetchVideos = async (filters: any = {}) => {
+    const params = {
+      surah: filters.surah,
+      versus: filters.versus,
+      search: filters.search,
+      sort: 'DESC',
+      limit: PAGE_SIZE
+    };
+    setActiveFilters(params);
     setLoading(true);
     try {
-      // Fetch data (ignoring backend sort since we will sort in frontend)
-      const payload = {
-        surah: filters.surah,
-        versus: filters.versus,
-        search: filters.search,
-        sort: 'DESC'
-      };
-      const data = await api.getVideos(payload); // New API call
-
-      let allVideos: Video[] = Array.isArray(data) ? data : (data.result || []);
-
-      // 1. Frontend Sort: Alphabetical by Title
-      allVideos.sort((a, b) => a.title.localeCompare(b.title));
-
-      // 2. Filter by Search
-      if (searchTerm) {
-        allVideos = allVideos.filter((video) =>
-          video.title.toLowerCase().includes(searchTerm.toLowerCase())
-        );
-      }
-
-      // The filters for surah and verse are also handled server-side (payload),
-      // but if you want to guarantee client-side filtering, uncomment below:
-      // if (selectedSurah)
-      //   allVideos = allVideos.filter((v) => v.surah_no === selectedSurah);
-      // if (selectedVerse)
-      //   allVideos = allVideos.filter(
-      //     (v) =>
-      //       v.starting_ayah <= selectedVerse &&
-      //       (v.ending_ayah ? v.ending_ayah >= selectedVerse : v.starting_ayah >= selectedVerse)
-      //   );
-
-      setTotalPages(Math.max(1, Math.ceil(allVideos.length / videosPerPage)));
-
-      // 3. Paginate
-      const startIndex = (currentPage - 1) * videosPerPage;
-      const endIndex = startIndex + videosPerPage;
-      const paginatedVideos = allVideos.slice(startIndex, endIndex);
-
-      setVideos(paginatedVideos);
+      const data = await api.getVideosPage(params);
+      setVideos(data.result || []);
+      setNextCursor(data.next_cursor || null);
     } catch (error) {
       console.error('Error fetching videos:', error);
     } finally {
@@ -97,8 +70,21 @@ export default function VideosPage() {
     }
   };
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const data = await api.getVideosPage(activeFilters, nextCursor);
+      setVideos((prev) => [...prev, ...(data.result || [])]);
+      setNextCursor(data.next_cursor || null);
+    } catch (error) {
+      console.error('Error fetching videos:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleSearch = () => {
-    setCurrentPage(1);
     fetchVideos({
       surah: selectedSurah,
       versus: selectedVerse,
@@ -111,21 +97,10 @@ export default function VideosPage() {
     setSelectedSurah(null);
     setSelectedVerse(null);
     setSearchTerm('');
-    setCurrentPage(1);
     // Explicitly pass nulls to fetchVideos to clear the grid immediately
     fetchVideos({ surah: null, versus: null, search: '' });
   };
 
-  // Whenever currentPage/search/filter changes, refresh displayed videos
-  useEffect(() => {
-    fetchVideos({
-      surah: selectedSurah,
-      versus: selectedVerse,
-      search: searchTerm
-    });
-    // eslint-disable-next-line
-  }, [currentPage]);
-
   // Get verses for selected Surah
   const getVersesForSurah = () => {
     if (!selectedSurah) return [];
@@ -331,7 +306,7 @@ export default function VideosPage() {
                   key={video.id}
                   initial={{ opacity: 0, y: 20 }}
                   animate={{ opacity: 1, y: 0 }}
-                  transition={{ delay: index * 0.05 }}
+                  transition={{ delay: (index % PAGE_SIZE) * 0.05 }}
                   whileHover={{ y: -8 }}
                 >
                   <Card
@@ -381,72 +356,15 @@ export default function VideosPage() {
               </div>
             )}
 
-            {/* Smart Pagination */}
-            {totalPages > 1 && (
-              <div className="flex justify-center gap-2 mt-8 flex-wrap">
+            {nextCursor && (
+              <div className="flex justify-center mt-8">
                 <Button
-                  onClick={() => setCurrentPage(prev => Math.max(prev - 1, 1))}
-                  disabled={currentPage === 1}
+                  onClick={loadMore}
+                  disabled={loadingMore}
                   variant="outline"
-                  className="border-[#453142] text-[#453142]"
-                >
-                  Previous
-                </Button>
-
-                {/* Smart Page Numbers Generation */}
-                {(() => {
-                  const pages: (number | string)[] = [];
-                  const showEdges = 1;
-                  const siblings = 1;
-
-                  for (let i = 1; i <= totalPages; i++) {
-                    if (
-                      i <= showEdges ||
-                      i > totalPages - showEdges ||
-                      (i >= currentPage - siblings && i <= currentPage + siblings)
-                    ) {
-                      pages.push(i);
-                    } else if (
-                      (i === currentPage - siblings - 1 && i > showEdges) ||
-                      (i === currentPage + siblings + 1 && i < totalPages - showEdges)
-                    ) {
-                      pages.push('...');
-                    }
-                  }
-                  // Deduplicate '...' 
-                  const uniquePages = pages.filter((v, idx, arr) => v !== arr[idx - 1] || typeof v === 'number');
-
-                  return uniquePages.map((page, idx) => {
-                    if (page === '...') {
-                      return (
-                        <span key={`dots-${idx}`} className="px-2 py-2 text-[#453142]/50">
-                          ...
-                        </span>
-                      );
-                    }
-                    return (
-                      <Button
-                        key={page}
-                        onClick={() => setCurrentPage(Number(page))}
-                        className={
-                          currentPage === page
-                            ? 'bg-[#453142] text-[#faf9f7]'
-                            : 'bg-white text-[#453142] border border-[#453142]/20'
-                        }
-                      >
-                        {page}
-                      </Button>
-                    );
-                  });
-                })()}
-
-                <Button
-                  onClick={() => setCurrentPage(prev => Math.min(prev + 1, totalPages))}
-                  disabled={currentPage === totalPages}
-                  variant="outline"
-                  className="border-[#453142] text-[#453142]"
+                  className="border-[#453142] text-[#453142] hover:bg-[#453142]/10"
                 >
-                  Next
+                  {loadingMore ? 'Loading...' : 'Load more videos'}
                 </Button>
               </div>
             )}
@@ -34,6 +34,27 @@ async function fetchAPI(endpoint: string, options: ApiOptions = {}) {
   return data;
 }
 
+// Paged list endpoints return { result, next_cursor }; pass next_cursor back
+// as `cursor` for the following page.
+function fetchPage(endpoint: string, params: Record<string, any> = {}, cursor?: string) {
+  const query = Object.entries({ ...params, cursor })
+    .filter(([, value]) => value !== undefined && value !== null && value !== '')
+    .map(([key, value]) => [key, String(value)]);
+  return fetchAPI(`${endpoint}?${new URLSearchParams(query).toString()}`, { method: 'GET' });
+}
+
+// Edit forms look a row up by id: walk pages until it turns up
+async function findInPages(endpoint: string, params: Record<string, any>, id: number) {
+  let cursor: string | undefined;
+  do {
+    const page = await fetchPage(endpoint, params, cursor);
+    const item = (page?.result || []).find((row: any) => row.id === id);
+    if (item) return item;
+    cursor = page?.next_cursor || undefined;
+  } while (cursor);
+  return undefined;
+}
+
 export const api = {
   // Auth
   login: (credentials: any) => 
@@ -44,9 +65,12 @@ export const api = {
     fetchAPI('/auth/me'),
 
   // Library / Videos
-  // FastAPI expects { surah, versus, search, sort, limit } in body for POST /library
-  getVideos: (filters: any) =>
-    fetchAPI('/library', { method: 'POST', body: JSON.stringify(filters) }),
+  // GET /library takes { surah, versus, search, sort, limit } as query params
+  // (same as the POST body) and answers revalidations with ETag / 304
+  getVideosPage: (filters: any, cursor?: string) =>
+    fetchPage('/library', filters, cursor),
+  findVideo: (id: number) =>
+    findInPages('/library', { sort: 'DESC' }, id),
   
   // Admin Video Operations
   createVideo: (data: any) =>
@@ -66,6 +90,14 @@ export const api = {
   createBulkVideos: (videos: any[]) =>
     fetchAPI('/library/bulk-create', { method: 'POST', body: JSON.stringify(videos) }),
 
+  // Large sheets: upload once, the server parses / validates / inserts in the background
+  startVideoImport: (formData: FormData) =>
+    fetchAPI('/library/imports', { method: 'POST', body: formData }),
+  getImportJob: (id: number) =>
+    fetchAPI(`/library/imports/${id}`),
+  getImportRejections: (id: number, cursor?: string) =>
+    fetchAPI(`/library/imports/${id}/rejected${cursor ? `?cursor=${encodeURIComponent(cursor)}` : ''}`),
+
   // Surah management
   getSurahs: () =>
     fetchAPI('/surah'),
@@ -75,11 +107,11 @@ export const api = {
     fetchAPI(`/surah/${id}`, { method: 'DELETE' }),
 
   // Ebooks
-  getEbooks: (params: any = {}) => {
-    // FastAPI uses GET /ebooks/?sort=DESC&limit=10
-    const queryString = new URLSearchParams(params).toString();
-    return fetchAPI(`/ebooks?${queryString}`, { method: 'GET' });
-  },
+  // FastAPI uses GET /ebooks?sort=DESC&limit=10&search=...&cursor=...
+  getEbooksPage: (params: any = {}, cursor?: string) =>
+    fetchPage('/ebooks', params, cursor),
+  findEbook: (id: number) =>
+    findInPages('/ebooks', { sort: 'DESC' }, id),
   createEbook: (data: any) => 
     fetchAPI('/ebooks', { method: 'POST', body: JSON.stringify(data) }),
   updateEbook: (id: number, data: any) => 
@@ -96,10 +128,9 @@ export const api = {
   // Class Registrations
   createRegistration: (data: any) =>
     fetchAPI('/class-registration', { method: 'POST', body: JSON.stringify(data) }),
-  getRegistrations: (params: any) => {
-    const queryString = new URLSearchParams(params).toString();
-    return fetchAPI(`/class-registration?${queryString}`);
-  },
+  // One page per call ({ status, language, perPage }); the admin table loads more on demand
+  getRegistrations: (params: any, cursor?: string) =>
+    fetchPage('/class-registration', params, cursor),
   updateRegistrationStatus: (id: number, status: string) =>
     fetchAPI(`/class-registration/${id}`, { method: 'PUT', body: JSON.stringify({ status }) }),
 };